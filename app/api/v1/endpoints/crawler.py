@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
-
-import httpx
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app import config
+from app.http_clients import get_http_client
 from app.logs import async_send_log
 from app.services.trends import GoogleTrendsService
+from app.task_supervisor import TASK_SUPERVISOR, TaskRejected
 
 router = APIRouter(prefix="/crawler", tags=["crawler"])
 
@@ -21,12 +20,12 @@ def get_trends_service() -> GoogleTrendsService:
 
 async def _post_trend_callback(payload: list[dict]) -> None:
     """콜백 서버(/api/trend)로 결과를 전송한다."""
-    endpoint = config.get_log_trend_endpoint()
-    timeout = config.get_log_timeout()
-    headers = config.build_internal_headers()
-    async with httpx.AsyncClient() as client:
-        response = await client.post(endpoint, json=payload, timeout=timeout, headers=headers)
-        response.raise_for_status()
+    settings = config.get_settings()
+    endpoint = settings.trend_url()
+    response = await get_http_client(endpoint).post(
+        endpoint, json=payload, timeout=settings.log_timeout, headers=settings.internal_headers
+    )
+    response.raise_for_status()
 
 
 async def _run_crawl_and_callback(
@@ -83,7 +82,16 @@ async def crawl_and_callback(
     service: GoogleTrendsService = Depends(get_trends_service),
 ):
     # 호출 즉시 OK 반환
-    asyncio.create_task(_run_crawl_and_callback(service, limit, headless))
+    try:
+        TASK_SUPERVISOR.spawn("crawler", _run_crawl_and_callback(service, limit, headless))
+    except TaskRejected as exc:
+        await async_send_log(
+            message="트렌드 크롤러 요청 거절(백그라운드 작업 한도 초과)",
+            level="WARN",
+            submessage=str(exc),
+            logged_process="crawler",
+        )
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
     await async_send_log(
         message="트렌드 크롤러 요청 수락",
         level="INFO",
@@ -1,10 +1,21 @@
 """LLM 호출 엔드포인트."""
 
+import json
+import time
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
-from app.schemas.llm import LLMChatRequest, LLMChatResponse, LlmSetting
+from app.logs import async_send_log
+from app.schemas.llm import LLMChatRequest, LLMChatResponse, LLMChatStreamRequest, LlmSetting
+from app.services.hedging import hedge_stats
 from app.services.llm import LLMService
-from app.services.text_cleaner import try_repair_json
+from app.services.llm_cache import get_default_cache
+from app.services.llm_limiter import limiter_stats
+from app.services.singleflight import LLM_SINGLE_FLIGHT
+from app.services.text_cleaner import JsonExtractor, try_repair_json
+from app.services.usage import USAGE_STATS
 
 router = APIRouter(prefix="/llm", tags=["llm"])
 
@@ -30,6 +41,77 @@ async def chat(
         model=model,
         temperature=temperature,
         api_key=api_key,
+        max_tokens=setting.maxTokens if setting else None,
     )
     cleaned = try_repair_json(answer) or answer
     return LLMChatResponse(answer=cleaned)
+
+
+@router.get("/metrics", summary="LLM 호출 지표(병합/승인 제어/헤징/캐시/토큰 사용량)")
+async def metrics() -> dict:
+    cache = get_default_cache()
+    return {
+        "single_flight": LLM_SINGLE_FLIGHT.stats(),
+        "limiter": limiter_stats(),
+        "hedging": hedge_stats(),
+        "cache": cache.stats() if cache is not None else None,
+        "usage": USAGE_STATS.snapshot(),
+    }
+
+
+@router.post("/chat/stream", summary="시스템 프롬프트 + 입력 → 답변 스트리밍(SSE)")
+async def chat_stream(
+    body: LLMChatStreamRequest,
+    service: LLMService = Depends(get_llm_service),
+) -> StreamingResponse:
+    """토큰이 도착하는 대로 `token` 이벤트를, 끝나면 전체 답변과 TTFT를 담은 `done` 이벤트를 보낸다."""
+    setting: LlmSetting | None = body.llm_setting
+    system_prompt = body.system_prompt or (setting.prompt if setting else "")
+
+    async def events() -> AsyncIterator[str]:
+        started = time.perf_counter()
+        ttft_ms: float | None = None
+        parts: list[str] = []
+        # JSON 보정은 토큰을 받는 동안 이어서 스캔해 마지막에 전체를 다시 훑지 않는다
+        extractor = JsonExtractor() if body.repair_json else None
+        try:
+            async for token in service.astream(
+                system_prompt,
+                body.user_input,
+                model=setting.modelName if setting else None,
+                temperature=setting.temperature if setting else None,
+                api_key=setting.apiKey if setting else None,
+                max_tokens=setting.maxTokens if setting else None,
+            ):
+                if ttft_ms is None:
+                    ttft_ms = (time.perf_counter() - started) * 1000
+                parts.append(token)
+                if extractor is not None:
+                    extractor.feed(token)
+                yield _sse("token", {"text": token})
+        except Exception as exc:
+            yield _sse("error", {"message": str(exc)})
+            return
+
+        total_ms = (time.perf_counter() - started) * 1000
+        answer = "".join(parts)
+        if extractor is not None:
+            answer = extractor.result() or try_repair_json(answer) or answer
+        yield _sse("done", {"answer": answer, "ttft_ms": ttft_ms, "total_ms": total_ms})
+        await async_send_log(
+            message="LLM 스트리밍 완료",
+            submessage=f"ttft_ms={ttft_ms or 0:.0f}, total_ms={total_ms:.0f}",
+            logged_process="llm",
+            user_id=setting.userId if setting else 1,
+            meta={"ttft_ms": ttft_ms, "total_ms": total_ms, "chunks": len(parts)},
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -2,7 +2,12 @@
 
 from fastapi import APIRouter, Depends
 
-from app.schemas.relevance import RelevanceRequest, RelevanceResponse
+from app.schemas.relevance import (
+    RelevanceBatchRequest,
+    RelevanceBatchResponse,
+    RelevanceRequest,
+    RelevanceResponse,
+)
 from app.services.relevance import RelevanceService
 
 router = APIRouter(prefix="/relevance", tags=["relevance"])
@@ -23,3 +28,23 @@ async def evaluate_relevance(
         llm_setting=body.llm_setting,
     )
     return RelevanceResponse(**result)
+
+
+@router.post(
+    "/ssadagu/batch",
+    response_model=RelevanceBatchResponse,
+    summary="키워드-싸다구 상품 목록 연관도 일괄 평가 (LLM 1회 호출)",
+)
+async def evaluate_relevance_batch(
+    body: RelevanceBatchRequest,
+    service: RelevanceService = Depends(get_relevance_service),
+) -> RelevanceBatchResponse:
+    results = await service.evaluate_many(
+        keyword=body.keyword,
+        products=body.products,
+        llm_setting=body.llm_setting,
+    )
+    return RelevanceBatchResponse(
+        keyword=body.keyword,
+        results=[RelevanceResponse(**r) for r in results],
+    )
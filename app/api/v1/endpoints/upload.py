@@ -1,8 +1,5 @@
 """업로드 실행 및 링크 콜백 전송 엔드포인트."""
 
-import asyncio
-
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app import config
@@ -10,6 +7,8 @@ from app.logs import async_send_log
 from app.schemas.content import ContentLinkUpdate
 from app.schemas.upload import UploadRequest
 from app.services.upload import UploadService
+from app.spool import deliver
+from app.task_supervisor import TASK_SUPERVISOR, TaskRejected
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
@@ -21,20 +20,14 @@ def get_upload_service() -> UploadService:
 async def _notify_content_link(payload: ContentLinkUpdate) -> None:
     """외부 로그/콜백 서버의 /api/content/link 로 전송."""
     try:
-        endpoint = config.get_log_content_link_endpoint()
+        endpoint = config.get_settings().content_link_url()
         url = (
             endpoint
             if endpoint.endswith("/content/link")
             else f"{endpoint}/content/link"
         )
-        headers = config.build_internal_headers()
-        async with httpx.AsyncClient() as client:
-            resp = await client.patch(
-                url,
-                json=payload.model_dump(),
-                headers=headers,
-            )
-            resp.raise_for_status()
+        # 같은 jobId의 콘텐츠 저장 콜백 뒤에 순서대로 전달된다
+        await deliver("PATCH", url, payload.model_dump(), key=payload.jobId)
     except Exception as exc:  # pragma: no cover
         await async_send_log(
             message="콘텐츠 링크 콜백 실패",
@@ -72,7 +65,19 @@ async def upload_content(
     service: UploadService = Depends(get_upload_service),
 ):
     """채널에 따라 업로드하고 외부 콜백 서버에 링크를 전달한다(비동기)."""
-    asyncio.create_task(_run_upload_and_callback(service, body))
+    try:
+        TASK_SUPERVISOR.spawn(
+            "upload", _run_upload_and_callback(service, body), name=f"upload:{body.jobId}"
+        )
+    except TaskRejected as exc:
+        await async_send_log(
+            message="업로드 요청 거절(백그라운드 작업 한도 초과)",
+            level="WARN",
+            submessage=str(exc),
+            logged_process="upload",
+            job_id=body.jobId,
+        )
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
     await async_send_log(
         message="업로드 요청 수락",
         logged_process="upload",
@@ -1,11 +1,11 @@
 """글 작성 오케스트레이션 엔드포인트 (/api/write)."""
 
-import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 
 from app.logs import async_send_log
 from app.schemas.write import WriteRequest, WriteResponse
 from app.services.write import WriteService
+from app.task_supervisor import TASK_SUPERVISOR, TaskRejected
 
 router = APIRouter(prefix="/write", tags=["write"])
 
@@ -51,5 +51,15 @@ async def write_content(
         job_id=body.jobId,
         submessage=f"generationType={body.llmChannel.generationType if body.llmChannel else ''}",
     )
-    asyncio.create_task(_run_write(service, body))
+    try:
+        TASK_SUPERVISOR.spawn("write", _run_write(service, body), name=f"write:{body.jobId}")
+    except TaskRejected as exc:
+        await async_send_log(
+            level="WARN",
+            message="write 요청 거절(백그라운드 작업 한도 초과)",
+            submessage=str(exc),
+            logged_process="write",
+            job_id=body.jobId,
+        )
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
     return Response(status_code=status.HTTP_200_OK)
@@ -0,0 +1,59 @@
+"""이벤트 루프를 막는 호출을 찾기 위한 디버그 가드.
+
+DEBUG_BLOCKING_GUARD=true이면:
+- send_log 같은 알려진 블로킹 함수가 이벤트 루프 스레드에서 불릴 때 호출 위치와 함께
+  경고를 남긴다 (report_blocking_call).
+- install_loop_monitor()가 asyncio 디버그 모드를 켜고 slow_callback_duration을
+  DEBUG_BLOCKING_THRESHOLD_MS로 맞춰, 그보다 오래 루프를 점유한 콜백/코루틴 단계를
+  asyncio 로거로 보고하게 한다.
+
+운영에서는 끄고(기본값) 개발/부하 테스트에서만 켠다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import traceback
+from collections import Counter
+from typing import Optional
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+_counts: Counter[str] = Counter()
+_lock = threading.Lock()
+
+
+def report_blocking_call(name: str) -> bool:
+    """가드가 켜져 있고 현재 스레드에서 이벤트 루프가 돌고 있으면 경고하고 True."""
+    if not config.get_debug_blocking_guard():
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    with _lock:
+        _counts[name] += 1
+    # 마지막 두 프레임(이 함수와 블로킹 함수 자신)은 제외한 호출 위치
+    where = "".join(traceback.format_stack(limit=6)[:-2])
+    logger.warning("이벤트 루프 스레드에서 블로킹 호출: %s\n%s", name, where)
+    return True
+
+
+def install_loop_monitor(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+    """가드가 켜져 있으면 루프의 느린 콜백 보고를 켠다. 켰으면 True."""
+    if not config.get_debug_blocking_guard():
+        return False
+    loop = loop or asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = config.get_debug_blocking_threshold_ms() / 1000
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    return True
+
+
+def blocking_call_stats() -> dict[str, int]:
+    with _lock:
+        return dict(_counts)
@@ -2,12 +2,19 @@
 
 .env가 존재하면 자동으로 로드하며, 각 설정은 전용 getter를 통해 조회한다.
 새 환경 변수가 필요하면 이 파일에 추가한다.
+
+로그/콜백처럼 호출마다 읽는 설정은 get_settings()의 불변 스냅샷(Settings)으로 읽는다.
+스냅샷은 처음 쓸 때(앱 시작 시 lifespan) 한 번 파싱/검증되고, 파생 URL과 내부 헤더도
+그때 계산해 둔다. 환경 변수를 바꾼 뒤에는 reload_settings()로 명시적으로 다시 읽는다.
 """
 
 from __future__ import annotations
 
 import os
-from typing import List, Optional
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from urllib.parse import urlparse, urlunparse
 
 from dotenv import load_dotenv
@@ -21,6 +28,28 @@ LOG_SOURCE_KEY = "LOG_SOURCE"
 LOG_TIMEOUT_KEY = "LOG_TIMEOUT"
 LOG_TREND_ENDPOINT_KEY = "LOG_TREND_ENDPOINT"
 LOG_CONTENT_LINK_ENDPOINT_KEY = "LOG_CONTENT_LINK_ENDPOINT"
+LOG_ASYNC_SHIPPING_KEY = "LOG_ASYNC_SHIPPING"
+LOG_REMOTE_LEVEL_KEY = "LOG_REMOTE_LEVEL"
+LOG_REMOTE_LEVELS_KEY = "LOG_REMOTE_LEVELS"
+LOG_SAMPLE_BURST_KEY = "LOG_SAMPLE_BURST"
+LOG_SAMPLE_WINDOW_KEY = "LOG_SAMPLE_WINDOW"
+LOG_QUEUE_SIZE_KEY = "LOG_QUEUE_SIZE"
+LOG_BATCH_SIZE_KEY = "LOG_BATCH_SIZE"
+LOG_FLUSH_INTERVAL_KEY = "LOG_FLUSH_INTERVAL"
+LOG_BATCH_ENDPOINT_KEY = "LOG_BATCH_ENDPOINT"
+HTTP2_ENABLED_KEY = "HTTP2_ENABLED"
+DEBUG_BLOCKING_GUARD_KEY = "DEBUG_BLOCKING_GUARD"
+OUTBOUND_SPOOL_ENABLED_KEY = "OUTBOUND_SPOOL_ENABLED"
+OUTBOUND_SPOOL_PATH_KEY = "OUTBOUND_SPOOL_PATH"
+OUTBOUND_SPOOL_MAX_BYTES_KEY = "OUTBOUND_SPOOL_MAX_BYTES"
+DEBUG_BLOCKING_THRESHOLD_MS_KEY = "DEBUG_BLOCKING_THRESHOLD_MS"
+HTTP_MAX_CONNECTIONS_PER_HOST_KEY = "HTTP_MAX_CONNECTIONS_PER_HOST"
+HTTP_KEEPALIVE_EXPIRY_KEY = "HTTP_KEEPALIVE_EXPIRY"
+HTTP_CONNECT_TIMEOUT_KEY = "HTTP_CONNECT_TIMEOUT"
+BACKGROUND_TASK_LIMIT_KEY = "BACKGROUND_TASK_LIMIT"
+BACKGROUND_TASK_LIMITS_KEY = "BACKGROUND_TASK_LIMITS"
+BACKGROUND_TASK_MAX_PENDING_KEY = "BACKGROUND_TASK_MAX_PENDING"
+BACKGROUND_TASK_SHUTDOWN_TIMEOUT_KEY = "BACKGROUND_TASK_SHUTDOWN_TIMEOUT"
 OPENAI_API_KEY_KEY = "OPENAI_API_KEY"
 X_CONSUMER_KEY = "X_CONSUMER_KEY"
 X_CONSUMER_SECRET = "X_CONSUMER_SECRET"
@@ -31,6 +60,32 @@ NAVER_LOGIN_PW_KEY = "NAVER_LOGIN_PW"
 NAVER_BLOG_ID_KEY = "NAVER_BLOG_ID"
 X_INTERNAL_TOKEN_KEY = "X_INTERNAL_TOKEN"
 INTERNAL_TOKEN_HEADER = "X-Internal-Token"
+LLM_CACHE_ENABLED_KEY = "LLM_CACHE_ENABLED"
+LLM_CACHE_TTL_KEY = "LLM_CACHE_TTL"
+LLM_CACHE_MAX_ENTRIES_KEY = "LLM_CACHE_MAX_ENTRIES"
+LLM_CACHE_PATH_KEY = "LLM_CACHE_PATH"
+WRITE_SELECTION_MODE_KEY = "WRITE_SELECTION_MODE"
+WRITE_PRERANK_ENABLED_KEY = "WRITE_PRERANK_ENABLED"
+WRITE_FUSED_GENERATION_KEY = "WRITE_FUSED_GENERATION"
+WRITE_SPECULATIVE_GENERATION_KEY = "WRITE_SPECULATIVE_GENERATION"
+WRITE_DEFER_MANUAL_KEY = "WRITE_DEFER_MANUAL"
+WRITE_DEFERRED_WORKERS_KEY = "WRITE_DEFERRED_WORKERS"
+WRITE_DEFERRED_QUEUE_SIZE_KEY = "WRITE_DEFERRED_QUEUE_SIZE"
+CATEGORY_LOCAL_THRESHOLD_KEY = "CATEGORY_LOCAL_THRESHOLD"
+CATEGORY_SHADOW_RATE_KEY = "CATEGORY_SHADOW_RATE"
+LLM_MAX_CONCURRENCY_KEY = "LLM_MAX_CONCURRENCY"
+LLM_BACKEND_KEY = "LLM_BACKEND"
+LLM_FAKE_LATENCY_MS_KEY = "LLM_FAKE_LATENCY_MS"
+LLM_FAKE_LATENCY_SIGMA_KEY = "LLM_FAKE_LATENCY_SIGMA"
+LLM_FAKE_ERROR_RATE_KEY = "LLM_FAKE_ERROR_RATE"
+LLM_FAKE_RATE_LIMIT_RATE_KEY = "LLM_FAKE_RATE_LIMIT_RATE"
+LLM_FAKE_SEED_KEY = "LLM_FAKE_SEED"
+PRODUCT_SPEC_TOKEN_BUDGET_KEY = "PRODUCT_SPEC_TOKEN_BUDGET"
+LLM_TPM_LIMIT_KEY = "LLM_TPM_LIMIT"
+LLM_LOW_PRIORITY_SHARE_KEY = "LLM_LOW_PRIORITY_SHARE"
+LLM_HEDGE_ENABLED_KEY = "LLM_HEDGE_ENABLED"
+LLM_HEDGE_MAX_RATE_KEY = "LLM_HEDGE_MAX_RATE"
+LLM_RATE_LIMIT_RETRIES_KEY = "LLM_RATE_LIMIT_RETRIES"
 
 
 def _get_required_str(name: str) -> str:
@@ -67,6 +122,13 @@ def _get_int_env(name: str, default: int) -> int:
         raise ValueError(f"{name} 환경 변수는 정수여야 합니다.") from exc
 
 
+def _get_bool_env(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _get_list_env(name: str) -> List[str]:
     raw = os.getenv(name, "")
     return [item.strip() for item in raw.split(",") if item.strip()]
@@ -91,6 +153,168 @@ def get_log_timeout(override: Optional[float] = None) -> float:
     return _get_float_env(LOG_TIMEOUT_KEY, 5.0)
 
 
+def get_log_remote_level(override: Optional[str] = None) -> str:
+    """원격으로 보낼 최소 로그 레벨 (DEBUG/INFO/WARN/ERROR, 기본 INFO)."""
+    return (override or os.getenv(LOG_REMOTE_LEVEL_KEY, "INFO")).strip().upper()
+
+
+def get_log_remote_levels(override: Optional[str] = None) -> dict[str, str]:
+    """logged_process별 최소 레벨. 예: "naver_blog=WARN,relevance=INFO"."""
+    raw = override if override is not None else os.getenv(LOG_REMOTE_LEVELS_KEY, "")
+    levels: dict[str, str] = {}
+    for item in raw.split(","):
+        process, sep, level = item.partition("=")
+        if sep and process.strip() and level.strip():
+            levels[process.strip()] = level.strip().upper()
+    return levels
+
+
+def get_log_sample_burst(override: Optional[int] = None) -> int:
+    """같은 메시지를 창마다 원격 전송할 최대 횟수. 0이면 샘플링 안 함 (기본 20)."""
+    if override is not None:
+        return override
+    return _get_int_env(LOG_SAMPLE_BURST_KEY, 20)
+
+
+def get_log_sample_window(override: Optional[float] = None) -> float:
+    """샘플링 창 길이(초) (기본 60)."""
+    if override is not None:
+        return override
+    return _get_float_env(LOG_SAMPLE_WINDOW_KEY, 60.0)
+
+
+def get_log_async_shipping(override: Optional[bool] = None) -> bool:
+    """async_send_log을 백그라운드 배치 전송기로 보낼지 여부 (기본 True)."""
+    if override is not None:
+        return override
+    return _get_bool_env(LOG_ASYNC_SHIPPING_KEY, True)
+
+
+def get_log_queue_size(override: Optional[int] = None) -> int:
+    """전송 대기 로그 최대 개수. 넘치면 새 로그를 버린다 (기본 10000)."""
+    if override is not None:
+        return override
+    return _get_int_env(LOG_QUEUE_SIZE_KEY, 10000)
+
+
+def get_log_batch_size(override: Optional[int] = None) -> int:
+    """한 번에 전송할 최대 로그 수 (기본 50)."""
+    if override is not None:
+        return override
+    return _get_int_env(LOG_BATCH_SIZE_KEY, 50)
+
+
+def get_log_flush_interval(override: Optional[float] = None) -> float:
+    """배치가 차지 않아도 전송하는 주기(초) (기본 1.0)."""
+    if override is not None:
+        return override
+    return _get_float_env(LOG_FLUSH_INTERVAL_KEY, 1.0)
+
+
+def get_log_batch_endpoint(override: Optional[str] = None) -> str:
+    """로그 배열을 한 번에 받는 엔드포인트. 미설정이면 빈 문자열(한 줄씩 전송)."""
+    return (override or os.getenv(LOG_BATCH_ENDPOINT_KEY, "")).rstrip("/")
+
+
+def get_outbound_spool_enabled(override: Optional[bool] = None) -> bool:
+    """콜백/실패 로그를 스풀에 기록하고 백그라운드에서 재전송할지 여부 (기본 True)."""
+    if override is not None:
+        return override
+    return _get_bool_env(OUTBOUND_SPOOL_ENABLED_KEY, True)
+
+
+def get_outbound_spool_path(override: Optional[str] = None) -> Optional[str]:
+    """전송 스풀 파일 경로 (선택). 미설정 시 메모리에서만 재시도."""
+    if override:
+        return override
+    return _get_optional_str(OUTBOUND_SPOOL_PATH_KEY)
+
+
+def get_outbound_spool_max_bytes(override: Optional[int] = None) -> int:
+    """미전송 항목 최대 용량(바이트). 넘으면 오래된 로그부터 버린다 (기본 50MB)."""
+    if override is not None:
+        return override
+    return _get_int_env(OUTBOUND_SPOOL_MAX_BYTES_KEY, 50 * 1024 * 1024)
+
+
+def get_debug_blocking_guard(override: Optional[bool] = None) -> bool:
+    """이벤트 루프 블로킹 호출 디버그 가드 사용 여부 (기본 False)."""
+    if override is not None:
+        return override
+    return _get_bool_env(DEBUG_BLOCKING_GUARD_KEY, False)
+
+
+def get_debug_blocking_threshold_ms(override: Optional[float] = None) -> float:
+    """가드가 보고할 루프 점유 시간 기준(ms) (기본 100)."""
+    if override is not None:
+        return override
+    return _get_float_env(DEBUG_BLOCKING_THRESHOLD_MS_KEY, 100.0)
+
+
+def get_http2_enabled(override: Optional[bool] = None) -> bool:
+    """내부 콜백 클라이언트에서 HTTP/2 사용 여부 (h2 패키지가 있을 때만 적용, 기본 True)."""
+    if override is not None:
+        return override
+    return _get_bool_env(HTTP2_ENABLED_KEY, True)
+
+
+def get_http_max_connections_per_host(override: Optional[int] = None) -> int:
+    """내부 콜백 대상 호스트별 최대 동시 연결 수 (기본 20)."""
+    if override is not None:
+        return override
+    return _get_int_env(HTTP_MAX_CONNECTIONS_PER_HOST_KEY, 20)
+
+
+def get_http_keepalive_expiry(override: Optional[float] = None) -> float:
+    """유휴 keep-alive 연결 유지 시간(초) (기본 30)."""
+    if override is not None:
+        return override
+    return _get_float_env(HTTP_KEEPALIVE_EXPIRY_KEY, 30.0)
+
+
+def get_http_connect_timeout(override: Optional[float] = None) -> float:
+    """내부 콜백 연결 타임아웃(초) (기본 3.0). 나머지 타임아웃은 LOG_TIMEOUT."""
+    if override is not None:
+        return override
+    return _get_float_env(HTTP_CONNECT_TIMEOUT_KEY, 3.0)
+
+
+def get_background_task_limit(override: Optional[int] = None) -> int:
+    """백그라운드 작업 분류별 기본 동시 실행 수 (기본 8)."""
+    if override is not None:
+        return override
+    return _get_int_env(BACKGROUND_TASK_LIMIT_KEY, 8)
+
+
+def get_background_task_limits(override: Optional[str] = None) -> dict[str, int]:
+    """분류별 동시 실행 수. 예: "write=4,upload=2,crawler=1"."""
+    raw = override if override is not None else os.getenv(BACKGROUND_TASK_LIMITS_KEY, "")
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        category, sep, limit = item.partition("=")
+        if not sep or not category.strip():
+            continue
+        try:
+            limits[category.strip()] = int(limit)
+        except ValueError as exc:
+            raise ValueError(f"{BACKGROUND_TASK_LIMITS_KEY} 값이 잘못되었습니다: {item}") from exc
+    return limits
+
+
+def get_background_task_max_pending(override: Optional[int] = None) -> int:
+    """분류별 실행+대기 작업 최대 수. 넘으면 새 작업을 거절한다. 0 이하면 무제한 (기본 200)."""
+    if override is not None:
+        return override
+    return _get_int_env(BACKGROUND_TASK_MAX_PENDING_KEY, 200)
+
+
+def get_background_task_shutdown_timeout(override: Optional[float] = None) -> float:
+    """종료 시 백그라운드 작업 완료를 기다릴 최대 시간(초). 넘으면 취소한다 (기본 30)."""
+    if override is not None:
+        return override
+    return _get_float_env(BACKGROUND_TASK_SHUTDOWN_TIMEOUT_KEY, 30.0)
+
+
 def get_log_trend_endpoint(override: Optional[str] = None) -> str:
     """
     트렌드 콜백 전송 엔드포인트.
@@ -150,6 +374,196 @@ def get_openai_api_key(override: Optional[str] = None) -> str:
     return override or _get_required_str(OPENAI_API_KEY_KEY)
 
 
+# ---- LLM 응답 캐시 설정 ----
+def get_llm_cache_enabled(override: Optional[bool] = None) -> bool:
+    """LLM 응답 캐시 사용 여부 (기본 False, opt-in)."""
+    if override is not None:
+        return override
+    return _get_bool_env(LLM_CACHE_ENABLED_KEY, False)
+
+
+def get_llm_cache_ttl(override: Optional[float] = None) -> float:
+    """캐시 항목 유효 시간(초). 0 이하면 만료 없음."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_CACHE_TTL_KEY, 3600.0)
+
+
+def get_llm_cache_max_entries(override: Optional[int] = None) -> int:
+    """캐시 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목부터 제거."""
+    if override is not None:
+        return override
+    return _get_int_env(LLM_CACHE_MAX_ENTRIES_KEY, 1000)
+
+
+def get_llm_cache_path(override: Optional[str] = None) -> Optional[str]:
+    """SQLite 캐시 파일 경로 (선택). 미설정 시 메모리 캐시 사용."""
+    if override:
+        return override
+    return _get_optional_str(LLM_CACHE_PATH_KEY)
+
+
+# ---- LLM 백엔드 (오프라인 가짜 백엔드) ----
+def get_llm_backend(override: Optional[str] = None) -> str:
+    """LLM 백엔드. openai(기본) 또는 fake(오프라인 벤치마크/테스트용 결정적 응답)."""
+    value = override or os.getenv(LLM_BACKEND_KEY, "openai")
+    return value.strip().lower() or "openai"
+
+
+def get_llm_fake_latency_ms(override: Optional[float] = None) -> float:
+    """가짜 백엔드 응답 지연 중앙값(ms)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_FAKE_LATENCY_MS_KEY, 800.0)
+
+
+def get_llm_fake_latency_sigma(override: Optional[float] = None) -> float:
+    """가짜 백엔드 지연 로그정규 분포 sigma (0이면 고정 지연)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_FAKE_LATENCY_SIGMA_KEY, 0.5)
+
+
+def get_llm_fake_error_rate(override: Optional[float] = None) -> float:
+    """가짜 백엔드 5xx 오류 주입 비율 (0.0~1.0)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_FAKE_ERROR_RATE_KEY, 0.0)
+
+
+def get_llm_fake_rate_limit_rate(override: Optional[float] = None) -> float:
+    """가짜 백엔드 429 주입 비율 (0.0~1.0)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_FAKE_RATE_LIMIT_RATE_KEY, 0.0)
+
+
+def get_llm_fake_seed(override: Optional[int] = None) -> int:
+    """가짜 백엔드 난수 seed (같은 seed면 같은 결과)."""
+    if override is not None:
+        return override
+    return _get_int_env(LLM_FAKE_SEED_KEY, 0)
+
+
+# ---- LLM 호출 제어(동시성/속도 제한) ----
+def get_llm_max_concurrency(override: Optional[int] = None) -> int:
+    """모델+API Key별 최대 동시 LLM 호출 수 (기본 16). 429 발생 시 자동으로 줄었다가 회복된다."""
+    if override is not None:
+        return override
+    return _get_int_env(LLM_MAX_CONCURRENCY_KEY, 16)
+
+
+def get_llm_tpm_limit(override: Optional[int] = None) -> int:
+    """모델+API Key별 분당 토큰 예산. 0 이하면 제한 없음 (기본 0)."""
+    if override is not None:
+        return override
+    return _get_int_env(LLM_TPM_LIMIT_KEY, 0)
+
+
+def get_llm_low_priority_share(override: Optional[float] = None) -> float:
+    """낮은 우선순위(MANUAL 지연 생성) 호출이 쓸 수 있는 동시성 상한 비율 (기본 0.5)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_LOW_PRIORITY_SHARE_KEY, 0.5)
+
+
+def get_llm_rate_limit_retries(override: Optional[int] = None) -> int:
+    """429 응답 시 Retry-After를 지켜 재시도할 최대 횟수 (기본 3)."""
+    if override is not None:
+        return override
+    return _get_int_env(LLM_RATE_LIMIT_RETRIES_KEY, 3)
+
+
+def get_llm_hedge_enabled(override: Optional[bool] = None) -> bool:
+    """짧은 멱등 호출(연관도/카테고리)에 요청 헤징 사용 여부 (기본 False)."""
+    if override is not None:
+        return override
+    return _get_bool_env(LLM_HEDGE_ENABLED_KEY, False)
+
+
+def get_llm_hedge_max_rate(override: Optional[float] = None) -> float:
+    """최근 호출 중 헤지(중복 요청)를 보낼 수 있는 최대 비율 (기본 0.1)."""
+    if override is not None:
+        return override
+    return _get_float_env(LLM_HEDGE_MAX_RATE_KEY, 0.1)
+
+
+# ---- 글 작성 파이프라인 설정 ----
+def get_write_selection_mode(override: Optional[str] = None) -> str:
+    """상품 선택 모드. single(1개씩 평가, 기본), batch(목록 일괄 평가), concurrent(후보 동시 평가)."""
+    value = override or os.getenv(WRITE_SELECTION_MODE_KEY, "single")
+    return value.strip().lower() or "single"
+
+
+def get_write_prerank_enabled(override: Optional[bool] = None) -> bool:
+    """LLM 연관도 평가 전 로컬 어휘 순위화 사용 여부 (기본 True)."""
+    if override is not None:
+        return override
+    return _get_bool_env(WRITE_PRERANK_ENABLED_KEY, True)
+
+
+def get_write_fused_generation(override: Optional[bool] = None) -> bool:
+    """홍보글과 카테고리를 한 번의 LLM 호출로 생성할지 여부 (기본 True)."""
+    if override is not None:
+        return override
+    return _get_bool_env(WRITE_FUSED_GENERATION_KEY, True)
+
+
+def get_write_speculative_generation(override: Optional[bool] = None) -> bool:
+    """연관도 평가와 동시에 후보 상품의 홍보글을 미리 생성할지 여부 (기본 False).
+
+    통과하면 초안을 그대로 쓰고, 탈락하면 버린다(버린 토큰은 사용량에 별도 집계).
+    """
+    if override is not None:
+        return override
+    return _get_bool_env(WRITE_SPECULATIVE_GENERATION_KEY, False)
+
+
+def get_product_spec_token_budget(override: Optional[int] = None) -> int:
+    """프롬프트에 넣을 상품 스펙 목록의 토큰 예산 (기본 300). 0 이하면 전체 포함."""
+    if override is not None:
+        return override
+    return _get_int_env(PRODUCT_SPEC_TOKEN_BUDGET_KEY, 300)
+
+
+def get_write_defer_manual(override: Optional[bool] = None) -> bool:
+    """MANUAL 작업의 홍보글/카테고리 생성을 지연 큐(낮은 우선순위)로 보낼지 여부 (기본 False).
+
+    지연 큐는 메모리에만 있어 재시작 시 남은 작업이 유실되므로 명시적으로 켤 때만 쓴다.
+    """
+    if override is not None:
+        return override
+    return _get_bool_env(WRITE_DEFER_MANUAL_KEY, False)
+
+
+def get_write_deferred_workers(override: Optional[int] = None) -> int:
+    """지연 생성 큐 동시 처리 작업 수 (기본 2)."""
+    if override is not None:
+        return override
+    return _get_int_env(WRITE_DEFERRED_WORKERS_KEY, 2)
+
+
+def get_write_deferred_queue_size(override: Optional[int] = None) -> int:
+    """지연 생성 큐 최대 대기 작업 수. 가득 차면 바로 생성한다 (기본 100)."""
+    if override is not None:
+        return override
+    return _get_int_env(WRITE_DEFERRED_QUEUE_SIZE_KEY, 100)
+
+
+def get_category_local_threshold(override: Optional[float] = None) -> float:
+    """로컬 카테고리 분류 결과를 그대로 쓰는 최소 신뢰도. 1 초과로 두면 항상 LLM 사용."""
+    if override is not None:
+        return override
+    return _get_float_env(CATEGORY_LOCAL_THRESHOLD_KEY, 0.5)
+
+
+def get_category_shadow_rate(override: Optional[float] = None) -> float:
+    """확신 구간에서도 LLM 라벨과 비교해 정확도를 측정할 비율(0.0~1.0)."""
+    if override is not None:
+        return override
+    return _get_float_env(CATEGORY_SHADOW_RATE_KEY, 0.05)
+
+
 # ---- X(OAuth1) 설정 ----
 def get_x_consumer_key(override: Optional[str] = None) -> str:
     return override or _get_required_str(X_CONSUMER_KEY)
@@ -206,12 +620,176 @@ def build_internal_headers(base: Optional[dict[str, str]] = None, *, token: Opti
     return headers
 
 
+# ---- 설정 스냅샷 ----
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _require(value: Optional[str], name: str) -> str:
+    if value is None:
+        raise ValueError(f"{name} 환경 변수가 필요합니다.")
+    return value
+
+
+@dataclass(frozen=True)
+class Settings:
+    """호출마다 쓰는 로그/콜백 설정의 불변 스냅샷.
+
+    from_env()에서 한 번 파싱/검증하고 LOG_ENDPOINT에서 파생되는 URL과 내부 헤더를
+    미리 계산한다. 테스트에서는 직접 만들어 서비스에 주입하거나 use_settings()로 바꾼다.
+    LOG_ENDPOINT가 없으면 관련 값은 None이고, 필요한 곳에서 ValueError를 올린다.
+    """
+
+    log_endpoint: Optional[str] = None
+    log_source: str = "final-py"
+    log_timeout: float = 5.0
+    log_async_shipping: bool = True
+    log_batch_endpoint: str = ""
+    log_remote_level: str = "INFO"
+    log_remote_levels: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    log_sample_burst: int = 20
+    log_sample_window: float = 60.0
+    outbound_spool_enabled: bool = True
+    outbound_spool_path: Optional[str] = None
+    outbound_spool_max_bytes: int = 50 * 1024 * 1024
+    trend_endpoint: Optional[str] = None
+    content_link_endpoint: Optional[str] = None
+    internal_headers: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    # LOG_ENDPOINT의 scheme://host (콘텐츠 저장/리다이렉트 링크의 기준)
+    callback_origin: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """현재 환경 변수로 스냅샷을 만든다. 형식이 잘못된 값은 ValueError."""
+        log_endpoint = _get_optional_str(LOG_ENDPOINT_KEY)
+        if log_endpoint is not None:
+            log_endpoint = log_endpoint.rstrip("/")
+            parsed = urlparse(log_endpoint)
+            if not parsed.scheme or not parsed.netloc:
+                raise ValueError(f"{LOG_ENDPOINT_KEY} 환경 변수는 절대 URL이어야 합니다: {log_endpoint}")
+        # 파생 엔드포인트는 명시 값이나 LOG_ENDPOINT가 있을 때만 계산한다
+        trend = (
+            get_log_trend_endpoint()
+            if log_endpoint or os.getenv(LOG_TREND_ENDPOINT_KEY)
+            else None
+        )
+        content_link = (
+            get_log_content_link_endpoint()
+            if log_endpoint or os.getenv(LOG_CONTENT_LINK_ENDPOINT_KEY)
+            else None
+        )
+        return cls(
+            log_endpoint=log_endpoint,
+            log_source=get_log_source(),
+            log_timeout=get_log_timeout(),
+            log_async_shipping=get_log_async_shipping(),
+            log_batch_endpoint=get_log_batch_endpoint(),
+            log_remote_level=get_log_remote_level(),
+            log_remote_levels=MappingProxyType(get_log_remote_levels()),
+            log_sample_burst=get_log_sample_burst(),
+            log_sample_window=get_log_sample_window(),
+            outbound_spool_enabled=get_outbound_spool_enabled(),
+            outbound_spool_path=get_outbound_spool_path(),
+            outbound_spool_max_bytes=get_outbound_spool_max_bytes(),
+            trend_endpoint=trend,
+            content_link_endpoint=content_link,
+            internal_headers=MappingProxyType(build_internal_headers()),
+            callback_origin=_origin(log_endpoint) if log_endpoint else None,
+        )
+
+    def require_log_endpoint(self) -> str:
+        return _require(self.log_endpoint, LOG_ENDPOINT_KEY)
+
+    def content_url(self) -> str:
+        """콘텐츠 저장 콜백 URL ({origin}/api/content)."""
+        return f"{_require(self.callback_origin, LOG_ENDPOINT_KEY)}/api/content"
+
+    def redirect_url(self, job_id: str) -> str:
+        """본문에 넣는 상품 리다이렉트 링크 ({origin}/api/link?jobId=...)."""
+        return f"{_require(self.callback_origin, LOG_ENDPOINT_KEY)}/api/link?jobId={job_id}"
+
+    def trend_url(self) -> str:
+        return _require(self.trend_endpoint, LOG_ENDPOINT_KEY)
+
+    def content_link_url(self) -> str:
+        return _require(self.content_link_endpoint, LOG_ENDPOINT_KEY)
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """현재 설정 스냅샷. 처음 호출될 때 환경 변수를 읽어 만든다."""
+    settings = _settings
+    if settings is None:
+        with _settings_lock:
+            settings = _settings
+            if settings is None:
+                settings = Settings.from_env()
+                _set_settings(settings)
+    return settings
+
+
+def reload_settings(*, dotenv: bool = False) -> Settings:
+    """환경 변수를 다시 읽어 스냅샷을 교체한다 (명시적 핫 리로드).
+
+    dotenv=True면 .env를 다시 읽어 기존 환경 변수 값도 덮어쓴다. 검증에 실패하면
+    ValueError를 올리고 기존 스냅샷을 유지한다.
+    """
+    if dotenv:
+        load_dotenv(override=True)
+    settings = Settings.from_env()
+    with _settings_lock:
+        _set_settings(settings)
+    return settings
+
+
+def use_settings(settings: Optional[Settings]) -> Optional[Settings]:
+    """주어진 스냅샷으로 교체하고 이전 스냅샷을 반환한다 (테스트/주입용).
+
+    None을 주면 비워서 다음 get_settings()가 환경 변수를 다시 읽게 한다.
+    """
+    with _settings_lock:
+        previous = _settings
+        _set_settings(settings)
+    return previous
+
+
+def _set_settings(settings: Optional[Settings]) -> None:
+    global _settings
+    _settings = settings
+
+
 __all__ = [
     "LOG_ENDPOINT_KEY",
     "LOG_SOURCE_KEY",
     "LOG_TIMEOUT_KEY",
     "LOG_TREND_ENDPOINT_KEY",
     "LOG_CONTENT_LINK_ENDPOINT_KEY",
+    "LOG_ASYNC_SHIPPING_KEY",
+    "LOG_REMOTE_LEVEL_KEY",
+    "LOG_REMOTE_LEVELS_KEY",
+    "LOG_SAMPLE_BURST_KEY",
+    "LOG_SAMPLE_WINDOW_KEY",
+    "LOG_QUEUE_SIZE_KEY",
+    "LOG_BATCH_SIZE_KEY",
+    "LOG_FLUSH_INTERVAL_KEY",
+    "LOG_BATCH_ENDPOINT_KEY",
+    "HTTP2_ENABLED_KEY",
+    "DEBUG_BLOCKING_GUARD_KEY",
+    "OUTBOUND_SPOOL_ENABLED_KEY",
+    "OUTBOUND_SPOOL_PATH_KEY",
+    "OUTBOUND_SPOOL_MAX_BYTES_KEY",
+    "DEBUG_BLOCKING_THRESHOLD_MS_KEY",
+    "HTTP_MAX_CONNECTIONS_PER_HOST_KEY",
+    "HTTP_KEEPALIVE_EXPIRY_KEY",
+    "HTTP_CONNECT_TIMEOUT_KEY",
+    "BACKGROUND_TASK_LIMIT_KEY",
+    "BACKGROUND_TASK_LIMITS_KEY",
+    "BACKGROUND_TASK_MAX_PENDING_KEY",
+    "BACKGROUND_TASK_SHUTDOWN_TIMEOUT_KEY",
     "OPENAI_API_KEY_KEY",
     "X_CONSUMER_KEY",
     "X_CONSUMER_SECRET",
@@ -222,12 +800,86 @@ __all__ = [
     "NAVER_BLOG_ID_KEY",
     "X_INTERNAL_TOKEN_KEY",
     "INTERNAL_TOKEN_HEADER",
+    "LLM_CACHE_ENABLED_KEY",
+    "LLM_CACHE_TTL_KEY",
+    "LLM_CACHE_MAX_ENTRIES_KEY",
+    "LLM_CACHE_PATH_KEY",
+    "WRITE_SELECTION_MODE_KEY",
+    "WRITE_PRERANK_ENABLED_KEY",
+    "WRITE_FUSED_GENERATION_KEY",
+    "WRITE_SPECULATIVE_GENERATION_KEY",
+    "WRITE_DEFER_MANUAL_KEY",
+    "WRITE_DEFERRED_WORKERS_KEY",
+    "WRITE_DEFERRED_QUEUE_SIZE_KEY",
+    "CATEGORY_LOCAL_THRESHOLD_KEY",
+    "CATEGORY_SHADOW_RATE_KEY",
+    "LLM_MAX_CONCURRENCY_KEY",
+    "LLM_BACKEND_KEY",
+    "LLM_FAKE_LATENCY_MS_KEY",
+    "LLM_FAKE_LATENCY_SIGMA_KEY",
+    "LLM_FAKE_ERROR_RATE_KEY",
+    "LLM_FAKE_RATE_LIMIT_RATE_KEY",
+    "LLM_FAKE_SEED_KEY",
+    "PRODUCT_SPEC_TOKEN_BUDGET_KEY",
+    "LLM_TPM_LIMIT_KEY",
+    "LLM_LOW_PRIORITY_SHARE_KEY",
+    "LLM_HEDGE_ENABLED_KEY",
+    "LLM_HEDGE_MAX_RATE_KEY",
+    "LLM_RATE_LIMIT_RETRIES_KEY",
     "get_log_endpoint",
     "get_log_source",
     "get_log_timeout",
+    "get_log_remote_level",
+    "get_log_remote_levels",
+    "get_log_sample_burst",
+    "get_log_sample_window",
+    "get_log_async_shipping",
+    "get_log_queue_size",
+    "get_log_batch_size",
+    "get_log_flush_interval",
+    "get_log_batch_endpoint",
+    "get_outbound_spool_enabled",
+    "get_outbound_spool_path",
+    "get_outbound_spool_max_bytes",
+    "get_debug_blocking_guard",
+    "get_debug_blocking_threshold_ms",
+    "get_http2_enabled",
+    "get_http_max_connections_per_host",
+    "get_http_keepalive_expiry",
+    "get_http_connect_timeout",
+    "get_background_task_limit",
+    "get_background_task_limits",
+    "get_background_task_max_pending",
+    "get_background_task_shutdown_timeout",
     "get_log_trend_endpoint",
     "get_log_content_link_endpoint",
     "get_openai_api_key",
+    "get_llm_cache_enabled",
+    "get_llm_cache_ttl",
+    "get_llm_cache_max_entries",
+    "get_llm_cache_path",
+    "get_llm_backend",
+    "get_llm_fake_latency_ms",
+    "get_llm_fake_latency_sigma",
+    "get_llm_fake_error_rate",
+    "get_llm_fake_rate_limit_rate",
+    "get_llm_fake_seed",
+    "get_llm_max_concurrency",
+    "get_llm_tpm_limit",
+    "get_llm_low_priority_share",
+    "get_llm_rate_limit_retries",
+    "get_llm_hedge_enabled",
+    "get_llm_hedge_max_rate",
+    "get_write_selection_mode",
+    "get_write_prerank_enabled",
+    "get_write_fused_generation",
+    "get_write_speculative_generation",
+    "get_write_defer_manual",
+    "get_write_deferred_workers",
+    "get_write_deferred_queue_size",
+    "get_product_spec_token_budget",
+    "get_category_local_threshold",
+    "get_category_shadow_rate",
     "get_x_consumer_key",
     "get_x_consumer_secret",
     "get_x_access_token",
@@ -237,4 +889,8 @@ __all__ = [
     "get_naver_blog_id",
     "get_internal_token",
     "build_internal_headers",
+    "Settings",
+    "get_settings",
+    "reload_settings",
+    "use_settings",
 ]
@@ -1,12 +1,18 @@
-"""LangGraph 기반 글 작성 오케스트레이션 그래프."""
+"""LangGraph 기반 글 작성 오케스트레이션 그래프.
+
+그래프 구조는 요청마다 같으므로 (max_retries, relevance_threshold) 조합별로 한 번만
+컴파일해 재사용한다(get_write_graph). 요청별 서비스(WriteService)는 노드가 클로저로
+잡지 않고 실행 시 config["configurable"]["services"]로 받는다. 시도한 상품 링크와
+투기적 초안(asyncio.Task)처럼 직렬화할 수 없는 실행 중 상태도 그래프 상태가 아니라
+config["configurable"]["run"](WriteRun)에 둔다. run_config()로 둘을 함께 만든다.
+"""
 
 from __future__ import annotations
 
-import random
-from typing import Any, Dict, Optional
-from urllib.parse import urlparse
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict
 
-import httpx
 try:
     from langsmith import traceable
 except ImportError:  # pragma: no cover - optional
@@ -15,20 +21,29 @@ except ImportError:  # pragma: no cover - optional
             return fn
         return decorator
 
-from app import config
 from app.logs import async_send_log
 from app.schemas.products import SsadaguProduct
+from app.services.usage import usage_meta
+from app.services.write import SpeculativeDraft, _build_redirect_url, _post_content
 
-# LangGraph는 선택적 의존성. 설치되지 않았으면 ImportError를 던진다.
+# LangGraph는 선택적 의존성. 임포트는 모듈 로드 때 한 번만 시도하고 결과를 기억한다.
 try:
+    from langchain_core.runnables import RunnableConfig
     from langgraph.graph import END, StateGraph
 except ImportError as exc:  # pragma: no cover - 설치 안 된 경우
     StateGraph = None  # type: ignore
     END = None  # type: ignore
+    RunnableConfig = dict  # type: ignore
     _import_error = exc
 else:
     _import_error = None
 
+GRAPH_AVAILABLE = _import_error is None
+
+# (max_retries, relevance_threshold) -> 컴파일된 그래프
+_compiled: dict[tuple[int, float], Any] = {}
+_compiled_lock = threading.Lock()
+
 
 def _sub_with_keyword(keyword: str | None, sub: str = "") -> str:
     parts = []
@@ -40,41 +55,91 @@ def _sub_with_keyword(keyword: str | None, sub: str = "") -> str:
     return " | ".join(parts)
 
 
-def build_write_graph(
-    services, *, max_retries: int = 5, relevance_threshold: float = 0.7
+@traceable(run_type="tool")
+async def log(
+    level: str,
+    msg: str,
+    sub: str = "",
+    job_id: str = "",
+    user_id: int = 1,
+    keyword: str | None = None,
+    is_notifiable: bool = False,
+    meta: dict | None = None,
 ):
-    """LangGraph로 노드 흐름을 구성해 컴파일된 그래프를 반환한다."""
+    submessage = _sub_with_keyword(keyword, sub)
+    try:
+        await async_send_log(
+            level=level,
+            message=msg,
+            submessage=submessage,
+            logged_process="write",
+            job_id=job_id,
+            user_id=user_id,
+            is_notifiable=is_notifiable,
+            meta=meta,
+        )
+    except Exception:
+        return
+
+
+@dataclass
+class WriteRun:
+    """그래프 실행 하나의 작업 상태 (시도한 상품 링크, 평가와 함께 시작한 투기적 초안)."""
+
+    tried_links: set[str] = field(default_factory=set)
+    drafts: dict[str, SpeculativeDraft] = field(default_factory=dict)
+
+
+def run_config(services: Any) -> Dict[str, Any]:
+    """graph.ainvoke(initial, config=run_config(services))용 실행별 config."""
+    return {"configurable": {"services": services, "run": WriteRun()}}
+
+
+def _services(config: RunnableConfig):
+    """ainvoke(config={"configurable": {"services": ...}})로 넘긴 요청별 서비스."""
+    try:
+        return config["configurable"]["services"]
+    except (KeyError, TypeError) as exc:
+        raise ValueError("write 그래프 실행에는 configurable.services가 필요합니다.") from exc
+
+
+def _run(config: RunnableConfig) -> WriteRun:
+    """run_config()가 넣은 이 실행의 WriteRun."""
+    try:
+        return config["configurable"]["run"]
+    except (KeyError, TypeError) as exc:
+        raise ValueError("write 그래프 실행에는 configurable.run이 필요합니다 (run_config 사용).") from exc
+
+
+def get_write_graph(*, max_retries: int = 5, relevance_threshold: float = 0.7):
+    """설정 조합별로 한 번 컴파일한 그래프를 돌려준다. LangGraph가 없으면 ImportError."""
+    if _import_error:
+        raise _import_error
+    key = (max_retries, relevance_threshold)
+    graph = _compiled.get(key)
+    if graph is None:
+        with _compiled_lock:
+            graph = _compiled.get(key)
+            if graph is None:
+                graph = _compiled[key] = build_write_graph(
+                    max_retries=max_retries, relevance_threshold=relevance_threshold
+                )
+    return graph
+
+
+def build_write_graph(*, max_retries: int = 5, relevance_threshold: float = 0.7):
+    """LangGraph로 노드 흐름을 구성해 컴파일된 그래프를 반환한다.
+
+    요청마다 부르지 말고 get_write_graph()로 캐시된 그래프를 쓴다.
+    """
     if _import_error:
         raise _import_error
 
     graph = StateGraph(dict)
 
-    @traceable(run_type="tool")
-    async def log(
-        level: str,
-        msg: str,
-        sub: str = "",
-        job_id: str = "",
-        user_id: int = 1,
-        keyword: str | None = None,
-        is_notifiable: bool = False,
-    ):
-        submessage = _sub_with_keyword(keyword, sub)
-        try:
-            await async_send_log(
-                level=level,
-                message=msg,
-                submessage=submessage,
-                logged_process="write",
-                job_id=job_id,
-                user_id=user_id,
-                is_notifiable=is_notifiable,
-            )
-        except Exception:
-            return
-
     @traceable(run_type="chain")
-    async def prepare_keyword(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def prepare_keyword(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
         job_id = state.get("job_id", "")
         user_id = _extract_user_id_from_state(state)
         keyword = state.get("keyword")
@@ -112,7 +177,8 @@ def build_write_graph(
         return state
 
     @traceable(run_type="chain")
-    async def fetch_products(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def fetch_products(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
         keyword = state["keyword"]
         products = await services.ssadagu.search(
             keyword, max_products=20, headless=True, job_id=state.get("job_id")
@@ -123,21 +189,23 @@ def build_write_graph(
         return state
 
     @traceable(run_type="chain")
-    async def choose_product(state: Dict[str, Any]) -> Dict[str, Any]:
-        products = state.get("products") or []
-        state["product"] = random.choice(products)
-        return state
-
-    @traceable(run_type="chain")
-    async def evaluate(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def evaluate(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
+        run = _run(config)
         job_id = state.get("job_id", "")
         user_id = _extract_user_id_from_state(state)
         keyword = state["keyword"]
-        product: SsadaguProduct = state["product"]
-        rel = await services.relevance.evaluate(
-            keyword, product, llm_setting=state["llm_setting"], job_id=job_id
+        product, score = await services.select_product(
+            keyword,
+            state.get("products") or [],
+            llm_setting=state["llm_setting"],
+            job_id=job_id,
+            threshold=relevance_threshold,
+            tried=run.tried_links,
+            drafts=run.drafts,
+            platform=state.get("platform") or _resolve_platform(state["upload_channel"].name),
+            user_id=user_id,
         )
-        score = float(rel.get("score", 0.0))
         await log(
             "INFO",
             "연관도 평가",
@@ -146,14 +214,19 @@ def build_write_graph(
             user_id=user_id,
             keyword=keyword,
         )
+        state["product"] = product
         state["relevance_score"] = score
         return state
 
     @traceable(run_type="router")
-    def route_after_eval(state: Dict[str, Any]) -> str:
+    def route_after_eval(state: Dict[str, Any], config: RunnableConfig) -> str:
+        services = _services(config)
         score = state.get("relevance_score", 0.0)
         retries = state.get("retries", 0)
         if score >= relevance_threshold:
+            should_defer = getattr(services, "should_defer", None)
+            if should_defer is not None and should_defer(state.get("generation_type")):
+                return "defer"
             return "generate"
         if retries + 1 >= max_retries:
             return "fail"
@@ -161,21 +234,23 @@ def build_write_graph(
         return "retry"
 
     @traceable(run_type="chain")
-    async def generate(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
         product: SsadaguProduct = state["product"]
         platform = state.get("platform") or _resolve_platform(
             state["upload_channel"].name
         )
-        promo = await services.promo.generate(
+        title, body, category = await services.generate_post(
             product,
             platform=platform,
             llm_setting=state["llm_setting"],
-            job_id=state.get("job_id"),
+            job_id=state.get("job_id", ""),
+            user_id=_extract_user_id_from_state(state),
+            drafts=_run(config).drafts,
+        )
+        redirect_url = _build_redirect_url(
+            state["job_id"], getattr(services, "settings", None)
         )
-        title = promo.get("title", "").strip()
-        body = promo.get("body", "").strip()
-        category = await services.classify_category(product, state["llm_setting"])
-        redirect_url = _build_redirect_url(state["job_id"])
         body = body.replace(str(product.product_link), redirect_url)
         state["title"] = title
         state["body"] = body
@@ -183,7 +258,30 @@ def build_write_graph(
         return state
 
     @traceable(run_type="chain")
-    async def upload_if_auto(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def defer(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        """MANUAL 작업은 글 생성/전송을 지연 큐로 넘기고 바로 끝낸다 (큐가 차면 바로 처리)."""
+        services = _services(config)
+        kwargs = dict(
+            keyword=state["keyword"],
+            platform=state.get("platform") or _resolve_platform(state["upload_channel"].name),
+            llm_setting=state["llm_setting"],
+            job_id=state.get("job_id", ""),
+            user_id=_extract_user_id_from_state(state),
+            upload_channel_id=state["upload_channel"].id,
+            drafts=_run(config).drafts,
+        )
+        if not services.defer_generation(
+            state["product"], generation_type=state.get("generation_type"), **kwargs
+        ):
+            await services.complete_manual(
+                state["product"], generation_type=state.get("generation_type") or "MANUAL", **kwargs
+            )
+        state["link"] = ""
+        return state
+
+    @traceable(run_type="chain")
+    async def upload_if_auto(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
         gen_type = (state.get("generation_type") or "").upper()
         if gen_type != "AUTO":
             state["link"] = ""
@@ -209,7 +307,8 @@ def build_write_graph(
         return state
 
     @traceable(run_type="chain")
-    async def finalize(state: Dict[str, Any]) -> Dict[str, Any]:
+    async def finalize(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        services = _services(config)
         product: SsadaguProduct = state["product"]
         await _post_content(
             job_id=state["job_id"],
@@ -226,6 +325,7 @@ def build_write_graph(
             keyword=state["keyword"],
             product=product,
             category=state.get("category", "0"),
+            settings=getattr(services, "settings", None),
         )
         await log(
             "INFO",
@@ -235,6 +335,7 @@ def build_write_graph(
             user_id=_extract_user_id_from_state(state),
             keyword=state.get("keyword"),
             is_notifiable=True,
+            meta=usage_meta(),
         )
         return state
 
@@ -252,22 +353,22 @@ def build_write_graph(
 
     graph.add_node("prepare_keyword", prepare_keyword)
     graph.add_node("fetch_products", fetch_products)
-    graph.add_node("choose_product", choose_product)
     graph.add_node("evaluate", evaluate)
     graph.add_node("generate", generate)
+    graph.add_node("defer", defer)
     graph.add_node("upload", upload_if_auto)
     graph.add_node("finalize", finalize)
     graph.add_node("fail", fail)
 
     graph.set_entry_point("prepare_keyword")
     graph.add_edge("prepare_keyword", "fetch_products")
-    graph.add_edge("fetch_products", "choose_product")
-    graph.add_edge("choose_product", "evaluate")
+    graph.add_edge("fetch_products", "evaluate")
     graph.add_conditional_edges(
         "evaluate",
         route_after_eval,
         {
             "generate": "generate",
+            "defer": "defer",
             "retry": "fetch_products",
             "fail": "fail",
         },
@@ -275,6 +376,7 @@ def build_write_graph(
     graph.add_edge("generate", "upload")
     graph.add_edge("upload", "finalize")
     graph.add_edge("finalize", END)
+    graph.add_edge("defer", END)
 
     return graph.compile()
 
@@ -288,73 +390,6 @@ def _resolve_platform(name: str) -> str:
     return name_low or "naver_blog"
 
 
-def _build_redirect_url(job_id: str) -> str:
-    base = config.get_log_endpoint()
-    parsed = urlparse(base)
-    host = f"{parsed.scheme}://{parsed.netloc}"
-    return f"{host}/api/link?jobId={job_id}"
-
-
-async def _post_content(
-    *,
-    job_id: str,
-    upload_channel_id: int,
-    user_id: int,
-    title: str,
-    body: str,
-    generation_type: str,
-    link: str,
-    keyword: str,
-    product: SsadaguProduct,
-    category: str,
-) -> None:
-    gen_type_upper = (generation_type or "").upper()
-    status = "APPROVED" if gen_type_upper == "AUTO" else "PENDING"
-    payload = {
-        "jobId": job_id,
-        "uploadChannelId": upload_channel_id,
-        "userId": user_id,
-        "title": title,
-        "body": body,
-        "status": status,
-        "generationType": generation_type,
-        "link": link,
-        "keyword": keyword,
-        "product": {
-            "title": product.title,
-            "link": str(product.product_link),
-            "thumbnail": str(product.thumbnail_link or ""),
-            "price": product.price or 0,
-            "category": category,
-        },
-    }
-    base = config.get_log_endpoint()
-    parsed = urlparse(base)
-    host = f"{parsed.scheme}://{parsed.netloc}"
-    url = f"{host}/api/content"
-    try:
-        headers = config.build_internal_headers()
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                url,
-                json=payload,
-                timeout=config.get_log_timeout(),
-                headers=headers,
-            )
-    except Exception:
-        try:
-            await async_send_log(
-                level="WARN",
-                message="컨텐츠 전송 실패",
-                submessage=_sub_with_keyword(keyword, url),
-                logged_process="write",
-                job_id=job_id,
-                user_id=user_id,
-            )
-        except Exception:
-            return
-
-
 def _extract_user_id_from_state(state: Dict[str, Any]) -> int:
     """그래프 상태에서 user_id를 최대한 추출한다."""
     if state.get("user_id"):
@@ -0,0 +1,92 @@
+"""내부 콜백/로그 전송용 공유 HTTP 클라이언트.
+
+콜백(/api/content, /api/content/link, /api/trend)과 로그 전송이 요청마다
+httpx.AsyncClient를 새로 만들면 매번 TCP/TLS 연결을 다시 맺는다. 이 레지스트리는
+대상 origin(scheme://host:port)마다 keep-alive 커넥션 풀을 가진 클라이언트 하나를
+두고 재사용한다. origin별로 클라이언트를 나누므로 커넥션 상한이 호스트 단위로 적용되며,
+기본 타임아웃이 항상 설정된다. h2 패키지가 있으면 HTTP/2를 사용한다.
+
+클라이언트는 이벤트 루프에 묶이므로 루프별로 만들고, 앱 종료 시(lifespan) 닫는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+import httpx
+
+from app import config
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+class HttpClientRegistry:
+    """(이벤트 루프, origin)별 AsyncClient 모음."""
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[int, str], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def _build(self) -> httpx.AsyncClient:
+        per_host = max(1, config.get_http_max_connections_per_host())
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE and config.get_http2_enabled(),
+            limits=httpx.Limits(
+                max_connections=per_host,
+                max_keepalive_connections=per_host,
+                keepalive_expiry=config.get_http_keepalive_expiry(),
+            ),
+            timeout=httpx.Timeout(
+                config.get_log_timeout(), connect=config.get_http_connect_timeout()
+            ),
+        )
+
+    def for_url(self, url: str) -> httpx.AsyncClient:
+        """url의 origin에 해당하는 현재 루프의 공유 클라이언트. 호출자는 닫지 않는다."""
+        loop = asyncio.get_running_loop()
+        key = (id(loop), _origin(url))
+        with self._lock:
+            # 닫힌 루프(테스트의 asyncio.run 등)의 클라이언트는 버린다
+            for stale in [k for k, (lp, _) in self._clients.items() if lp.is_closed()]:
+                del self._clients[stale]
+            entry = self._clients.get(key)
+            if entry is None or entry[0] is not loop or entry[1].is_closed:
+                entry = (loop, self._build())
+                self._clients[key] = entry
+                self.created += 1
+            return entry[1]
+
+    async def aclose(self) -> None:
+        """현재 루프에 묶인 클라이언트를 모두 닫는다."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            mine = [k for k, (lp, _) in self._clients.items() if lp is loop]
+            clients = [self._clients.pop(k)[1] for k in mine]
+        for client in clients:
+            await client.aclose()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            origins = sorted({origin for _, origin in self._clients})
+        return {"created": self.created, "origins": origins, "http2": HTTP2_AVAILABLE and config.get_http2_enabled()}
+
+
+HTTP_CLIENTS = HttpClientRegistry()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """내부 콜백용 공유 클라이언트 (HTTP_CLIENTS.for_url 단축)."""
+    return HTTP_CLIENTS.for_url(url)
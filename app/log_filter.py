@@ -0,0 +1,92 @@
+"""원격 로그 전송 여부를 정하는 레벨 기준과 샘플링.
+
+모든 로그는 로컬 콘솔에 찍히고, 원격 전송은 다음 규칙을 통과한 것만 한다.
+
+- ERROR와 알림 대상(isNotifiable) 로그는 항상 전송한다.
+- DEBUG는 로컬 전용 단계로, 원격에 보내지 않는다.
+- logged_process별 최소 레벨(LOG_REMOTE_LEVELS, 기본 LOG_REMOTE_LEVEL) 미만은 로컬 전용.
+- 같은 (process, 레벨, message, jobId)가 LOG_SAMPLE_WINDOW초 안에 LOG_SAMPLE_BURST번을 넘으면
+  나머지는 로컬 전용으로 돌리고, 창이 바뀐 뒤 처음 전송되는 로그의 meta.suppressed에
+  건너뛴 개수를 붙인다. jobId가 키에 들어가므로 여러 작업이 같은 진행 메시지를 보내도
+  작업별 타임라인은 그대로 남고, 한 작업 안에서 반복되는 메시지만 줄어든다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from app import config
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+# 샘플링 상태를 유지할 최대 메시지 종류 수 (넘으면 초기화)
+MAX_TRACKED_MESSAGES = 10_000
+
+
+class LogFilter:
+    def __init__(self) -> None:
+        # (process, level, message, jobId) -> [창 시작, 창 안 전송 수, 건너뛴 수]
+        self._windows: dict[tuple[str, str, str, str], list[float]] = {}
+        self._lock = threading.Lock()
+        self.local_only = 0
+        self.sampled_out = 0
+
+    def allow(
+        self,
+        process: str,
+        level: str,
+        message: str,
+        *,
+        notifiable: bool = False,
+        job_id: str = "",
+    ) -> tuple[bool, int]:
+        """(원격 전송 여부, 직전 창에서 건너뛴 개수)."""
+        if level == "ERROR" or notifiable:
+            return True, 0
+        settings = config.get_settings()
+        threshold = settings.log_remote_levels.get(process, settings.log_remote_level)
+        if level == "DEBUG" or LEVELS.get(level, 20) < LEVELS.get(threshold, 20):
+            with self._lock:
+                self.local_only += 1
+            return False, 0
+
+        burst = settings.log_sample_burst
+        if burst <= 0:
+            return True, 0
+        window = settings.log_sample_window
+        now = time.monotonic()
+        key = (process, level, message, job_id)
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None:
+                if len(self._windows) >= MAX_TRACKED_MESSAGES:
+                    self._windows.clear()
+                state = self._windows[key] = [now, 0, 0]
+            suppressed = 0
+            if now - state[0] >= window:
+                suppressed = int(state[2])
+                state[:] = [now, 0, 0]
+            if state[1] >= burst:
+                state[2] += 1
+                self.sampled_out += 1
+                return False, 0
+            state[1] += 1
+            return True, suppressed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "local_only": self.local_only,
+                "sampled_out": self.sampled_out,
+                "tracked": len(self._windows),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self.local_only = 0
+            self.sampled_out = 0
+
+
+LOG_FILTER = LogFilter()
@@ -0,0 +1,228 @@
+"""원격 로그 백그라운드 배치 전송기.
+
+async_send_log은 로그를 메모리 큐에 넣고 바로 반환하며(O(1), 네트워크 대기 없음),
+이벤트 루프의 전송 task가 배치 크기나 주기에 맞춰 app.http_clients의 공유 커넥션
+풀로 전송한다. LOG_BATCH_ENDPOINT가 있으면 배열 한 번으로, 없으면 배치 안의 로그를
+동시에 한 줄씩 보낸다. 큐가 가득 차면 새 로그는 버려지고 dropped로 집계된다.
+종료 시(lifespan, asyncio.run 정리 단계) 남은 로그를 비운다. 전송에 실패한 로그는
+스풀(app.spool)로 넘겨 백그라운드에서 재전송한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Optional
+
+import httpx
+
+from app import config
+from app.http_clients import get_http_client
+from app.spool import OUTBOUND_SPOOL, SpoolFull
+
+# 한 줄씩 보낼 때 동시에 보낼 최대 요청 수
+MAX_CONCURRENT_POSTS = 10
+
+
+class LogShipper:
+    """유한 큐 + 주기/크기 기반 배치 전송."""
+
+    def __init__(
+        self,
+        *,
+        max_queue: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        batch_endpoint: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_queue = config.get_log_queue_size(max_queue)
+        self.batch_size = max(1, config.get_log_batch_size(batch_size))
+        self.flush_interval = config.get_log_flush_interval(flush_interval)
+        self._batch_endpoint = batch_endpoint
+        self._transport = transport
+        # (endpoint, payload, timeout)
+        self._queue: deque[tuple[str, dict[str, Any], float]] = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.spooled = 0
+
+    def enqueue(self, endpoint: str, payload: dict[str, Any], *, timeout: float) -> bool:
+        """로그를 큐에 넣는다. 큐가 가득 차 버려졌으면 False."""
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append((endpoint, payload, timeout))
+            self.enqueued += 1
+            full = len(self._queue) >= self.batch_size
+        self._ensure_started()
+        if full:
+            self._wake()
+        return True
+
+    @property
+    def running(self) -> bool:
+        """전송 task가 살아 있는 루프가 있으면 True (다른 스레드에서 넣어도 전송된다)."""
+        task, loop = self._task, self._loop
+        return task is not None and not task.done() and loop is not None and not loop.is_closed()
+
+    def _wake(self) -> None:
+        wakeup, loop = self._wakeup, self._loop
+        if wakeup is None or loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            # 다른 스레드(동기 코드)에서 넣은 경우 루프 스레드에서 깨운다
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _ensure_started(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        # 다른 루프에서 쓰던 클라이언트는 그 루프와 함께 버린다
+        self._loop = loop
+        self._client = None
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="log-shipper")
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        assert wakeup is not None
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                await self.flush()
+        except asyncio.CancelledError:
+            # 종료 시 남은 로그를 비운다
+            await self.flush()
+            await self._close_client()
+            raise
+
+    def _take_batch(self) -> list[tuple[str, dict[str, Any], float]]:
+        with self._lock:
+            count = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    async def flush(self) -> None:
+        """큐가 빌 때까지 배치 단위로 전송한다."""
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            await self._send(batch)
+
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        if self._transport is None:
+            return get_http_client(url)
+        # 테스트용 transport가 주어지면 전용 클라이언트를 쓴다
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=self._transport)
+        return self._client
+
+    async def _send(self, batch: list[tuple[str, dict[str, Any], float]]) -> None:
+        settings = config.get_settings()
+        headers = settings.internal_headers
+        batch_endpoint = (
+            self._batch_endpoint.rstrip("/") if self._batch_endpoint else settings.log_batch_endpoint
+        )
+        self.batches += 1
+        if batch_endpoint:
+            try:
+                response = await self._get_client(batch_endpoint).post(
+                    batch_endpoint,
+                    json=[payload for _, payload, _ in batch],
+                    timeout=max(timeout for _, _, timeout in batch),
+                    headers=headers,
+                )
+                response.raise_for_status()
+                self.sent += len(batch)
+            except httpx.HTTPError as exc:
+                self.failed += len(batch)
+                print(f"[LOG] 배치 전송 실패({len(batch)}건): {exc}")
+                for item in batch:
+                    self._spool(*item)
+            return
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+
+        async def _post(endpoint: str, payload: dict[str, Any], timeout: float) -> None:
+            try:
+                async with semaphore:
+                    response = await self._get_client(endpoint).post(
+                        endpoint, json=payload, timeout=timeout, headers=headers
+                    )
+                response.raise_for_status()
+                self.sent += 1
+            except httpx.HTTPError as exc:
+                self.failed += 1
+                print(f"[LOG][{payload.get('logType')}] 전송 실패: {exc}")
+                self._spool(endpoint, payload, timeout)
+
+        await asyncio.gather(*(_post(*item) for item in batch))
+
+    def _spool(self, endpoint: str, payload: dict[str, Any], timeout: float) -> None:
+        if not config.get_settings().outbound_spool_enabled:
+            return
+        # 로그 재전송이 같은 작업의 콜백 순서를 막지 않도록 키를 분리한다
+        key = f"log:{payload.get('jobId') or ''}"
+        try:
+            OUTBOUND_SPOOL.submit("POST", endpoint, payload, key=key, kind="log", timeout=timeout)
+        except SpoolFull as exc:
+            print(f"[LOG] {exc}")
+            return
+        self.spooled += 1
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """전송 task를 멈추고 남은 로그를 모두 보낸다 (앱 종료 시)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        await self._close_client()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            queued = len(self._queue)
+        return {
+            "queued": queued,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "spooled": self.spooled,
+        }
+
+
+LOG_SHIPPER = LogShipper()
@@ -4,6 +4,10 @@ Environment variables (loaded from .env via app.config):
     LOG_ENDPOINT (필수): 로그를 전송할 HTTP 엔드포인트(URL).
     LOG_SOURCE (선택): 로그 발생 소스 식별자. 기본값 "final-py".
     LOG_TIMEOUT (선택): 요청 타임아웃(초). 기본 5.0.
+    LOG_ASYNC_SHIPPING (선택): async_send_log을 백그라운드 배치 전송기로 보낼지 여부. 기본 true.
+    LOG_REMOTE_LEVEL(S), LOG_SAMPLE_* (선택): 원격 전송 레벨 기준/샘플링 (app.log_filter).
+      DEBUG 레벨은 로컬 콘솔에만 남는다.
+    위 값은 config.get_settings() 스냅샷에서 읽으므로, 바꾼 뒤에는 config.reload_settings()가 필요하다.
 
 로그 전송 형식(요청 JSON):
 {
@@ -20,11 +24,16 @@ Environment variables (loaded from .env via app.config):
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 
 import httpx
 from app import config
+from app.blocking_guard import report_blocking_call
+from app.http_clients import get_http_client
+from app.log_filter import LOG_FILTER
+from app.log_shipper import LOG_SHIPPER
 
 
 class LogSendError(RuntimeError):
@@ -51,7 +60,7 @@ def send_log(
 
     Args:
         message: 전송할 메시지.
-        level: 로그 레벨 문자열. INFO/WARN/ERROR 중 하나.
+        level: 로그 레벨 문자열. DEBUG/INFO/WARN/ERROR 중 하나 (DEBUG는 로컬 전용).
         submessage: 부가 메시지.
         logged_process: 어떤 프로세스/기능에서 발생한 로그인지 식별자.
         user_id: 사용자 ID (없으면 0).
@@ -61,50 +70,42 @@ def send_log(
         meta: 호환성용 임의 데이터(dict). 페이로드에 meta/level/source/timestamp도 함께 포함.
         timeout: 요청 타임아웃(초). 없으면 LOG_TIMEOUT 또는 5.0초.
         client: 재사용할 httpx.Client. 없으면 내부에서 생성 후 닫는다.
+            (async_send_log은 없으면 공유 클라이언트 app.http_clients를 쓴다)
         raise_on_error: True면 전송 실패 시 예외를 올린다. 기본 False면 콘솔에만 남김.
         is_notifiable: 알림 대상 여부. 지정되지 않으면 level이 ERROR일 때만 True, 나머지는 False.
     """
 
-    log_level = level.upper()
-    if log_level not in {"INFO", "WARN", "ERROR"}:
-        log_level = "INFO"
-
-    meta = meta or {}
-    notify_flag = is_notifiable if is_notifiable is not None else (log_level == "ERROR")
-    now_str = _now_str()
-    payload = {
-        "userId": user_id,
-        "logType": log_level,
-        "loggedProcess": logged_process or source or config.get_log_source(),
-        "loggedDate": now_str,
-        "message": message,
-        "submessage": submessage,
-        "jobId": job_id,
-        "isNotifiable": notify_flag,
-        # 호환성 필드 (기존 테스트/사용처 대응)
-        "level": log_level,
-        "meta": meta,
-        "source": source or config.get_log_source(),
-        "timestamp": now_str,
-    }
-
-    # 즉시 로컬 콘솔 확인
-    print(
-        f"[LOG][{payload['logType']}] {payload['message']} | {payload['loggedProcess']} | {payload['submessage']} | meta={payload['meta']}"
+    # 이벤트 루프 스레드에서 호출되면 루프 전체가 멈추므로 디버그 가드에 보고
+    report_blocking_call("send_log")
+    payload = _build_payload(
+        message=message,
+        level=level,
+        submessage=submessage,
+        logged_process=logged_process,
+        user_id=user_id,
+        job_id=job_id,
+        source=source,
+        meta=meta,
+        is_notifiable=is_notifiable,
     )
+    log_level = payload["logType"]
+    _print_local(payload)
+    if not _remote_allowed(payload):
+        return None  # type: ignore[return-value]
 
+    settings = config.get_settings()
     try:
-        endpoint_url = config.get_log_endpoint(endpoint)
+        endpoint_url = _resolve_endpoint(endpoint, settings)
     except Exception:
         # 로그 엔드포인트 미설정 시 콘솔만 출력하고 반환
         if not raise_on_error:
             return None  # type: ignore[return-value]
         raise
 
-    timeout_val = config.get_log_timeout(timeout)
+    timeout_val = timeout if timeout is not None else settings.log_timeout
     close_client = client is None
     client = client or httpx.Client()
-    headers = config.build_internal_headers()
+    headers = settings.internal_headers
 
     try:
         response = client.post(
@@ -141,44 +142,42 @@ async def async_send_log(
     raise_on_error: bool = False,
     is_notifiable: Optional[bool] = None,
 ) -> Optional[httpx.Response]:
-    """비동기 버전의 send_log."""
-    log_level = level.upper()
-    if log_level not in {"INFO", "WARN", "ERROR"}:
-        log_level = "INFO"
-
-    meta = meta or {}
-    notify_flag = is_notifiable if is_notifiable is not None else (log_level == "ERROR")
-    now_str = _now_str()
-    payload = {
-        "userId": user_id,
-        "logType": log_level,
-        "loggedProcess": logged_process or source or config.get_log_source(),
-        "loggedDate": now_str,
-        "message": message,
-        "submessage": submessage,
-        "jobId": job_id,
-        "isNotifiable": notify_flag,
-        "level": log_level,
-        "meta": meta,
-        "source": source or config.get_log_source(),
-        "timestamp": now_str,
-    }
+    """비동기 버전의 send_log.
 
-    print(
-        f"[LOG][{payload['logType']}] {payload['message']} | {payload['loggedProcess']} | {payload['submessage']} | meta={payload['meta']}"
+    client/raise_on_error를 지정하지 않으면 로그는 백그라운드 전송기(LOG_SHIPPER) 큐에
+    들어가고 바로 반환한다(응답 없음). 네트워크 대기가 호출자의 지연에 더해지지 않는다.
+    """
+    payload = _build_payload(
+        message=message,
+        level=level,
+        submessage=submessage,
+        logged_process=logged_process,
+        user_id=user_id,
+        job_id=job_id,
+        source=source,
+        meta=meta,
+        is_notifiable=is_notifiable,
     )
+    log_level = payload["logType"]
+    _print_local(payload)
+    if not _remote_allowed(payload):
+        return None  # type: ignore[return-value]
 
+    settings = config.get_settings()
     try:
-        endpoint_url = config.get_log_endpoint(endpoint)
+        endpoint_url = _resolve_endpoint(endpoint, settings)
     except Exception:
         if not raise_on_error:
             return None
         raise
 
-    timeout_val = config.get_log_timeout(timeout)
-    close_client = client is None
-    client = client or httpx.AsyncClient()
-    headers = config.build_internal_headers()
+    timeout_val = timeout if timeout is not None else settings.log_timeout
+    if client is None and not raise_on_error and settings.log_async_shipping:
+        LOG_SHIPPER.enqueue(endpoint_url, payload, timeout=timeout_val)
+        return None
+
+    client = client or get_http_client(endpoint_url)
+    headers = settings.internal_headers
 
     try:
         response = await client.post(
@@ -194,9 +193,137 @@ async def async_send_log(
         if raise_on_error:
             raise LogSendError(f"로그 전송 실패: {exc}") from exc
         return None
-    finally:
-        if close_client:
-            await client.aclose()
+
+
+def log_nowait(
+    *,
+    message: str,
+    level: str = "INFO",
+    submessage: str = "",
+    logged_process: str = "",
+    user_id: int = 1,
+    job_id: str = "",
+    endpoint: Optional[str] = None,
+    source: Optional[str] = None,
+    meta: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    is_notifiable: Optional[bool] = None,
+) -> None:
+    """동기/비동기 어느 컨텍스트에서도 바로 반환하는 로그 전송.
+
+    이벤트 루프 위(동기 함수가 코루틴 안에서 불린 경우 포함)에서는 LOG_SHIPPER 큐에 넣고,
+    다른 스레드에서도 전송기가 살아 있으면 그 큐로 보낸다. 전송기가 없는 순수 동기
+    환경(스크립트 등)에서만 호출 스레드에서 send_log로 직접 전송한다.
+    """
+    if not _on_event_loop() and not LOG_SHIPPER.running:
+        send_log(
+            message=message,
+            level=level,
+            submessage=submessage,
+            logged_process=logged_process,
+            user_id=user_id,
+            job_id=job_id,
+            endpoint=endpoint,
+            source=source,
+            meta=meta,
+            timeout=timeout,
+            is_notifiable=is_notifiable,
+        )
+        return
+    payload = _build_payload(
+        message=message,
+        level=level,
+        submessage=submessage,
+        logged_process=logged_process,
+        user_id=user_id,
+        job_id=job_id,
+        source=source,
+        meta=meta,
+        is_notifiable=is_notifiable,
+    )
+    _print_local(payload)
+    if not _remote_allowed(payload):
+        return
+    settings = config.get_settings()
+    if not endpoint and settings.log_endpoint is None:
+        return
+    LOG_SHIPPER.enqueue(
+        _resolve_endpoint(endpoint, settings),
+        payload,
+        timeout=timeout if timeout is not None else settings.log_timeout,
+    )
+
+
+def _resolve_endpoint(endpoint: Optional[str], settings: config.Settings) -> str:
+    """명시한 엔드포인트가 있으면 그것을, 없으면 LOG_ENDPOINT (미설정이면 ValueError)."""
+    if endpoint:
+        return endpoint.rstrip("/")
+    return settings.require_log_endpoint()
+
+
+def _remote_allowed(payload: dict) -> bool:
+    """레벨 기준/샘플링을 통과하면 True. 샘플링으로 건너뛴 수가 있으면 meta에 붙인다."""
+    allowed, suppressed = LOG_FILTER.allow(
+        payload["loggedProcess"],
+        payload["logType"],
+        payload["message"],
+        notifiable=payload["isNotifiable"],
+        job_id=payload["jobId"],
+    )
+    if allowed and suppressed:
+        payload["meta"] = {**payload["meta"], "suppressed": suppressed}
+    return allowed
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _build_payload(
+    *,
+    message: str,
+    level: str,
+    submessage: str,
+    logged_process: str,
+    user_id: int,
+    job_id: str,
+    source: Optional[str],
+    meta: Optional[dict],
+    is_notifiable: Optional[bool],
+) -> dict:
+    log_level = level.upper()
+    if log_level not in {"DEBUG", "INFO", "WARN", "ERROR"}:
+        log_level = "INFO"
+
+    notify_flag = is_notifiable if is_notifiable is not None else (log_level == "ERROR")
+    now_str = _now_str()
+    default_source = config.get_settings().log_source
+    return {
+        "userId": user_id,
+        "logType": log_level,
+        "loggedProcess": logged_process or source or default_source,
+        "loggedDate": now_str,
+        "message": message,
+        "submessage": submessage,
+        "jobId": job_id,
+        "isNotifiable": notify_flag,
+        # 호환성 필드 (기존 테스트/사용처 대응)
+        "level": log_level,
+        "meta": meta or {},
+        "source": source or default_source,
+        "timestamp": now_str,
+    }
+
+
+def _print_local(payload: dict) -> None:
+    """즉시 로컬 콘솔 확인."""
+    print(
+        f"[LOG][{payload['logType']}] {payload['message']} | {payload['loggedProcess']} | {payload['submessage']} | meta={payload['meta']}"
+    )
 
 
 def _now_str() -> str:
@@ -1,8 +1,63 @@
+import asyncio
+import logging
+import signal
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app import config, ops_stats
 from app.api import api_router
+from app.blocking_guard import install_loop_monitor
+from app.http_clients import HTTP_CLIENTS
+from app.log_shipper import LOG_SHIPPER
+from app.services.deferred import DEFERRED_QUEUE
+from app.services.product_context import load_encoder
+from app.spool import OUTBOUND_SPOOL
+from app.task_supervisor import TASK_SUPERVISOR
+
+
+logger = logging.getLogger(__name__)
+
+
+def _reload_settings_on_signal() -> None:
+    """SIGHUP: .env와 환경 변수를 다시 읽어 설정 스냅샷을 교체한다 (잘못된 값이면 기존 유지)."""
+    try:
+        config.reload_settings(dotenv=True)
+    except ValueError as exc:
+        logger.error("설정 다시 읽기 실패, 기존 설정 유지: %s", exc)
 
-app = FastAPI(title="Final PY API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그/콜백 설정을 한 번 파싱/검증한다 (잘못된 값이면 여기서 시작 실패)
+    app.state.settings = config.reload_settings()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_settings_on_signal)
+    except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+        # Windows이거나 메인 스레드가 아닌 루프(테스트 클라이언트 등)
+        pass
+    # 내부 콜백/로그 전송용 공유 HTTP 클라이언트 (origin별 keep-alive 풀)
+    app.state.http_clients = HTTP_CLIENTS
+    # DEBUG_BLOCKING_GUARD=true일 때만 느린 콜백 보고를 켠다
+    install_loop_monitor()
+    # 토큰 예산 계산용 tiktoken 인코딩을 루프 밖에서 미리 로드한다 (첫 로드는 다운로드)
+    await asyncio.to_thread(load_encoder)
+    # 이전 실행에서 못 보낸 콜백/로그를 (루프 밖에서) 불러와 재전송 시작
+    await asyncio.to_thread(OUTBOUND_SPOOL.load)
+    OUTBOUND_SPOOL.start()
+    yield
+    # 진행 중인 write/upload/crawler 백그라운드 작업을 제한 시간까지 기다리고 남으면 취소
+    await TASK_SUPERVISOR.aclose()
+    # 지연 생성 큐(메모리)에 남은 MANUAL 작업을 제한 시간까지 처리하고, 못 한 작업은 로그로 남긴다
+    await DEFERRED_QUEUE.aclose()
+    # 큐에 남은 원격 로그를 비우고 스풀 전송을 잠시 기다린 뒤(못 보낸 항목은 파일에 남음)
+    # 커넥션 풀을 닫는다
+    await LOG_SHIPPER.aclose()
+    await OUTBOUND_SPOOL.aclose()
+    await HTTP_CLIENTS.aclose()
+
+
+app = FastAPI(title="Final PY API", version="0.1.0", lifespan=lifespan)
 
 # Register API routers early so versioned endpoints are available.
 app.include_router(api_router)
@@ -18,3 +73,9 @@ async def read_root() -> dict[str, str]:
 async def health_check() -> dict[str, str]:
     """Liveness probe for container orchestration."""
     return {"status": "ok"}
+
+
+@app.get("/stats", summary="프로세스 운영 지표(로그 전송/스풀/HTTP 클라이언트/지연 큐/백그라운드 작업)")
+async def process_stats() -> dict:
+    """LLM 외 운영 카운터. LLM 호출 지표는 /api/llm/metrics."""
+    return ops_stats.stats()
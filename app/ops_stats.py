@@ -0,0 +1,27 @@
+"""프로세스 운영 지표 모음 (GET /stats).
+
+로그 전송/샘플링, 전송 스풀, 공유 HTTP 클라이언트, 지연 생성 큐, 백그라운드 작업의
+카운터를 한곳에 모은다. LLM 호출 지표는 /api/llm/metrics에 있다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.http_clients import HTTP_CLIENTS
+from app.log_filter import LOG_FILTER
+from app.log_shipper import LOG_SHIPPER
+from app.services.deferred import DEFERRED_QUEUE
+from app.spool import OUTBOUND_SPOOL
+from app.task_supervisor import TASK_SUPERVISOR
+
+
+def stats() -> dict[str, Any]:
+    return {
+        "log_shipper": LOG_SHIPPER.stats(),
+        "log_filter": LOG_FILTER.stats(),
+        "spool": OUTBOUND_SPOOL.stats(),
+        "http_clients": HTTP_CLIENTS.stats(),
+        "deferred": DEFERRED_QUEUE.stats(),
+        "background_tasks": TASK_SUPERVISOR.stats(),
+    }
@@ -15,6 +15,13 @@ DEFAULT_SYSTEM = (
     "- 출력은 JSON으로 score(0.0~1.0), reason(간단한 근거)만 포함한다.\n"
     "- JSON 외의 추가 텍스트는 넣지 않는다."
 )
+DEFAULT_BATCH_SYSTEM = (
+    "너는 상품 추천 평가자다. 키워드와 번호가 매겨진 여러 상품을 보고 각 상품의 연관도를 0.0~1.0 사이 점수로 매겨라.\n"
+    "- 1.0에 가까울수록 키워드와 상품이 매우 잘 맞는다.\n"
+    "- 모든 상품을 빠짐없이 평가한다.\n"
+    "- 출력은 JSON {\"results\": [{\"index\": 번호, \"score\": 0.0~1.0, \"reason\": 간단한 근거}]}만 포함한다.\n"
+    "- JSON 외의 추가 텍스트는 넣지 않는다."
+)
 
 
 @lru_cache(maxsize=4)
@@ -26,3 +33,14 @@ def get_system_prompt() -> str:
         except Exception:
             return DEFAULT_SYSTEM
     return DEFAULT_SYSTEM
+
+
+@lru_cache(maxsize=4)
+def get_batch_system_prompt() -> str:
+    path = BASE_DIR / "batch_system.txt"
+    if path.exists():
+        try:
+            return path.read_text(encoding="utf-8").strip()
+        except Exception:
+            return DEFAULT_BATCH_SYSTEM
+    return DEFAULT_BATCH_SYSTEM
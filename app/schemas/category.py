@@ -0,0 +1,13 @@
+"""상품 카테고리 분류 스키마."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CategoryOutput(BaseModel):
+    """LLM 구조화 출력: 카테고리 ID."""
+
+    category: str = Field(..., description="카테고리 ID")
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
@@ -16,3 +16,11 @@ class KeywordRefineResponse(BaseModel):
     keyword: str
     real_keyword: str
     reason: str
+
+
+class KeywordRefineOutput(BaseModel):
+    """LLM 구조화 출력: 검색어 변환 결과."""
+
+    keyword: str = ""
+    real_keyword: str = Field(..., description="쇼핑몰 검색에 쓸 키워드")
+    reason: str = ""
@@ -14,6 +14,12 @@ class LLMChatRequest(BaseModel):
     )
 
 
+class LLMChatStreamRequest(LLMChatRequest):
+    repair_json: bool = Field(
+        False, description="True면 마지막 done 이벤트의 answer를 JSON 복구 후 반환"
+    )
+
+
 class LLMChatResponse(BaseModel):
     answer: str = Field(..., description="LLM 생성 답변")
 
@@ -34,3 +40,4 @@ class LlmSetting(BaseModel):
 
 
 LLMChatRequest.model_rebuild()
+LLMChatStreamRequest.model_rebuild()
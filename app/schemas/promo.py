@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.schemas.llm import LlmSetting
 from app.schemas.products import SsadaguProduct
@@ -25,3 +25,18 @@ class PromoResponse(BaseModel):
     body: str
     link: str = Field(..., description="사용된 상품 링크")
     platform: str = Field(..., description="생성된 플랫폼")
+
+
+class PromoOutput(BaseModel):
+    """LLM 구조화 출력: 홍보글."""
+
+    title: str = ""
+    body: str = Field(..., description="본문")
+
+
+class PromoWithCategoryOutput(PromoOutput):
+    """LLM 구조화 출력: 홍보글 + 카테고리 ID."""
+
+    category: str = Field(..., description="카테고리 ID")
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
@@ -19,3 +19,35 @@ class RelevanceResponse(BaseModel):
     product_title: str
     score: float = Field(..., description="연관도 점수(0.0~1.0)")
     reason: str = Field(..., description="판단 근거")
+
+
+class RelevanceBatchRequest(BaseModel):
+    keyword: str = Field(..., description="검색 키워드")
+    products: list[SsadaguProduct] = Field(
+        ..., min_length=1, description="평가할 싸다구 상품 목록"
+    )
+    llm_setting: LlmSetting | None = Field(None, description="LLM 설정(선택)")
+
+
+class RelevanceBatchResponse(BaseModel):
+    keyword: str
+    results: list[RelevanceResponse] = Field(..., description="입력 순서대로의 평가 결과")
+
+
+class RelevanceOutput(BaseModel):
+    """LLM 구조화 출력: 단일 상품 연관도."""
+
+    score: float = Field(..., description="연관도 점수(0.0~1.0)")
+    reason: str = ""
+
+
+class RelevanceItemOutput(BaseModel):
+    index: int = Field(..., description="상품 번호")
+    score: float = Field(..., description="연관도 점수(0.0~1.0)")
+    reason: str = ""
+
+
+class RelevanceBatchOutput(BaseModel):
+    """LLM 구조화 출력: 여러 상품 연관도."""
+
+    results: list[RelevanceItemOutput]
@@ -0,0 +1,315 @@
+"""상품 카테고리 분류 (로컬 사전 분류기 + LLM 폴백).
+
+카테고리 목록은 app/prompts/categories.txt(마크다운 표)에서 읽는다.
+로컬 분류기는 카테고리별 키워드 사전과 문자 bigram 유사도로 즉시 후보와
+신뢰도를 계산하고, 신뢰도가 임계값보다 낮을 때만 LLM을 호출한다. LLM이 목록에 없는
+ID를 돌려주거나 호출이 형식 오류로 실패하면 로컬 예측을 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app import config
+from app.schemas.category import CategoryOutput
+from app.schemas.llm import LlmSetting
+from app.schemas.products import SsadaguProduct
+from app.services.llm import LLMOutputError, LLMService
+from app.services.product_context import product_spec_lines
+from app.services.ranking import tokenize
+
+CATEGORY_FILE = Path(__file__).resolve().parent.parent / "prompts" / "categories.txt"
+
+# 카테고리 이름 → 상품명/스펙에 자주 등장하는 단어
+CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "DIGITAL": ("이어폰", "헤드셋", "블루투스", "충전기", "케이블", "보조배터리", "마우스", "키보드", "스마트폰", "태블릿", "노트북", "usb", "스피커", "스마트워치", "거치대"),
+    "FASHION": ("티셔츠", "셔츠", "바지", "청바지", "원피스", "자켓", "재킷", "코트", "니트", "후드", "맨투맨", "레깅스", "치마", "스커트", "패딩"),
+    "INNERWEAR_AND_PAJAMAS": ("속옷", "브라", "팬티", "드로즈", "잠옷", "파자마", "내복", "런닝", "수면바지"),
+    "SHOES": ("운동화", "구두", "슬리퍼", "샌들", "부츠", "등산화", "러닝화", "스니커즈", "로퍼", "깔창"),
+    "BAGS": ("가방", "백팩", "크로스백", "토트백", "숄더백", "파우치", "지갑", "캐리어", "에코백", "더플백"),
+    "FASHION_ACCESSORIES": ("모자", "벨트", "장갑", "스카프", "머플러", "선글라스", "양말", "넥타이", "헤어밴드", "머리끈"),
+    "JEWELRY_AND_ACCESSORIES": ("반지", "목걸이", "귀걸이", "팔찌", "발찌", "브로치", "14k", "주얼리", "펜던트"),
+    "SPORTS_GEAR": ("요가", "매트", "덤벨", "아령", "폼롤러", "줄넘기", "헬스", "필라테스", "밴드", "축구", "농구", "골프", "배드민턴"),
+    "LEISURE_GEAR": ("낚시", "수영", "스노클", "튜브", "자전거", "킥보드", "서핑보드", "스틱", "구명조끼"),
+    "CAMPING_GEAR": ("캠핑", "텐트", "타프", "침낭", "랜턴", "버너", "코펠", "아이스박스", "그늘막", "캠핑의자"),
+    "BEDDING": ("이불", "베개", "침구", "매트리스", "토퍼", "침대패드", "담요", "이불커버"),
+    "FURNITURE": ("의자", "책상", "테이블", "소파", "선반", "수납장", "서랍", "옷장", "침대", "행거"),
+    "DECOR": ("무드등", "액자", "조화", "캔들", "디퓨저", "포스터", "인테리어", "시계", "화병", "장식"),
+    "CAT_SUPPLIES": ("고양이", "캣타워", "스크래쳐", "고양이모래", "캣닢", "츄르"),
+    "DOG_SUPPLIES": ("강아지", "애견", "반려견", "하네스", "리드줄", "배변패드", "개껌"),
+    "CLEANING_SUPPLIES": ("청소", "걸레", "물걸레", "청소포", "청소솔", "세정제", "빗자루", "먼지", "밀대"),
+    "HOME_ESSENTIALS": ("수건", "휴지", "우산", "세탁", "건조대", "옷걸이", "욕실", "칫솔", "치약", "방향제"),
+    "CAR_INTERIOR_AND_CARE": ("차량용", "자동차", "시트커버", "블랙박스", "핸들커버", "카시트", "트렁크"),
+    "CAR_WASH_AND_DETAILING": ("세차", "왁스", "광택", "카샴푸", "유리막", "세차타월"),
+    "MOTORCYCLE_GEAR": ("오토바이", "바이크", "헬멧", "라이딩", "스쿠터", "바이크장갑"),
+    "OFFICE_SUPPLIES": ("볼펜", "필기구", "수첩", "다이어리", "파일", "스테이플러", "포스트잇", "문구", "형광펜", "사무용"),
+    "COOKWARE_AND_UTENSILS": ("냄비", "프라이팬", "칼", "식칼", "도마", "주걱", "국자", "뒤집개", "웍", "숫돌"),
+    "KITCHEN_ACCESSORIES": ("텀블러", "물병", "컵", "머그", "밀폐용기", "도시락", "수저", "식판", "앞치마", "행주"),
+    "HOME_APPLIANCES": ("가습기", "제습기", "선풍기", "히터", "공기청정기", "청소기", "다리미", "전기장판"),
+    "KITCHEN_APPLIANCES": ("에어프라이어", "전기포트", "믹서기", "블렌더", "커피머신", "전자레인지", "토스터", "밥솥"),
+    "BEAUTY_AND_GROOMING_DEVICES": ("드라이기", "고데기", "면도기", "제모기", "마사지기", "클렌저", "미용", "이발기", "안마기"),
+    "BABY_PRODUCTS": ("유아", "아기", "신생아", "기저귀", "젖병", "이유식", "턱받이", "유모차", "아동"),
+    "TOYS_AND_HOBBIES": ("장난감", "블록", "퍼즐", "피규어", "인형", "프라모델", "보드게임", "레고", "rc"),
+    "ETC": (),
+}
+
+TITLE_WEIGHT = 2.0
+BIGRAM_WEIGHT = 0.5
+# 사전 적중 점수가 이 값 이상이면 적중 강도 측면에서는 완전히 확신한다고 본다
+STRONG_SCORE = 4.0
+
+
+@dataclass
+class CategoryPrediction:
+    """분류 결과."""
+
+    category: str
+    confidence: float
+    source: str  # local | llm
+
+
+class CategoryStats:
+    """로컬 분류기 적중/LLM 호출 통계 (프로세스 전역)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.total = 0
+        self.local_only = 0
+        self.llm_calls = 0
+        self.llm_fallbacks = 0
+        self.compared = 0
+        self.agreed = 0
+
+    def record(self, *, local: CategoryPrediction, llm_label: Optional[str]) -> None:
+        with self._lock:
+            self.total += 1
+            if llm_label is None:
+                self.local_only += 1
+                return
+            self.llm_calls += 1
+            self.compared += 1
+            if llm_label == local.category:
+                self.agreed += 1
+
+    def record_llm_fallback(self) -> None:
+        """LLM을 불렀지만 유효한 라벨을 받지 못해 로컬 예측을 쓴 경우 (정확도 비교에서 제외)."""
+        with self._lock:
+            self.total += 1
+            self.llm_calls += 1
+            self.llm_fallbacks += 1
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "total": self.total,
+                "llm_calls": self.llm_calls,
+                "llm_fallbacks": self.llm_fallbacks,
+                "llm_avoided_rate": (self.local_only / self.total) if self.total else 0.0,
+                "local_accuracy": (self.agreed / self.compared) if self.compared else 0.0,
+            }
+
+
+CATEGORY_STATS = CategoryStats()
+
+
+def _load_categories(path: Path = CATEGORY_FILE) -> list[tuple[str, str]]:
+    """카테고리 목록을 [id, 설명] 리스트로 읽는다.
+
+    마크다운 표(| ID | NAME | 설명 |)와 공백 구분(ID 설명) 형식을 모두 지원한다.
+    """
+    categories: list[tuple[str, str]] = []
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                raw = line.strip()
+                if not raw or raw.startswith("#"):
+                    continue
+                if raw.startswith("|"):
+                    cells = [c.strip() for c in raw.strip("|").split("|")]
+                    # 헤더/구분선 행은 ID가 숫자가 아니므로 건너뛴다
+                    if not cells or not cells[0].isdigit():
+                        continue
+                    categories.append((cells[0], " ".join(c for c in cells[1:] if c)))
+                    continue
+                parts = raw.split(maxsplit=1)
+                if not parts:
+                    continue
+                cat_id = parts[0]
+                desc = parts[1] if len(parts) > 1 else ""
+                categories.append((cat_id, desc))
+    except FileNotFoundError:
+        return []
+    return categories
+
+
+def _bigrams(text: str) -> set[str]:
+    return {t for t in tokenize(text, sizes=(2,)) if len(t) == 2}
+
+
+class LocalCategoryClassifier:
+    """키워드 사전 + 문자 bigram 유사도 기반 로컬 분류기."""
+
+    def __init__(
+        self,
+        categories: list[tuple[str, str]],
+        keywords: dict[str, tuple[str, ...]] | None = None,
+    ):
+        self.categories = categories
+        keywords = keywords if keywords is not None else CATEGORY_KEYWORDS
+        self._profiles: list[tuple[str, tuple[str, ...], set[str]]] = []
+        for cat_id, desc in categories:
+            name = desc.split()[0] if desc else ""
+            words = tuple(w.lower() for w in keywords.get(name, ()))
+            label_text = " ".join(desc.split()[1:]) if desc else ""
+            grams = _bigrams(" ".join((label_text,) + words))
+            self._profiles.append((cat_id, words, grams))
+        self.fallback = next(
+            (cid for cid, desc in categories if desc.split()[:1] == ["ETC"]),
+            categories[-1][0] if categories else "0",
+        )
+
+    def classify(self, product: SsadaguProduct) -> CategoryPrediction:
+        if not self._profiles:
+            return CategoryPrediction(self.fallback, 0.0, "local")
+        title = (product.title or "").lower()
+        specs = " ".join(f"{k} {v}" for k, v in (product.detail_specs or {}).items()).lower()
+        product_grams = _bigrams(f"{title} {specs}")
+
+        scored: list[tuple[float, str]] = []
+        for cat_id, words, grams in self._profiles:
+            score = 0.0
+            for word in words:
+                if word in title:
+                    score += TITLE_WEIGHT
+                elif word in specs:
+                    score += 1.0
+            if grams and product_grams:
+                score += BIGRAM_WEIGHT * len(grams & product_grams) / len(product_grams)
+            scored.append((score, cat_id))
+        scored.sort(key=lambda x: -x[0])
+
+        top_score, top_id = scored[0]
+        second = scored[1][0] if len(scored) > 1 else 0.0
+        if top_score <= 0.0:
+            return CategoryPrediction(self.fallback, 0.0, "local")
+        # 신뢰도 = 적중 강도 × 2위와의 격차 비율
+        strength = min(1.0, top_score / STRONG_SCORE)
+        margin = (top_score - second) / top_score
+        return CategoryPrediction(top_id, round(strength * margin, 4), "local")
+
+
+class CategoryClassifier:
+    """로컬 분류기를 먼저 쓰고 신뢰도가 낮을 때만 LLM으로 분류한다."""
+
+    def __init__(
+        self,
+        llm: LLMService,
+        *,
+        categories: list[tuple[str, str]] | None = None,
+        threshold: float | None = None,
+        shadow_rate: float | None = None,
+        stats: CategoryStats | None = None,
+    ):
+        self.llm = llm
+        self.categories = categories if categories is not None else _load_categories()
+        self.local = LocalCategoryClassifier(self.categories)
+        self.threshold = config.get_category_local_threshold(threshold)
+        self.shadow_rate = config.get_category_shadow_rate(shadow_rate)
+        self.stats = stats or CATEGORY_STATS
+
+    def predict_local(self, product: SsadaguProduct) -> tuple[CategoryPrediction, bool]:
+        """로컬 예측과 그 결과를 그대로 써도 되는지 여부를 반환한다."""
+        local = self.local.classify(product)
+        # 확신 구간도 shadow_rate 비율만큼은 LLM 라벨과 비교해 정확도를 측정한다
+        accept = local.confidence >= self.threshold and random.random() >= self.shadow_rate
+        return local, accept
+
+    def is_valid(self, category: str) -> bool:
+        return any(cid == category for cid, _ in self.categories)
+
+    async def classify(
+        self, product: SsadaguProduct, llm_setting: LlmSetting | None = None
+    ) -> CategoryPrediction:
+        local, accept = self.predict_local(product)
+        if accept:
+            self.stats.record(local=local, llm_label=None)
+            return local
+        return await self.classify_with_llm(product, llm_setting, local=local)
+
+    async def classify_with_llm(
+        self,
+        product: SsadaguProduct,
+        llm_setting: LlmSetting | None = None,
+        *,
+        local: CategoryPrediction | None = None,
+    ) -> CategoryPrediction:
+        """LLM으로 분류하고 로컬 예측과의 일치 여부를 통계에 남긴다.
+
+        라벨이 목록에 없거나 호출이 실패하면 로컬 예측(source "local")을 반환한다.
+        """
+        local = local or self.local.classify(product)
+        llm_label = await _classify_category(product, self.llm, llm_setting, self.categories)
+        if llm_label is None:
+            self.stats.record_llm_fallback()
+            return local
+        return self.record_llm_label(local, llm_label)
+
+    def record_llm_label(self, local: CategoryPrediction, llm_label: str) -> CategoryPrediction:
+        """LLM 라벨이 유효하면 통계에 남기고 채택한다. 목록에 없는 ID면 로컬 예측을 쓴다."""
+        if not self.is_valid(llm_label):
+            self.stats.record_llm_fallback()
+            return local
+        self.stats.record(local=local, llm_label=llm_label)
+        return CategoryPrediction(llm_label, 1.0, "llm")
+
+
+def _category_prompt(product: SsadaguProduct, categories: list[tuple[str, str]]) -> str:
+    lines = "\n".join([f"- {cid}: {desc}" for cid, desc in categories])
+    specs = product_spec_lines(product)
+    price_text = f"{product.price}" if product.price is not None else "알 수 없음"
+    return f"""상품 정보를 보고 아래 카테고리 중 하나를 골라 JSON(category)로만 알려줘.
+카테고리 목록:
+{lines}
+
+상품:
+- 이름: {product.title}
+- 가격: {price_text}
+- 링크: {product.product_link}
+- 썸네일: {product.thumbnail_link or '없음'}
+- 스펙:
+{specs}
+"""
+
+
+async def _classify_category(
+    product: SsadaguProduct,
+    llm: LLMService,
+    llm_setting: LlmSetting | None,
+    categories: list[tuple[str, str]],
+) -> Optional[str]:
+    """LLM이 고른 카테고리 ID. 응답이 비었거나 형식 오류면 None (목록 검증은 호출자가 한다)."""
+    if not categories:
+        return None
+    system_prompt = "주어진 상품에 가장 적합한 카테고리를 선택하고 JSON으로 반환한다. 출력은 {\"category\": \"카테고리ID\"} 한 개만 포함한다."
+    user_input = _category_prompt(product, categories)
+    try:
+        parsed = await llm.chat_structured(
+            system_prompt,
+            user_input,
+            CategoryOutput,
+            model=llm_setting.modelName if llm_setting else None,
+            temperature=llm_setting.temperature if llm_setting else None,
+            api_key=llm_setting.apiKey if llm_setting else None,
+            max_tokens=llm_setting.maxTokens if llm_setting else None,
+            stage="category",
+            hedge=True,
+        )
+        if parsed.category.strip():
+            return parsed.category.strip()
+    except LLMOutputError:
+        pass
+    return None
@@ -0,0 +1,174 @@
+"""실시간성이 필요 없는 LLM 작업을 뒤로 미루는 지연 생성 큐.
+
+MANUAL 작업(사용자가 검토 후 게시)은 결과가 바로 필요하지 않으므로 홍보글/카테고리
+생성을 이 큐로 보낼 수 있다(WRITE_DEFER_MANUAL, 기본 꺼짐). 큐 작업은 llm_limiter의
+낮은 우선순위 레인으로 실행되어 AUTO 작업의 실시간 호출에 동시성 여유를 양보한다.
+
+큐는 메모리에만 있으므로 WRITE_DEFERRED_QUEUE_SIZE로 크기를 제한하고(가득 차면 submit이
+False를 돌려 호출자가 바로 처리), 종료 시 aclose()가 제한 시간까지 남은 작업을 처리한 뒤
+처리하지 못한 작업을 작업별로 로그에 남긴다. 통계는 /stats의 deferred로 노출된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+from app import config
+from app.logs import log_nowait
+from app.services.llm_limiter import low_priority
+
+logger = logging.getLogger(__name__)
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+
+class DeferredQueue:
+    """이벤트 루프별 유한 asyncio.Queue와 고정 수의 워커로 지연 작업을 처리한다."""
+
+    def __init__(self, workers: Optional[int] = None, max_size: Optional[int] = None):
+        self._workers_override = workers
+        self._max_size_override = max_size
+        # 루프 id -> (루프, 큐, 워커 task). 워커 task가 GC되지 않도록 강한 참조를 유지한다
+        self._lanes: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Queue, list[asyncio.Task]]] = {}
+        self._lock = threading.Lock()
+        # 실행 중인 (작업 이름, jobId) (종료 시 중단된 작업을 로그로 남기기 위함)
+        self._active: set[tuple[str, str]] = set()
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.dropped = 0
+
+    def _lane(self, create: bool = True):
+        loop = asyncio.get_running_loop()
+        key = id(loop)
+        with self._lock:
+            # 닫힌 루프(테스트의 asyncio.run 등)의 큐는 버린다
+            for stale in [k for k, lane in self._lanes.items() if lane[0].is_closed()]:
+                del self._lanes[stale]
+            lane = self._lanes.get(key)
+            if lane is not None and lane[0] is not loop:
+                lane = None
+            if lane is None and create:
+                queue: asyncio.Queue = asyncio.Queue(
+                    maxsize=max(1, config.get_write_deferred_queue_size(self._max_size_override))
+                )
+                workers = max(1, config.get_write_deferred_workers(self._workers_override))
+                tasks = [
+                    loop.create_task(self._worker(queue), name=f"deferred-worker-{i}")
+                    for i in range(workers)
+                ]
+                lane = (loop, queue, tasks)
+                self._lanes[key] = lane
+        return lane
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            name, job_id, factory, context = await queue.get()
+            with self._lock:
+                self.running += 1
+                self._active.add((name, job_id))
+            try:
+                # 작업마다 submit 시점의 contextvars(사용량 장부 등)로 실행한다
+                await loop.create_task(self._run(factory), name=name, context=context)
+            except Exception:
+                logger.exception("지연 작업 실패: %s", name)
+                with self._lock:
+                    self.failed += 1
+            else:
+                with self._lock:
+                    self.completed += 1
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self._active.discard((name, job_id))
+                queue.task_done()
+
+    @staticmethod
+    async def _run(factory: JobFactory) -> None:
+        with low_priority():
+            await factory()
+
+    def has_room(self) -> bool:
+        """현재 루프의 큐에 작업을 더 넣을 수 있으면 True."""
+        lane = self._lane(create=False)
+        return lane is None or not lane[1].full()
+
+    def submit(self, name: str, factory: JobFactory, *, job_id: str = "") -> bool:
+        """작업을 큐에 넣는다. factory는 워커에서 호출되어 코루틴을 만든다.
+
+        큐가 가득 차 넣지 못했으면 False (호출자가 바로 처리한다).
+        """
+        queue = self._lane()[1]
+        try:
+            queue.put_nowait((name, job_id, factory, contextvars.copy_context()))
+        except asyncio.QueueFull:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.submitted += 1
+        return True
+
+    async def join(self) -> None:
+        """현재 루프의 큐가 빌 때까지 기다린다 (테스트/종료 시)."""
+        await self._lane()[1].join()
+
+    async def aclose(self, timeout: Optional[float] = None) -> int:
+        """timeout초까지 남은 작업을 처리하고, 못 한 작업은 로그로 남긴 뒤 워커를 멈춘다.
+
+        처리하지 못하고 버린 작업 수를 반환한다 (앱 종료 시).
+        """
+        lane = self._lane(create=False)
+        if lane is None:
+            return 0
+        loop, queue, tasks = lane
+        timeout = config.get_background_task_shutdown_timeout(timeout)
+        try:
+            await asyncio.wait_for(queue.join(), max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+        lost: list[tuple[str, str]] = []
+        while not queue.empty():
+            name, job_id, _, _ = queue.get_nowait()
+            queue.task_done()
+            lost.append((name, job_id))
+        with self._lock:
+            lost.extend(self._active)
+            self._lanes.pop(id(loop), None)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for name, job_id in lost:
+            logger.warning("종료로 지연 작업 유실: %s", name)
+            log_nowait(
+                level="ERROR",
+                message="지연 작업 유실(종료)",
+                submessage=name,
+                logged_process="write",
+                job_id=job_id,
+            )
+        with self._lock:
+            self.dropped += len(lost)
+        return len(lost)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "queued": sum(lane[1].qsize() for lane in self._lanes.values()),
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "dropped": self.dropped,
+            }
+
+
+DEFERRED_QUEUE = DeferredQueue()
@@ -0,0 +1,221 @@
+"""오프라인 벤치마크/테스트용 결정적 가짜 LLM 백엔드.
+
+ChatOpenAI 대신 LLMService.client로 쓰이며 ainvoke/astream/bind를 흉내 낸다.
+response_format의 스키마 이름(KeywordRefineOutput, RelevanceOutput 등)으로
+프롬프트 종류를 판별해 스키마에 맞는 응답을 만들고, 지연 시간(로그정규 분포),
+일시 오류, 429(Retry-After 포함)를 설정한 비율로 주입한다.
+
+같은 seed와 같은 프롬프트(및 그 프롬프트의 n번째 호출)에는 항상 같은 지연/응답/오류가
+나오므로 호출 순서가 달라도 결과가 재현된다.
+
+    LLM_BACKEND=fake LLM_FAKE_LATENCY_MS=800 uvicorn app.main:app
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Optional
+
+from app import config
+
+try:
+    from langchain_core.messages import AIMessage, AIMessageChunk
+except ImportError:  # pragma: no cover - optional dependency
+    AIMessage = None  # type: ignore
+    AIMessageChunk = None  # type: ignore
+
+_NAME_LINE = re.compile(r"^\s*-\s*이름:\s*(.+)$", re.MULTILINE)
+_INDEX_LINE = re.compile(r"^\[(\d+)\]\s*$", re.MULTILINE)
+_LIST_LINE = re.compile(r"^\s*-\s*(.+)$", re.MULTILINE)
+_KEYWORD_LINE = re.compile(r"^키워드:\s*(.+)$", re.MULTILINE)
+
+
+class FakeLLMError(RuntimeError):
+    """주입된 오류. status_code/response.headers는 openai 예외와 같은 모양이다."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"fake llm error {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": f"{retry_after:.3f}"} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+@dataclass(frozen=True)
+class FakeLLMProfile:
+    """지연/오류 주입 설정."""
+
+    latency_ms: float = 800.0
+    # 로그정규 분포의 sigma. 0이면 항상 latency_ms
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMProfile":
+        return cls(
+            latency_ms=config.get_llm_fake_latency_ms(),
+            latency_sigma=config.get_llm_fake_latency_sigma(),
+            error_rate=config.get_llm_fake_error_rate(),
+            rate_limit_rate=config.get_llm_fake_rate_limit_rate(),
+            seed=config.get_llm_fake_seed(),
+        )
+
+
+class FakeChatModel:
+    """ChatOpenAI 호환 최소 인터페이스의 가짜 모델."""
+
+    def __init__(
+        self,
+        profile: Optional[FakeLLMProfile] = None,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+        _shared: Optional[dict[str, Any]] = None,
+    ):
+        self.profile = profile or FakeLLMProfile.from_env()
+        self.response_format = response_format
+        # bind()로 만든 사본도 호출 횟수/통계를 공유한다
+        self._shared = _shared or {"seen": Counter(), "lock": threading.Lock(), "stats": Counter()}
+
+    def bind(self, **kwargs: Any) -> "FakeChatModel":
+        return FakeChatModel(
+            self.profile, response_format=kwargs.get("response_format"), _shared=self._shared
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return dict(self._shared["stats"])
+
+    def _rng(self, system_prompt: str, user_input: str) -> random.Random:
+        digest = hashlib.sha256(f"{system_prompt}\x00{user_input}".encode("utf-8")).hexdigest()
+        with self._shared["lock"]:
+            occurrence = self._shared["seen"][digest]
+            self._shared["seen"][digest] += 1
+        return random.Random(f"{self.profile.seed}:{digest}:{occurrence}")
+
+    async def _prepare(self, messages: list[Any]) -> tuple[str, random.Random]:
+        system_prompt = str(getattr(messages[0], "content", "")) if messages else ""
+        user_input = str(getattr(messages[-1], "content", "")) if messages else ""
+        rng = self._rng(system_prompt, user_input)
+        profile = self.profile
+        latency = profile.latency_ms / 1000.0
+        if profile.latency_sigma > 0:
+            latency *= math.exp(rng.gauss(0.0, profile.latency_sigma))
+        roll = rng.random()
+        stats = self._shared["stats"]
+        if roll < profile.rate_limit_rate:
+            stats["rate_limited"] += 1
+            # 429는 보통 즉시 돌아온다
+            await asyncio.sleep(min(latency, 0.05))
+            raise FakeLLMError(429, retry_after=profile.retry_after)
+        await asyncio.sleep(latency)
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            stats["errors"] += 1
+            raise FakeLLMError(500)
+        stats["calls"] += 1
+        return _answer(self._schema_name(), user_input, rng), rng
+
+    def _schema_name(self) -> str:
+        fmt = self.response_format or {}
+        return (fmt.get("json_schema") or {}).get("name", "")
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> Any:
+        answer, _ = await self._prepare(messages)
+        return _message(answer, messages, AIMessage)
+
+    async def astream(self, messages: list[Any], **kwargs: Any) -> AsyncIterator[Any]:
+        answer, _ = await self._prepare(messages)
+        for start in range(0, len(answer), 16):
+            yield _message(answer[start : start + 16], [], AIMessageChunk)
+            await asyncio.sleep(0)
+        yield _message("", messages, AIMessageChunk, answer=answer)
+
+
+def _message(content: str, messages: list[Any], cls: Any, *, answer: Optional[str] = None) -> Any:
+    usage = None
+    if messages:
+        prompt = sum(len(str(getattr(m, "content", ""))) for m in messages)
+        completion = len(answer if answer is not None else content)
+        # 한글 위주 텍스트 기준 대략 2글자 ≈ 1토큰
+        usage = {
+            "input_tokens": prompt // 2,
+            "output_tokens": completion // 2,
+            "total_tokens": (prompt + completion) // 2,
+        }
+    if cls is None:
+        return SimpleNamespace(content=content, usage_metadata=usage)
+    return cls(content=content, usage_metadata=usage) if usage else cls(content=content)
+
+
+def _overlap(keyword: str, title: str) -> float:
+    from app.services.ranking import tokenize
+
+    query = set(tokenize(keyword))
+    if not query:
+        return 0.0
+    return len(query & set(tokenize(title))) / len(query)
+
+
+def _relevance(keyword: str, title: str, rng: random.Random) -> float:
+    """키워드-상품명 어휘 겹침에 잡음을 더한 점수 (실제 LLM 판정과 비슷한 분포)."""
+    return round(max(0.0, min(1.0, 0.15 + 0.85 * _overlap(keyword, title) + rng.uniform(-0.15, 0.15))), 2)
+
+
+@lru_cache(maxsize=1)
+def _local_classifier() -> Any:
+    # category 모듈이 llm 모듈을 import하므로 지연 import
+    from app.services.category import LocalCategoryClassifier, _load_categories
+
+    return LocalCategoryClassifier(_load_categories())
+
+
+def _category(title: str) -> str:
+    from app.schemas.products import SsadaguProduct
+
+    product = SsadaguProduct(title=title or "상품", product_link="https://ssadagu.kr/fake")
+    return _local_classifier().classify(product).category
+
+
+def _answer(schema: str, user_input: str, rng: random.Random) -> str:
+    names = _NAME_LINE.findall(user_input)
+    title = names[0].strip() if names else ""
+    keyword_match = _KEYWORD_LINE.search(user_input)
+    keyword = keyword_match.group(1).strip() if keyword_match else ""
+
+    if schema == "KeywordRefineOutput":
+        trends = [line.strip() for line in _LIST_LINE.findall(user_input)]
+        chosen = trends[0] if trends else "키워드"
+        return json.dumps(
+            {"keyword": chosen, "real_keyword": chosen, "reason": "가짜 응답"}, ensure_ascii=False
+        )
+    if schema == "RelevanceOutput":
+        return json.dumps(
+            {"score": _relevance(keyword, title, rng), "reason": "가짜 응답"}, ensure_ascii=False
+        )
+    if schema == "RelevanceBatchOutput":
+        indices = [int(i) for i in _INDEX_LINE.findall(user_input)] or list(range(len(names)))
+        results = [
+            {"index": idx, "score": _relevance(keyword, name, rng), "reason": "가짜 응답"}
+            for idx, name in zip(indices, names)
+        ]
+        return json.dumps({"results": results}, ensure_ascii=False)
+    if schema in {"PromoOutput", "PromoWithCategoryOutput"}:
+        body = f"{title} 추천합니다. " * rng.randint(20, 40)
+        payload: dict[str, Any] = {"title": f"{title} 솔직 후기", "body": body.strip()}
+        if schema == "PromoWithCategoryOutput":
+            payload["category"] = _category(title)
+        return json.dumps(payload, ensure_ascii=False)
+    if schema == "CategoryOutput":
+        return json.dumps({"category": _category(title)}, ensure_ascii=False)
+    return f"[fake] {user_input[:200]}"
@@ -0,0 +1,115 @@
+"""짧고 멱등한 LLM 호출의 꼬리 지연을 줄이는 요청 헤징.
+
+(모델, 단계)별로 최근 응답 시간을 모아 p90을 추정하고, 그 시간 안에 응답이 없으면
+같은 요청을 한 번 더 보내 먼저 끝난 쪽을 쓴다. 응답 시간은 승인 제어(llm_limiter)를
+통과한 시점부터 잰다. 헤지 비율은 상한을 넘지 않도록 제한하며 통계는
+/api/llm/metrics로 노출된다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Optional
+
+from app import config
+
+# p90 추정에 쓰는 최근 표본 수와, 헤징을 시작하기 위한 최소 표본 수
+WINDOW = 200
+MIN_SAMPLES = 20
+
+
+class HedgeCall:
+    """start_call()이 돌려주는 호출 하나의 기록. try_hedge()에 넘겨 헤지 여부를 표시한다."""
+
+    __slots__ = ("hedged",)
+
+    def __init__(self) -> None:
+        self.hedged = False
+
+
+class HedgeTracker:
+    """지연 표본과 헤지 횟수를 관리한다."""
+
+    def __init__(self, *, max_rate: float, window: int = WINDOW, min_samples: int = MIN_SAMPLES):
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        # 최근 window개 호출 기록 (비율 상한 계산용)
+        self._recent: deque[HedgeCall] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p90(self) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
+    def start_call(self) -> tuple[Optional[float], HedgeCall]:
+        """호출 시작을 기록하고 (헤지 대기 시간(p90), 호출 기록)을 반환한다.
+
+        표본이 부족하면 대기 시간은 None.
+        """
+        delay = self.p90()
+        call = HedgeCall()
+        with self._lock:
+            self.calls += 1
+            self._recent.append(call)
+        return delay, call
+
+    def try_hedge(self, call: HedgeCall) -> bool:
+        """비율 상한 안이면 call의 헤지를 허용하고 기록한다."""
+        with self._lock:
+            recent_hedges = sum(1 for recent in self._recent if recent.hedged)
+            if recent_hedges + 1 > self.max_rate * max(len(self._recent), 1):
+                return False
+            # 그 사이 시작된 다른 호출이 아니라 이 호출을 표시한다
+            call.hedged = True
+            self.hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> dict[str, Any]:
+        p90 = self.p90()
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_rate": self.hedged / self.calls if self.calls else 0.0,
+                "hedge_wins": self.hedge_wins,
+                "p90_ms": round(p90 * 1000, 1) if p90 is not None else None,
+            }
+
+
+_trackers: dict[tuple[str, str], HedgeTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_tracker(model: str, stage: str) -> HedgeTracker:
+    with _trackers_lock:
+        tracker = _trackers.get((model, stage))
+        if tracker is None:
+            tracker = HedgeTracker(max_rate=config.get_llm_hedge_max_rate())
+            _trackers[(model, stage)] = tracker
+        return tracker
+
+
+def hedge_stats() -> dict[str, dict[str, Any]]:
+    with _trackers_lock:
+        return {f"{model}:{stage}": t.stats() for (model, stage), t in _trackers.items()}
+
+
+def reset_trackers() -> None:
+    with _trackers_lock:
+        _trackers.clear()
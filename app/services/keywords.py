@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from typing import Optional
 
 from app.logs import async_send_log
 from app.prompts.keywords import get_system_prompt
+from app.schemas.keywords import KeywordRefineOutput
 from app.schemas.llm import LlmSetting
-from app.services.llm import LLMService
-from app.services.text_cleaner import try_repair_json
+from app.services.llm import LLMOutputError, LLMService
 
 
 class KeywordService:
@@ -43,25 +42,24 @@ class KeywordService:
             logged_process="keywords",
             job_id=job_id or "",
         )
-        answer = await self.llm.chat(
-            system_prompt=system_prompt,
-            user_input=user_input,
-            model=llm_setting.modelName if llm_setting else None,
-            temperature=llm_setting.temperature if llm_setting else None,
-            api_key=llm_setting.apiKey if llm_setting else None,
-        )
-        cleaned_answer = try_repair_json(answer) or answer
-
         default_keyword = trends[0] if trends else ""
-        real_keyword = default_keyword
-        reason = cleaned_answer.strip()
         try:
-            parsed = json.loads(cleaned_answer)
-            real_keyword = parsed.get("real_keyword") or parsed.get("keyword") or real_keyword
-            reason = parsed.get("reason", reason) or reason
-            keyword_out = parsed.get("keyword", default_keyword) or default_keyword
-        except Exception:
-            keyword_out = default_keyword
+            parsed = await self.llm.chat_structured(
+                system_prompt,
+                user_input,
+                KeywordRefineOutput,
+                model=llm_setting.modelName if llm_setting else None,
+                temperature=llm_setting.temperature if llm_setting else None,
+                api_key=llm_setting.apiKey if llm_setting else None,
+                max_tokens=llm_setting.maxTokens if llm_setting else None,
+                stage="keyword",
+            )
+            keyword_out = parsed.keyword or default_keyword
+            real_keyword = parsed.real_keyword or parsed.keyword or default_keyword
+            reason = parsed.reason
+        except LLMOutputError as exc:
+            keyword_out = real_keyword = default_keyword
+            reason = exc.raw
 
         await send_log_async_safe(
             message="트렌드 키워드 → 검색어 변환 완료",
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import copy
+import functools
+import hashlib
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
 
 try:
     from langchain_core.messages import HumanMessage, SystemMessage
@@ -12,22 +20,97 @@ except ImportError:  # pragma: no cover - optional dependency for tests
     SystemMessage = None  # type: ignore
     ChatOpenAI = None  # type: ignore
 
-from app.config import get_openai_api_key
+from app.config import (
+    get_llm_backend,
+    get_llm_hedge_enabled,
+    get_llm_rate_limit_retries,
+    get_openai_api_key,
+)
+from app.services.fake_llm import FakeChatModel
+from app.services.hedging import HedgeTracker, get_tracker
+from app.services.llm_cache import LLMResponseCache, get_default_cache, make_cache_key
+from app.services.llm_limiter import (
+    MAX_BACKOFF,
+    AdmissionController,
+    estimate_tokens,
+    get_controller,
+    is_transient_error,
+    rate_limit_retry_after,
+)
+from app.services.singleflight import LLM_SINGLE_FLIGHT
+from app.services.text_cleaner import try_repair_json
+from app.services.usage import TokenUsage, record_usage, usage_from_message
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class LLMOutputError(ValueError):
+    """구조화 출력이 스키마에 맞지 않을 때 발생. raw에 마지막 원문 응답을 담는다."""
+
+    def __init__(self, message: str, raw: str = ""):
+        super().__init__(message)
+        self.raw = raw
 
 
 class LLMService:
     """시스템 프롬프트와 사용자 입력을 받아 답변을 생성한다."""
 
-    def __init__(self, model: str | None = None, temperature: float | None = None, api_key: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        temperature: float | None = None,
+        api_key: str | None = None,
+        cache: LLMResponseCache | None = None,
+        max_tokens: int | None = None,
+        backend: str | None = None,
+    ):
         self.model = model or "gpt-4o-mini"
         self.temperature = temperature if temperature is not None else 0.5
+        self.max_tokens = max_tokens
+        self.backend = get_llm_backend(backend)
+        # 캐시는 opt-in: 명시적으로 넘기거나 LLM_CACHE_ENABLED=true일 때만 사용
+        self.cache = cache if cache is not None else get_default_cache()
+        if self.backend == "fake":
+            # 오프라인 벤치마크/테스트: OpenAI 대신 결정적 가짜 모델
+            self.api_key = api_key or "fake"
+            self.client = FakeChatModel()
+            return
         self.api_key = api_key or get_openai_api_key()
+        # SDK 내부 재시도는 끄고 _invoke가 전역 승인 제어와 함께 재시도한다
         self.client = (
-            ChatOpenAI(model=self.model, temperature=self.temperature, api_key=self.api_key)
+            ChatOpenAI(
+                model=self.model,
+                temperature=self.temperature,
+                api_key=self.api_key,
+                max_tokens=self.max_tokens,
+                max_retries=0,
+            )
             if ChatOpenAI is not None
             else None
         )
 
+    def _cache_key(
+        self,
+        system_prompt: str,
+        user_input: str,
+        *,
+        model: Optional[str],
+        temperature: Optional[float],
+        response_schema: Optional[type[BaseModel]],
+        max_tokens: Optional[int] = None,
+        api_key: Optional[str] = None,
+    ) -> str:
+        # 키/테넌트가 다른 호출끼리 응답을 공유하지 않도록 API Key 지문을 넣는다
+        return make_cache_key(
+            system_prompt=system_prompt,
+            user_input=user_input,
+            model=model or self.model,
+            key=_key_fingerprint(api_key or self.api_key),
+            temperature=self.temperature if temperature is None else temperature,
+            schema=response_schema.__name__ if response_schema else None,
+            max_tokens=max_tokens or self.max_tokens,
+        )
+
     async def chat(
         self,
         system_prompt: str,
@@ -36,21 +119,348 @@ class LLMService:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         api_key: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        response_schema: Optional[type[BaseModel]] = None,
+        stage: str = "chat",
+        hedge: bool = False,
     ) -> str:
-        """LLM 호출."""
+        """LLM 호출. use_cache=False면 캐시를 건너뛰고 새로 생성한다.
+
+        response_schema를 주면 OpenAI JSON schema 모드로 출력 형식을 강제한다.
+        토큰 사용량은 stage 이름으로 현재 작업 장부(app.services.usage)에 기록된다.
+        hedge=True는 짧고 멱등한 호출용으로, LLM_HEDGE_ENABLED일 때 관측 p90까지
+        응답이 없으면 중복 요청을 보내 먼저 끝난 응답을 쓴다.
+        """
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(
+                system_prompt,
+                user_input,
+                model=model,
+                temperature=temperature,
+                response_schema=response_schema,
+                max_tokens=max_tokens,
+                api_key=api_key,
+            )
+        if cache_key is not None and self.cache is not None:
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                record_usage(stage, TokenUsage(cache_hits=1))
+                return cached
+
+        async def _generate() -> str:
+            client = self._client(
+                model=model, temperature=temperature, api_key=api_key, max_tokens=max_tokens
+            )
+            if response_schema is not None:
+                client = client.bind(response_format=_response_format(response_schema))
+
+            invoke = functools.partial(
+                self._invoke,
+                client,
+                _messages(system_prompt, user_input),
+                model=model or self.model,
+                api_key=api_key or self.api_key,
+                tokens=estimate_tokens(
+                    system_prompt, user_input, max_tokens=max_tokens or self.max_tokens
+                ),
+            )
+            if hedge and get_llm_hedge_enabled():
+                response = await _hedged(
+                    invoke,
+                    get_tracker(model or self.model, stage),
+                    get_controller(model or self.model, api_key or self.api_key),
+                )
+            else:
+                response = await invoke()
+            record_usage(stage, usage_from_message(response))
+            answer = response.content
+            if cache_key is not None and self.cache is not None:
+                await self.cache.aset(cache_key, answer)
+            return answer
+
+        if cache_key is None:
+            # 재요청(use_cache=False)은 새 응답이 목적이므로 병합하지 않는다
+            return await _generate()
+        # 같은 프롬프트가 동시에 들어오면 진행 중인 호출 하나를 공유한다
+        # (캐시 키에 API Key 지문이 들어 있어 키별로 분리된다)
+        answer, shared = await LLM_SINGLE_FLIGHT.do(cache_key, _generate)
+        if shared:
+            record_usage(stage, TokenUsage(coalesced=1))
+        return answer
+
+    async def astream(
+        self,
+        system_prompt: str,
+        user_input: str,
+        *,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        api_key: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        stage: str = "chat",
+    ) -> AsyncIterator[str]:
+        """토큰(청크) 단위로 답변을 흘려보낸다. 캐시 적중 시 전체 답변을 한 번에 내보낸다."""
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = self._cache_key(
+                system_prompt,
+                user_input,
+                model=model,
+                temperature=temperature,
+                response_schema=None,
+                max_tokens=max_tokens,
+                api_key=api_key,
+            )
+            cached = await self.cache.aget(cache_key)
+            if cached is not None:
+                record_usage(stage, TokenUsage(cache_hits=1))
+                yield cached
+                return
+
+        client = self._client(
+            model=model, temperature=temperature, api_key=api_key, max_tokens=max_tokens
+        )
+        parts: list[str] = []
+        usage = TokenUsage(calls=1)
+        controller = get_controller(model or self.model, api_key or self.api_key)
+        tokens = estimate_tokens(system_prompt, user_input, max_tokens=max_tokens or self.max_tokens)
+        async with controller.slot(tokens) as slot:
+            try:
+                # stream_usage=True면 마지막 청크에 usage_metadata가 실려 온다
+                async for chunk in client.astream(
+                    _messages(system_prompt, user_input), stream_usage=True
+                ):
+                    if getattr(chunk, "usage_metadata", None):
+                        chunk_usage = usage_from_message(chunk)
+                        chunk_usage.calls = 0
+                        usage.add(chunk_usage)
+                    text = chunk.content if isinstance(chunk.content, str) else ""
+                    if text:
+                        parts.append(text)
+                        yield text
+            except Exception as exc:
+                retry_after = rate_limit_retry_after(exc)
+                if retry_after is not None:
+                    controller.on_rate_limited(retry_after)
+                raise
+            controller.on_success()
+            slot["used"] = usage.total_tokens or None
+        record_usage(stage, usage)
+        if cache_key is not None:
+            await self.cache.aset(cache_key, "".join(parts))
+
+    async def _invoke(
+        self,
+        client: Any,
+        messages: list[Any],
+        *,
+        model: str,
+        api_key: str,
+        tokens: int,
+        on_admitted: Optional[Callable[[], None]] = None,
+    ) -> Any:
+        """전역 승인 제어를 거쳐 호출하고, 429/일시 오류는 Retry-After·백오프 후 재시도한다.
+
+        on_admitted는 승인될 때마다 불린다 (헤징이 승인 대기를 뺀 응답 시간을 재는 데 쓴다).
+        """
+        controller = get_controller(model, api_key)
+        retries = max(0, get_llm_rate_limit_retries())
+        attempt = 0
+        while True:
+            backoff = 0.0
+            async with controller.slot(tokens) as slot:
+                if on_admitted is not None:
+                    on_admitted()
+                try:
+                    response = await client.ainvoke(messages)
+                except Exception as exc:
+                    retry_after = rate_limit_retry_after(exc, attempt)
+                    if retry_after is not None:
+                        # 대기는 컨트롤러 쿨다운이 맡는다 (같은 키의 다른 호출도 함께 멈춤)
+                        controller.on_rate_limited(retry_after)
+                    elif is_transient_error(exc):
+                        backoff = min(MAX_BACKOFF, 2.0**attempt) * random.uniform(0.5, 1.0)
+                    else:
+                        raise
+                    if attempt >= retries:
+                        raise
+                else:
+                    controller.on_success()
+                    slot["used"] = usage_from_message(response).total_tokens or None
+                    return response
+            attempt += 1
+            if backoff:
+                await asyncio.sleep(backoff)
+
+    def _client(
+        self,
+        *,
+        model: Optional[str],
+        temperature: Optional[float],
+        api_key: Optional[str],
+        max_tokens: Optional[int] = None,
+    ) -> Any:
+        """호출별 설정이 있으면 새 ChatOpenAI를, 없으면 기본 클라이언트를 반환한다."""
+        if self.backend == "fake":
+            return self.client
         if ChatOpenAI is None or HumanMessage is None or SystemMessage is None or self.client is None:
             raise ImportError("langchain and langchain_openai 패키지가 필요합니다.")
-        client = self.client
-        if model or temperature is not None or api_key is not None:
-            client = ChatOpenAI(
+        if model or temperature is not None or api_key is not None or max_tokens:
+            return ChatOpenAI(
                 model=model or self.model,
                 temperature=self.temperature if temperature is None else temperature,
                 api_key=api_key or self.api_key,
+                max_tokens=max_tokens or self.max_tokens,
+                max_retries=0,
             )
+        return self.client
+
+    async def chat_structured(
+        self,
+        system_prompt: str,
+        user_input: str,
+        schema: type[SchemaT],
+        *,
+        max_attempts: int = 2,
+        **kwargs: Any,
+    ) -> SchemaT:
+        """스키마로 제약된 출력을 받아 pydantic 모델로 반환한다.
+
+        응답이 스키마에 맞지 않으면 캐시를 우회해 다시 요청하고,
+        max_attempts 번 모두 실패하면 LLMOutputError를 올린다.
+        """
+        raw = ""
+        last_error: Exception | None = None
+        use_cache = kwargs.pop("use_cache", True)
+        for attempt in range(max(1, max_attempts)):
+            raw = await self.chat(
+                system_prompt,
+                user_input,
+                response_schema=schema,
+                use_cache=use_cache and attempt == 0,
+                **kwargs,
+            )
+            cleaned = try_repair_json(raw) or raw
+            try:
+                return schema.model_validate_json(cleaned)
+            except ValidationError as exc:
+                last_error = exc
+                if self.cache is not None:
+                    # 잘못된 응답이 캐시에 남아 재사용되지 않도록 제거
+                    await self.cache.ainvalidate(
+                        self._cache_key(
+                            system_prompt,
+                            user_input,
+                            model=kwargs.get("model"),
+                            temperature=kwargs.get("temperature"),
+                            response_schema=schema,
+                            max_tokens=kwargs.get("max_tokens"),
+                            api_key=kwargs.get("api_key"),
+                        )
+                    )
+        raise LLMOutputError(f"{schema.__name__} 형식의 응답을 받지 못했습니다: {last_error}", raw)
+
+
+async def _hedged(
+    invoke: Callable[..., Awaitable[Any]],
+    tracker: HedgeTracker,
+    controller: Optional[AdmissionController] = None,
+) -> Any:
+    """p90 안에 응답이 없으면 같은 호출을 한 번 더 보내 먼저 성공한 응답을 반환한다.
+
+    invoke는 on_admitted 콜백을 키워드로 받아 승인 시점에 부른다. p90 대기와 응답 시간
+    표본은 승인된 시점부터 재므로 승인 제어 대기는 포함되지 않는다. 컨트롤러에 대기자가
+    있으면 중복 요청도 같은 줄에 설 뿐이므로 헤지하지 않는다.
+    """
+    delay, call = tracker.start_call()
+    loop = asyncio.get_running_loop()
+    primary_admitted = loop.create_future()
+    # task -> 마지막 승인 시각
+    admitted_at: dict[asyncio.Task, float] = {}
+
+    def spawn() -> asyncio.Task:
+        task: Optional[asyncio.Task] = None
+
+        def on_admitted() -> None:
+            admitted_at[task] = time.perf_counter()  # type: ignore[index]
+            if not primary_admitted.done():
+                primary_admitted.set_result(None)
+
+        task = asyncio.create_task(invoke(on_admitted=on_admitted))
+        return task
+
+    primary = spawn()
+    tasks = {primary}
+    try:
+        if delay is not None:
+            await asyncio.wait({primary, primary_admitted}, return_when=asyncio.FIRST_COMPLETED)
+            if not primary.done():
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and not (controller and controller.waiting) and tracker.try_hedge(call):
+                    tasks.add(spawn())
+        while True:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    if task is not primary:
+                        tracker.record_win()
+                    if task in admitted_at:
+                        tracker.observe(time.perf_counter() - admitted_at[task])
+                    return task.result()
+                if not tasks:
+                    raise task.exception()  # type: ignore[misc]
+    finally:
+        primary_admitted.cancel()
+        for task in tasks:
+            task.cancel()
+
+
+def _key_fingerprint(api_key: str) -> str:
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _messages(system_prompt: str, user_input: str) -> list[Any]:
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_input),
+    ]
+
+
+def _response_format(schema: type[BaseModel]) -> dict[str, Any]:
+    """pydantic 모델을 OpenAI strict JSON schema response_format으로 변환."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.__name__,
+            "schema": _strict_schema(schema.model_json_schema()),
+            "strict": True,
+        },
+    }
+
+
+def _strict_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """strict 모드 요구사항(모든 필드 required, additionalProperties=false)을 적용한다.
+
+    기본값이 있는 필드도 출력 형식상으로는 필수로 요구하고, 검증은 모델 기본값으로 관대하게 한다.
+    """
+    schema = copy.deepcopy(schema)
+
+    def _walk(node: Any) -> None:
+        if isinstance(node, dict):
+            if node.get("type") == "object" and "properties" in node:
+                node["additionalProperties"] = False
+                node["required"] = list(node["properties"].keys())
+                for prop in node["properties"].values():
+                    prop.pop("default", None)
+            for value in node.values():
+                _walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                _walk(item)
 
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_input),
-        ]
-        response = await client.ainvoke(messages)
-        return response.content
+    _walk(schema)
+    return schema
@@ -0,0 +1,244 @@
+"""LLM 응답 캐시.
+
+동일한 시스템 프롬프트/사용자 입력/모델 파라미터 조합의 응답을 재사용한다.
+키는 메시지와 파라미터(API Key 지문 포함)를 정규화한 JSON의 SHA-256 해시이며,
+백엔드는 메모리(LRU) 또는 SQLite 파일 중 하나를 사용한다. SQLite는 디스크 I/O가
+있으므로 비동기 경로(aget/aset/ainvalidate)에서 스레드로 넘긴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app import config
+
+# SQLite 백엔드에서 접근 시각 갱신을 모아 한 번에 쓰는 건수
+TOUCH_BATCH = 64
+
+
+def make_cache_key(*, system_prompt: str, user_input: str, model: str, **params: Any) -> str:
+    """메시지 + 모델 파라미터로 콘텐츠 주소 키를 만든다."""
+    material = {
+        "system": system_prompt,
+        "user": user_input,
+        "model": model,
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _MemoryBackend:
+    """프로세스 메모리 LRU 백엔드."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[str, float]]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                self._data.move_to_end(key)
+            return item
+
+    def set(self, key: str, value: str, created: float) -> None:
+        with self._lock:
+            self._data[key] = (value, created)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _SQLiteBackend:
+    """SQLite 파일 백엔드 (재시작 후에도 유지).
+
+    적중마다 UPDATE를 하지 않고 접근 시각을 메모리에 모았다가 TOUCH_BATCH건마다,
+    또는 제거 순서가 필요한 set 직전에 한 번에 쓴다. 행 수는 COUNT(*) 대신 열 때
+    한 번 세고 이후 증감으로 관리한다 (같은 파일을 쓰는 다른 프로세스분은 반영되지 않음).
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed)")
+        (self._count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        # key -> 아직 쓰지 않은 마지막 접근 시각
+        self._touched: dict[str, float] = {}
+
+    def _flush_touched(self) -> None:
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE llm_cache SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def get(self, key: str) -> Optional[tuple[str, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touched()
+            return row[0], row[1]
+
+    def set(self, key: str, value: str, created: float) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            updated = self._conn.execute(
+                "UPDATE llm_cache SET value = ?, created = ?, accessed = ? WHERE key = ?",
+                (value, created, created, key),
+            ).rowcount
+            if updated:
+                return
+            self._conn.execute(
+                "INSERT INTO llm_cache(key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, created, created),
+            )
+            self._count += 1
+            overflow = self._count - self.max_entries
+            if overflow > 0:
+                # 제거 순서가 맞도록 모아 둔 접근 시각을 먼저 쓴다
+                self._flush_touched()
+                removed = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY accessed ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+                self._count -= removed
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            self._count -= self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM llm_cache")
+            self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class LLMResponseCache:
+    """TTL/크기 제한이 있는 LLM 응답 캐시.
+
+    이벤트 루프에서는 aget/aset/ainvalidate를 쓴다. SQLite 백엔드면 스레드에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+        path: str | None = None,
+    ):
+        self.ttl = config.get_llm_cache_ttl(ttl)
+        self.max_entries = max(1, config.get_llm_cache_max_entries(max_entries))
+        self.path = config.get_llm_cache_path(path)
+        self._backend = (
+            _SQLiteBackend(self.path, self.max_entries)
+            if self.path
+            else _MemoryBackend(self.max_entries)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        item = self._backend.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        value, created = item
+        if self.ttl > 0 and time.time() - created > self.ttl:
+            self._backend.delete(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._backend.set(key, value, time.time())
+
+    def invalidate(self, key: str) -> None:
+        self._backend.delete(key)
+
+    async def aget(self, key: str) -> Optional[str]:
+        if isinstance(self._backend, _MemoryBackend):
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        if isinstance(self._backend, _MemoryBackend):
+            self.set(key, value)
+            return
+        await asyncio.to_thread(self.set, key, value)
+
+    async def ainvalidate(self, key: str) -> None:
+        if isinstance(self._backend, _MemoryBackend):
+            self.invalidate(key)
+            return
+        await asyncio.to_thread(self.invalidate, key)
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": "sqlite" if self.path else "memory",
+            "size": len(self._backend),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_default_cache: LLMResponseCache | None = None
+_default_cache_resolved = False
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> LLMResponseCache | None:
+    """LLM_CACHE_ENABLED일 때만 프로세스 공용 캐시를 반환한다.
+
+    설정은 처음 호출할 때 한 번만 읽는다 (LLMService 생성마다 환경 변수를 읽지 않도록).
+    """
+    global _default_cache, _default_cache_resolved
+    if not _default_cache_resolved:
+        with _default_cache_lock:
+            if not _default_cache_resolved:
+                _default_cache = LLMResponseCache() if config.get_llm_cache_enabled() else None
+                _default_cache_resolved = True
+    return _default_cache
@@ -0,0 +1,256 @@
+"""프로세스 전역 LLM 호출 승인 제어.
+
+모델+API Key 조합마다 하나의 AdmissionController가 동시 호출 수와 분당 토큰(TPM)
+예산을 관리한다. 429 응답을 받으면 Retry-After 동안 신규 호출을 멈추고 동시성 상한을
+절반으로 줄였다가(AIMD), 성공할 때마다 조금씩 다시 늘린다. 여러 요청이 한꺼번에
+몰려도 처리량이 공급자 한도에서 평탄해지고 재시도 폭주로 무너지지 않게 한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Iterator, Optional
+
+try:
+    import openai
+except ImportError:  # pragma: no cover - optional dependency
+    openai = None  # type: ignore
+
+from app import config
+
+# 429 직후 연달아 도착한 실패로 여러 번 반감되지 않도록 하는 최소 간격(초)
+DECREASE_INTERVAL = 1.0
+# Retry-After가 없을 때의 지수 백오프 상한(초)
+MAX_BACKOFF = 30.0
+
+# 낮은 우선순위(MANUAL 작업 등) 호출 표시. 이 컨텍스트의 호출은 동시성 상한의 일부만 쓴다.
+_LOW_PRIORITY_CTX: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "llm_low_priority", default=False
+)
+
+
+@contextmanager
+def low_priority() -> Iterator[None]:
+    """블록 안의 LLM 호출을 낮은 우선순위 레인으로 보낸다."""
+    token = _LOW_PRIORITY_CTX.set(True)
+    try:
+        yield
+    finally:
+        _LOW_PRIORITY_CTX.reset(token)
+
+
+class AdmissionController:
+    """동시성 상한(AIMD) + TPM 토큰 버킷 + Retry-After 쿨다운."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        tpm: int = 0,
+        min_concurrency: int = 1,
+        low_priority_share: float = 0.5,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.low_priority_share = min(1.0, max(0.0, low_priority_share))
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = float(self.max_concurrency)
+        self.tpm = max(0, tpm)
+        self.in_flight = 0
+        self.low_in_flight = 0
+        self.admitted = 0
+        self.rate_limited = 0
+        self._tokens = float(self.tpm)
+        self._refilled = time.monotonic()
+        self._cooldown_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: list[asyncio.Future] = []
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + (now - self._refilled) * self.tpm / 60.0)
+        self._refilled = now
+
+    def _try_admit(self, tokens: int, low: bool = False) -> Optional[float]:
+        """승인되면 0, 일정 시간 뒤 재확인이 필요하면 대기 초, 슬롯 반환을 기다려야 하면 None."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._cooldown_until:
+                return self._cooldown_until - now
+            if self.in_flight >= int(self.limit):
+                return None
+            # 낮은 우선순위는 상한의 일부까지만 (최소 1개는 허용해 굶지 않게 한다)
+            if low and self.low_in_flight >= max(1, int(self.limit * self.low_priority_share)):
+                return None
+            self._refill(now)
+            # 예산보다 큰 단일 요청은 버킷이 가득 찼을 때 통과시킨다(영구 대기 방지)
+            cost = min(tokens, self.tpm) if self.tpm else 0
+            if cost and self._tokens < cost:
+                return (cost - self._tokens) * 60.0 / self.tpm
+            self._tokens -= cost
+            self.in_flight += 1
+            if low:
+                self.low_in_flight += 1
+            self.admitted += 1
+            return 0.0
+
+    async def acquire(self, tokens: int = 0, *, low: bool = False) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            wait = self._try_admit(tokens, low)
+            if wait == 0.0:
+                return
+            fut = loop.create_future()
+            with self._lock:
+                self._waiters.append(fut)
+            try:
+                await asyncio.wait_for(fut, timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    if fut in self._waiters:
+                        self._waiters.remove(fut)
+
+    def release(self, *, reserved: int = 0, used: Optional[int] = None, low: bool = False) -> None:
+        """슬롯을 반환하고, 실제 사용량이 있으면 예약분과의 차이를 버킷에 반영한다."""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if low:
+                self.low_in_flight = max(0, self.low_in_flight - 1)
+            if self.tpm and used is not None:
+                self._tokens = min(self.tpm, self._tokens + min(reserved, self.tpm) - used)
+            waiters, self._waiters = self._waiters, []
+        for fut in waiters:
+            # 다른 이벤트 루프의 대기자도 안전하게 깨운다
+            fut.get_loop().call_soon_threadsafe(_wake, fut)
+
+    def on_success(self) -> None:
+        with self._lock:
+            # additive increase: 상한만큼 성공하면 1 증가
+            self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.rate_limited += 1
+            self._cooldown_until = max(self._cooldown_until, now + retry_after)
+            if now - self._last_decrease >= DECREASE_INTERVAL:
+                # multiplicative decrease
+                self.limit = max(self.min_concurrency, self.limit / 2)
+                self._last_decrease = now
+            if self.tpm:
+                self._tokens = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """승인을 기다리는 호출 수."""
+        with self._lock:
+            return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[dict[str, Any]]:
+        """승인된 동안 유지되는 슬롯. 호출자는 slot["used"]에 실제 토큰 수를 넣을 수 있다.
+
+        low_priority() 컨텍스트 안이면 낮은 우선순위 레인으로 승인된다.
+        """
+        low = _LOW_PRIORITY_CTX.get()
+        await self.acquire(tokens, low=low)
+        handle: dict[str, Any] = {"used": None}
+        try:
+            yield handle
+        finally:
+            self.release(reserved=tokens, used=handle["used"], low=low)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "low_priority_in_flight": self.low_in_flight,
+                "waiting": len(self._waiters),
+                "admitted": self.admitted,
+                "rate_limited": self.rate_limited,
+                "tpm": self.tpm,
+            }
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+_controllers: dict[tuple[str, str], AdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(model: str, api_key: str) -> AdmissionController:
+    """모델 + API Key(해시) 조합별 프로세스 공용 컨트롤러."""
+    key = (model, hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16])
+    with _controllers_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            controller = AdmissionController(
+                max_concurrency=config.get_llm_max_concurrency(),
+                tpm=config.get_llm_tpm_limit(),
+                low_priority_share=config.get_llm_low_priority_share(),
+            )
+            _controllers[key] = controller
+        return controller
+
+
+def limiter_stats() -> dict[str, dict[str, Any]]:
+    with _controllers_lock:
+        return {f"{model}:{key}": c.stats() for (model, key), c in _controllers.items()}
+
+
+def reset_controllers() -> None:
+    with _controllers_lock:
+        _controllers.clear()
+
+
+def estimate_tokens(*texts: str, max_tokens: Optional[int] = None) -> int:
+    """호출 전 TPM 예약용 대략적 토큰 수 (한글 기준 2글자≈1토큰보다 보수적으로 1글자≈1토큰)."""
+    return sum(len(t or "") for t in texts) + (max_tokens or 512)
+
+
+def rate_limit_retry_after(exc: BaseException, attempt: int = 0) -> Optional[float]:
+    """429 예외면 기다릴 초를, 아니면 None을 반환한다."""
+    status = getattr(exc, "status_code", None)
+    response = getattr(exc, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if status != 429:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return max(0.0, float(retry_ms) / 1000.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return min(MAX_BACKOFF, 2.0 ** attempt)
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """SDK 재시도를 끈 대신 직접 재시도할 일시 오류(연결/타임아웃/5xx)인지."""
+    if openai is not None and isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and status >= 500
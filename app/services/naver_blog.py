@@ -14,7 +14,7 @@ try:
 except ImportError:  # pragma: no cover - optional dependency for tests
     async_playwright = None  # type: ignore
 
-from app.logs import async_send_log
+from app.logs import log_nowait
 
 
 DEFAULT_SESSION_FILE = "/tmp/naver_blog_session.json"
@@ -23,30 +23,16 @@ JOB_ID_CTX: contextvars.ContextVar[str] = contextvars.ContextVar("naver_blog_job
 
 
 def _log(message: str, *, level: str = "INFO", submessage: str = "", job_id: str | None = None) -> None:
+    """셀렉터 시도마다 불리므로 전송을 기다리지 않는다 (루프 안/밖 모두 안전)."""
     try:
         job = job_id if job_id is not None else JOB_ID_CTX.get("")
-        # fire-and-forget async; if not awaited, it runs in loop via create_task
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.create_task(
-                async_send_log(
-                    message=message,
-                    level=level,
-                    submessage=submessage,
-                    logged_process="naver_blog",
-                    job_id=job,
-                )
-            )
-        else:
-            asyncio.run(
-                async_send_log(
-                    message=message,
-                    level=level,
-                    submessage=submessage,
-                    logged_process="naver_blog",
-                    job_id=job,
-                )
-            )
+        log_nowait(
+            message=message,
+            level=level,
+            submessage=submessage,
+            logged_process="naver_blog",
+            job_id=job,
+        )
     except Exception:
         return
 
@@ -93,7 +79,7 @@ async def _open_editor(browser, blog_id: str, session_file: str):
     page = await context.new_page()
     _log("글쓰기 페이지 이동")
     await page.goto(f"https://blog.naver.com/{blog_id}?Redirect=Write&", timeout=30000)
-    _log(f"현재 페이지 URL: {page.url}")
+    _log(f"현재 페이지 URL: {page.url}", level="DEBUG")
     await page.wait_for_selector("iframe[name='mainFrame']")
     frame = page.frame(name="mainFrame")
     return frame, page
@@ -106,7 +92,7 @@ def _find_editor_frame(frame):
         fr = queue.pop(0)
         name = (fr.name or "") + (fr.url or "")
         if "canvas" in name or "SmartEditor" in name or "edit" in name:
-            _log(f"에디터 iframe 발견: name={fr.name}, url={fr.url}")
+            _log(f"에디터 iframe 발견: name={fr.name}, url={fr.url}", level="DEBUG")
             return fr
         queue.extend(fr.child_frames)
     _log("에디터 iframe을 찾지 못해 mainFrame 사용", level="WARN")
@@ -138,7 +124,7 @@ async def _fill_title(frame, title: str) -> bool:
     for fr in frames:
         for sel in selectors:
             try:
-                _log(f"제목 입력 시도: {sel} @frame {fr.name} {fr.url}")
+                _log(f"제목 입력 시도: {sel} @frame {fr.name} {fr.url}", level="DEBUG")
                 await fr.wait_for_selector(sel, timeout=2000)
                 await fr.click(sel, force=True)
                 try:
@@ -151,7 +137,7 @@ async def _fill_title(frame, title: str) -> bool:
                 continue
     # JS로 직접 입력 시도 (마지막 수단)
     try:
-        _log("제목 입력 시도: JS fallback")
+        _log("제목 입력 시도: JS fallback", level="DEBUG")
         for fr in frames:
             try:
                 await fr.evaluate(
@@ -183,7 +169,7 @@ async def _fill_content(frame, content: str) -> bool:
     for fr in frames:
         for sel in selectors:
             try:
-                _log(f"본문 입력 시도: {sel} @frame {fr.name} {fr.url}")
+                _log(f"본문 입력 시도: {sel} @frame {fr.name} {fr.url}", level="DEBUG")
                 await fr.wait_for_selector(sel, timeout=2500)
                 await fr.click(sel, force=True)
                 try:
@@ -196,7 +182,7 @@ async def _fill_content(frame, content: str) -> bool:
                 continue
     # JS로 직접 입력 시도 (마지막 수단)
     try:
-        _log("본문 입력 시도: JS fallback")
+        _log("본문 입력 시도: JS fallback", level="DEBUG")
         for fr in frames:
             try:
                 await fr.evaluate(
@@ -223,7 +209,7 @@ async def _publish(frame) -> bool:
     for fr in frames:
         for sel in selectors:
             try:
-                _log(f"발행 버튼 클릭 시도: {sel} @frame {fr.name} {fr.url}")
+                _log(f"발행 버튼 클릭 시도: {sel} @frame {fr.name} {fr.url}", level="DEBUG")
                 await fr.wait_for_selector(sel, timeout=2500)
                 await fr.click(sel, force=True)
                 clicked = True
@@ -0,0 +1,194 @@
+"""LLM 프롬프트용 상품 스펙 컨텍스트.
+
+연관도/홍보글/카테고리 프롬프트가 공통으로 쓰는 스펙 목록을 한 번만 만든다.
+싸다구 스펙 표는 배송/반품 안내처럼 길고 정보가 적은 항목이 많으므로, 항목을
+유용도 순으로 골라 토큰 예산 안에 맞추고 긴 값은 잘라낸다. 결과는 상품 내용과
+예산 기준으로 캐시되어 한 작업 안의 여러 단계에서 재사용된다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from app import config
+from app.schemas.products import SsadaguProduct
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# 한 항목 값의 최대 토큰 수 (넘으면 말줄임)
+MAX_VALUE_TOKENS = 60
+CACHE_MAX_ENTRIES = 256
+
+# 상품 이해에 도움되는 키 / 정보가 거의 없는 안내성 키
+_PREFERRED_KEYS = (
+    "브랜드", "제조사", "모델", "품명", "종류", "소재", "재질", "색상", "사이즈",
+    "크기", "용량", "중량", "무게", "구성", "수량", "규격", "기능", "특징",
+)
+_BOILERPLATE_KEYS = (
+    "배송", "반품", "교환", "환불", "a/s", "as ", "고객센터", "판매자", "사업자",
+    "통신판매", "주의", "유의", "인증", "kc", "원산지", "제조연월", "품질보증", "문의",
+)
+
+_encoder: Any = None
+_encoder_failed = False
+_encoder_lock = threading.Lock()
+
+
+def load_encoder() -> Any:
+    """tiktoken 인코더를 한 번만 로드한다. 없거나 로드 실패 시 경고 후 None.
+
+    첫 로드는 인코딩 파일을 내려받을 수 있어 블로킹이므로, 앱에서는 lifespan이
+    asyncio.to_thread로 미리 부른다.
+    """
+    global _encoder, _encoder_failed
+    if _encoder is not None or _encoder_failed:
+        return _encoder
+    with _encoder_lock:
+        if _encoder is None and not _encoder_failed:
+            if tiktoken is None:
+                _encoder_failed = True
+                logger.warning("tiktoken이 설치되어 있지 않아 토큰 수를 UTF-8 바이트/3으로 근사합니다.")
+                return None
+            try:
+                _encoder = tiktoken.get_encoding("o200k_base")
+            except Exception as exc:
+                # 인코딩 파일을 받을 수 없는 환경(오프라인 등)에서는 근사치 사용
+                _encoder_failed = True
+                logger.warning("tiktoken 인코딩 로드 실패, 토큰 수를 근사합니다: %s", exc)
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """로컬 토크나이저 기준 토큰 수. tiktoken을 쓸 수 없으면 UTF-8 바이트/3 근사."""
+    if not text:
+        return 0
+    encoder = load_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    return max(1, (len(text.encode("utf-8")) + 2) // 3)
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoder = load_encoder()
+    if encoder is not None:
+        return encoder.decode(encoder.encode(text)[:max_tokens]).rstrip() + "…"
+    # 근사 모드: 글자 수를 줄여가며 맞춘다
+    cut = len(text)
+    while cut > 1 and count_tokens(text[:cut]) > max_tokens:
+        cut = int(cut * 0.8)
+    return text[:cut].rstrip() + "…"
+
+
+def _spec_priority(key: str, value: str) -> tuple[int, int]:
+    """낮을수록 먼저 포함. (키 종류 등급, 값 길이)."""
+    lowered = key.lower()
+    if any(word in lowered for word in _BOILERPLATE_KEYS):
+        rank = 2
+    elif any(word in lowered for word in _PREFERRED_KEYS):
+        rank = 0
+    else:
+        rank = 1
+    return rank, len(value)
+
+
+@dataclass(frozen=True)
+class ProductContext:
+    """예산에 맞춘 스펙 항목과 통계."""
+
+    specs: tuple[tuple[str, str], ...]
+    omitted: int
+    tokens: int
+
+    def spec_lines(self, indent: str = "") -> str:
+        """프롬프트에 넣을 '- 키: 값' 목록. 항목이 없으면 '- 없음'."""
+        if not self.specs:
+            return f"{indent}- 없음"
+        lines = [f"{indent}- {k}: {v}" for k, v in self.specs]
+        if self.omitted:
+            lines.append(f"{indent}- (그 외 {self.omitted}개 항목 생략)")
+        return "\n".join(lines)
+
+
+def build_product_context(
+    product: SsadaguProduct,
+    *,
+    budget: Optional[int] = None,
+    counter: Callable[[str], int] = count_tokens,
+) -> ProductContext:
+    """스펙 항목을 유용도 순으로 골라 토큰 예산에 맞춘다. 출력 순서는 원래 순서를 유지한다."""
+    budget = config.get_product_spec_token_budget(budget)
+    items = [(str(k), str(v)) for k, v in (product.detail_specs or {}).items()]
+    if budget <= 0:
+        return ProductContext(tuple(items), 0, sum(counter(f"- {k}: {v}") for k, v in items))
+
+    order = sorted(range(len(items)), key=lambda i: (*_spec_priority(*items[i]), i))
+    chosen: dict[int, tuple[str, str]] = {}
+    used = 0
+    for idx in order:
+        key, value = items[idx]
+        value = _truncate(value, MAX_VALUE_TOKENS)
+        cost = counter(f"- {key}: {value}")
+        if used + cost > budget:
+            continue
+        chosen[idx] = (key, value)
+        used += cost
+    specs = tuple(chosen[i] for i in sorted(chosen))
+    return ProductContext(specs, len(items) - len(specs), used)
+
+
+class ProductContextCache:
+    """상품 내용 + 예산 기준 LRU. 같은 작업의 여러 단계가 한 번 만든 결과를 공유한다."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, ProductContext] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(product: SsadaguProduct, budget: int) -> str:
+        raw = json.dumps(
+            [str(product.product_link), product.title, product.detail_specs, budget],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, product: SsadaguProduct, budget: Optional[int] = None) -> ProductContext:
+        budget = config.get_product_spec_token_budget(budget)
+        key = self._key(product, budget)
+        with self._lock:
+            cached = self._data.get(key)
+            if cached is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return cached
+        context = build_product_context(product, budget=budget)
+        with self._lock:
+            self.misses += 1
+            self._data[key] = context
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return context
+
+
+PRODUCT_CONTEXTS = ProductContextCache()
+
+
+def product_spec_lines(product: SsadaguProduct, indent: str = "") -> str:
+    """캐시된 컨텍스트로 스펙 목록 문자열을 만든다."""
+    return PRODUCT_CONTEXTS.get(product).spec_lines(indent)
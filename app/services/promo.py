@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from typing import Optional
 
 from app.logs import async_send_log
 from app.prompts.promo import get_platform_guide
 from app.schemas.llm import LlmSetting
 from app.schemas.products import SsadaguProduct
-from app.services.llm import LLMService
-from app.services.text_cleaner import try_repair_json
+from app.schemas.promo import PromoOutput, PromoWithCategoryOutput
+from app.services.llm import LLMOutputError, LLMService
+from app.services.product_context import product_spec_lines
 
 
 class PromoService:
@@ -29,12 +29,10 @@ class PromoService:
 출력은 JSON 형식으로 title, body만 포함한다."""
 
     @staticmethod
-    def _build_user_input(product: SsadaguProduct, extra_prompt: str | None) -> str:
-        specs = (
-            "\n".join([f"- {k}: {v}" for k, v in (product.detail_specs or {}).items()])
-            if product.detail_specs
-            else "- 없음"
-        )
+    def _build_user_input(
+        product: SsadaguProduct, extra_prompt: str | None, fields: str = "title, body"
+    ) -> str:
+        specs = product_spec_lines(product)
         price_text = f"{product.price}" if product.price is not None else "알 수 없음"
         user = f"""상품 정보:
 - 이름: {product.title}
@@ -45,9 +43,21 @@ class PromoService:
 {specs}
 
 추가 지시문(선택): {extra_prompt or '없음'}
-위 정보를 반영해 JSON(title, body)만 반환해줘."""
+위 정보를 반영해 JSON({fields})만 반환해줘."""
         return user
 
+    @staticmethod
+    def _build_fused_system_prompt(platform: str, categories: list[tuple[str, str]]) -> str:
+        guide = get_platform_guide(platform)
+        lines = "\n".join([f"- {cid}: {desc}" for cid, desc in categories])
+        return f"""너는 이커머스 마케터다.
+플랫폼: {platform}
+아래 가이드에 따라 홍보글을 작성하고, 상품에 가장 적합한 카테고리를 하나 고른다.
+{guide}
+카테고리 목록:
+{lines}
+출력은 JSON 형식으로 title, body, category(카테고리 ID)만 포함한다."""
+
     async def generate(
         self,
         product: SsadaguProduct,
@@ -67,22 +77,21 @@ class PromoService:
             logged_process="promo",
             job_id=job_id or "",
         )
-        answer = await self.llm.chat(
-            system_prompt=system_prompt,
-            user_input=user_input,
-            model=llm_setting.modelName if llm_setting else None,
-            temperature=llm_setting.temperature if llm_setting else None,
-            api_key=llm_setting.apiKey if llm_setting else None,
-        )
-        cleaned_answer = try_repair_json(answer) or answer
-
         try:
-            parsed = json.loads(cleaned_answer)
-            title = parsed.get("title") or ""
-            body = parsed.get("body") or ""
-        except Exception:
-            # LLM이 JSON 형식이 아닐 경우 대비하여 fallback
-            title, body = "", cleaned_answer.strip()
+            parsed = await self.llm.chat_structured(
+                system_prompt,
+                user_input,
+                PromoOutput,
+                model=llm_setting.modelName if llm_setting else None,
+                temperature=llm_setting.temperature if llm_setting else None,
+                api_key=llm_setting.apiKey if llm_setting else None,
+                max_tokens=llm_setting.maxTokens if llm_setting else None,
+                stage="promo",
+            )
+            title, body = parsed.title, parsed.body
+        except LLMOutputError as exc:
+            # 재요청까지 JSON 형식이 아닐 경우 원문을 본문으로 사용
+            title, body = "", exc.raw.strip()
 
         await send_log_async_safe(
             message="프로모션 생성 완료",
@@ -96,6 +105,73 @@ class PromoService:
             "link": str(product.product_link),
             "platform": platform,
         }
+
+    async def generate_with_category(
+        self,
+        product: SsadaguProduct,
+        *,
+        categories: list[tuple[str, str]],
+        platform: str = "naver_blog",
+        llm_setting: LlmSetting | None = None,
+        job_id: str | None = None,
+    ) -> dict[str, str] | None:
+        """홍보글(title, body)과 카테고리를 한 번의 LLM 호출로 생성.
+
+        응답을 JSON으로 해석하지 못하면 None을 반환해 호출 측이 개별 호출로 폴백하게 한다.
+        category가 누락되었거나 목록에 없으면 빈 문자열로 둔다.
+        """
+        extra_prompt = llm_setting.prompt if llm_setting else None
+        system_prompt = self._build_fused_system_prompt(platform, categories)
+        user_input = self._build_user_input(product, extra_prompt, "title, body, category")
+
+        await send_log_async_safe(
+            message="프로모션+카테고리 생성 시작",
+            submessage=f"platform={platform}, product={product.title}",
+            logged_process="promo",
+            job_id=job_id or "",
+        )
+        try:
+            parsed = await self.llm.chat_structured(
+                system_prompt,
+                user_input,
+                PromoWithCategoryOutput,
+                max_attempts=1,
+                model=llm_setting.modelName if llm_setting else None,
+                temperature=llm_setting.temperature if llm_setting else None,
+                api_key=llm_setting.apiKey if llm_setting else None,
+                max_tokens=llm_setting.maxTokens if llm_setting else None,
+                stage="promo_category",
+            )
+        except LLMOutputError:
+            parsed = None
+        if parsed is None or not parsed.body.strip():
+            await send_log_async_safe(
+                message="프로모션+카테고리 응답 파싱 실패, 개별 생성으로 폴백",
+                level="WARN",
+                submessage=f"platform={platform}, product={product.title}",
+                logged_process="promo",
+                job_id=job_id or "",
+            )
+            return None
+        title, body, category = parsed.title, parsed.body, parsed.category.strip()
+        if not any(cid == category for cid, _ in categories):
+            category = ""
+
+        await send_log_async_safe(
+            message="프로모션+카테고리 생성 완료",
+            submessage=f"platform={platform}, title={title}, category={category or '없음'}",
+            logged_process="promo",
+            job_id=job_id or "",
+        )
+        return {
+            "title": title.strip(),
+            "body": body.strip(),
+            "category": category,
+            "link": str(product.product_link),
+            "platform": platform,
+        }
+
+
 async def send_log_async_safe(**kwargs) -> None:
     try:
         await async_send_log(**kwargs)
@@ -0,0 +1,76 @@
+"""키워드-상품 로컬 어휘 순위화 (문자 n-gram BM25).
+
+LLM 연관도 평가 전에 크롤링된 상품을 키워드와의 어휘 유사도로 정렬해
+명백히 무관한 상품이 LLM 호출을 소모하지 않도록 한다. 외부 의존성 없이
+상품 제목과 상세 스펙 값만으로 수 밀리초 안에 점수를 계산한다.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Iterable, Sequence
+
+from app.schemas.products import SsadaguProduct
+
+NGRAM_SIZES = (2, 3)
+TITLE_WEIGHT = 2
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def tokenize(text: str, sizes: Sequence[int] = NGRAM_SIZES) -> list[str]:
+    """공백 단위 토큰과 토큰 내부 문자 n-gram을 함께 반환한다."""
+    normalized = _NON_WORD.sub(" ", (text or "").lower()).strip()
+    terms: list[str] = []
+    for token in normalized.split():
+        terms.append(token)
+        for n in sizes:
+            if len(token) > n:
+                terms.extend(token[i : i + n] for i in range(len(token) - n + 1))
+    return terms
+
+
+def product_terms(product: SsadaguProduct) -> list[str]:
+    """제목(가중치 적용)과 스펙 키/값에서 색인어를 뽑는다."""
+    terms = tokenize(product.title) * TITLE_WEIGHT
+    for key, value in (product.detail_specs or {}).items():
+        terms.extend(tokenize(f"{key} {value}"))
+    return terms
+
+
+def bm25_scores(query: Iterable[str], documents: list[list[str]]) -> list[float]:
+    """문서 목록 자체를 말뭉치로 삼아 BM25 점수를 계산한다."""
+    if not documents:
+        return []
+    query_terms = set(query)
+    doc_counts = [Counter(doc) for doc in documents]
+    avg_len = sum(len(doc) for doc in documents) / len(documents) or 1.0
+    n_docs = len(documents)
+    idf = {}
+    for term in query_terms:
+        df = sum(1 for counts in doc_counts if term in counts)
+        idf[term] = math.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+
+    scores: list[float] = []
+    for doc, counts in zip(documents, doc_counts):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_len)
+        score = 0.0
+        for term in query_terms:
+            tf = counts.get(term, 0)
+            if tf:
+                score += idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def rank_products(
+    keyword: str, products: Sequence[SsadaguProduct]
+) -> list[tuple[SsadaguProduct, float]]:
+    """키워드와의 어휘 유사도 내림차순으로 (상품, 점수)를 반환한다. 동점은 원래 순서 유지."""
+    scores = bm25_scores(tokenize(keyword), [product_terms(p) for p in products])
+    order = sorted(range(len(products)), key=lambda i: -scores[i])
+    return [(products[i], scores[i]) for i in order]
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from typing import Optional
 
 from app.logs import async_send_log
-from app.prompts.relevance import get_system_prompt
+from app.prompts.relevance import get_batch_system_prompt, get_system_prompt
 from app.schemas.llm import LlmSetting
 from app.schemas.products import SsadaguProduct
-from app.services.llm import LLMService
-from app.services.text_cleaner import try_repair_json
+from app.schemas.relevance import RelevanceBatchOutput, RelevanceOutput
+from app.services.llm import LLMOutputError, LLMService
+from app.services.product_context import product_spec_lines
 
 
 class RelevanceService:
@@ -21,11 +21,7 @@ class RelevanceService:
 
     @staticmethod
     def _user_input(keyword: str, product: SsadaguProduct, extra_prompt: str | None) -> str:
-        specs = (
-            "\n".join([f"- {k}: {v}" for k, v in (product.detail_specs or {}).items()])
-            if product.detail_specs
-            else "- 없음"
-        )
+        specs = product_spec_lines(product)
         price_text = f"{product.price}" if product.price is not None else "알 수 없음"
         return f"""키워드: {keyword}
 
@@ -40,6 +36,30 @@ class RelevanceService:
 추가 지시문(선택): {extra_prompt or '없음'}
 위 정보를 바탕으로 JSON(score, reason)만 반환."""
 
+    @staticmethod
+    def _batch_user_input(
+        keyword: str, products: list[SsadaguProduct], extra_prompt: str | None
+    ) -> str:
+        blocks = []
+        for idx, product in enumerate(products):
+            specs = product_spec_lines(product, indent="  ")
+            price_text = f"{product.price}" if product.price is not None else "알 수 없음"
+            blocks.append(
+                f"""[{idx}]
+- 이름: {product.title}
+- 가격: {price_text}
+- 스펙:
+{specs}"""
+            )
+        joined = "\n\n".join(blocks)
+        return f"""키워드: {keyword}
+
+상품 목록:
+{joined}
+
+추가 지시문(선택): {extra_prompt or '없음'}
+위 {len(products)}개 상품 각각에 대해 JSON(results: index, score, reason)만 반환."""
+
     async def evaluate(
         self,
         keyword: str,
@@ -56,39 +76,33 @@ class RelevanceService:
             message="키워드-상품 연관도 평가 시작",
             submessage=f"keyword={keyword}",
             logged_process="relevance",
-            level="WARN",
+            level="DEBUG",
             job_id=job_id or "",
         )
-        answer = await self.llm.chat(
-            system_prompt=system_prompt,
-            user_input=user_input,
-            model=llm_setting.modelName if llm_setting else None,
-            temperature=llm_setting.temperature if llm_setting else None,
-            api_key=llm_setting.apiKey if llm_setting else None,
-        )
-        cleaned_answer = try_repair_json(answer) or answer
-
-        score = 0.0
-        reason = cleaned_answer.strip()
         try:
-            parsed = json.loads(cleaned_answer)
-            score = float(parsed.get("score", 0.0))
-            reason = str(parsed.get("reason", "")).strip() or reason
-        except Exception:
-            # fallback: keep default score 0.0, use raw answer as reason
-            pass
-
-        # 점수 범위 보정
-        if score < 0.0:
+            parsed = await self.llm.chat_structured(
+                system_prompt,
+                user_input,
+                RelevanceOutput,
+                model=llm_setting.modelName if llm_setting else None,
+                temperature=llm_setting.temperature if llm_setting else None,
+                api_key=llm_setting.apiKey if llm_setting else None,
+                max_tokens=llm_setting.maxTokens if llm_setting else None,
+                stage="relevance",
+                hedge=True,
+            )
+            score = _clamp_score(parsed.score)
+            reason = parsed.reason.strip()
+        except LLMOutputError as exc:
+            # fallback: 재요청까지 실패한 경우에만 0.0, 원문을 근거로 사용
             score = 0.0
-        if score > 1.0:
-            score = 1.0
+            reason = exc.raw.strip()
 
         await send_log_async_safe(
             message="키워드-상품 연관도 평가 완료",
             submessage=f"keyword={keyword} | score={score} | reason={reason}",
             logged_process="relevance",
-            level="WARN",
+            level="INFO",
             job_id=job_id or "",
         )
         return {
@@ -97,6 +111,83 @@ class RelevanceService:
             "score": score,
             "reason": reason,
         }
+
+    async def evaluate_many(
+        self,
+        keyword: str,
+        products: list[SsadaguProduct],
+        *,
+        llm_setting: LlmSetting | None = None,
+        job_id: str | None = None,
+    ) -> list[dict[str, str | float]]:
+        """여러 상품을 한 번의 LLM 호출로 평가한다. 결과는 입력 순서를 따른다."""
+        if not products:
+            return []
+        extra_prompt = llm_setting.prompt if llm_setting else None
+        system_prompt = get_batch_system_prompt()
+        user_input = self._batch_user_input(keyword, products, extra_prompt)
+
+        await send_log_async_safe(
+            message="키워드-상품 연관도 일괄 평가 시작",
+            submessage=f"keyword={keyword} | count={len(products)}",
+            logged_process="relevance",
+            level="DEBUG",
+            job_id=job_id or "",
+        )
+        scored: dict[int, tuple[float, str]] = {}
+        try:
+            parsed = await self.llm.chat_structured(
+                system_prompt,
+                user_input,
+                RelevanceBatchOutput,
+                model=llm_setting.modelName if llm_setting else None,
+                temperature=llm_setting.temperature if llm_setting else None,
+                api_key=llm_setting.apiKey if llm_setting else None,
+                max_tokens=llm_setting.maxTokens if llm_setting else None,
+                stage="relevance_batch",
+            )
+            for item in parsed.results:
+                if 0 <= item.index < len(products) and item.index not in scored:
+                    scored[item.index] = (_clamp_score(item.score), item.reason.strip())
+        except LLMOutputError:
+            # fallback: 재요청까지 실패하면 모든 상품 0.0 처리
+            pass
+
+        results: list[dict[str, str | float]] = []
+        for idx, product in enumerate(products):
+            score, reason = scored.get(idx, (0.0, "평가 결과 없음"))
+            results.append(
+                {
+                    "keyword": keyword,
+                    "product_title": product.title,
+                    "score": score,
+                    "reason": reason,
+                }
+            )
+
+        best = max(results, key=lambda r: float(r["score"]))
+        await send_log_async_safe(
+            message="키워드-상품 연관도 일괄 평가 완료",
+            submessage=(
+                f"keyword={keyword} | count={len(products)} | scored={len(scored)} | "
+                f"best={best['product_title']} | score={best['score']}"
+            ),
+            logged_process="relevance",
+            level="INFO",
+            job_id=job_id or "",
+        )
+        return results
+
+
+def _clamp_score(score: float) -> float:
+    """점수 범위(0.0~1.0) 보정."""
+    if score < 0.0:
+        return 0.0
+    if score > 1.0:
+        return 1.0
+    return score
+
+
 async def send_log_async_safe(**kwargs) -> None:
     try:
         await async_send_log(**kwargs)
@@ -0,0 +1,69 @@
+"""동일한 진행 중 호출 병합 (single-flight).
+
+같은 키의 비동기 호출이 동시에 들어오면 첫 호출(leader)만 실제로 실행하고,
+나머지(follower)는 같은 결과를 함께 기다린다. 실제 작업은 호출자와 분리된
+task로 돌기 때문에 leader가 취소되어도 남은 대기자에게 결과가 전달되며,
+대기자가 모두 사라지면 작업도 취소된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        # (이벤트 루프 id, 키) -> [task, 대기자 수]
+        self._calls: dict[tuple[int, str], list[Any]] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """fn()의 결과와, 다른 호출의 결과를 공유받았는지 여부를 반환한다."""
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        with self._lock:
+            entry = self._calls.get(call_key)
+            shared = entry is not None
+            if entry is None:
+                entry = [loop.create_task(fn()), 0]
+                entry[0].add_done_callback(lambda _t: self._forget(call_key, entry))
+                self._calls[call_key] = entry
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+            entry[1] += 1
+        task: asyncio.Task = entry[0]
+        try:
+            return await asyncio.shield(task), shared
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                abandoned = entry[1] == 0 and not task.done()
+            if abandoned:
+                task.cancel()
+
+    def _forget(self, call_key: tuple[int, str], entry: list[Any]) -> None:
+        with self._lock:
+            if self._calls.get(call_key) is entry:
+                del self._calls[call_key]
+        task: asyncio.Task = entry[0]
+        if not task.cancelled():
+            # 대기자가 없을 때 난 예외가 "never retrieved" 경고로 남지 않게 한다
+            task.exception()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+LLM_SINGLE_FLIGHT = SingleFlight()
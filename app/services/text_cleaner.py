@@ -1,43 +1,172 @@
+"""LLM 응답에서 JSON을 꺼내는 단일 패스 추출기.
+
+모델이 JSON 앞뒤에 설명이나 마크다운 펜스를 붙이거나 max_tokens에 걸려 중간에 끊겨도
+첫 번째 균형 잡힌 객체/배열을 찾아낸다. 문자열과 이스케이프를 인식하므로 값 안의
+괄호/따옴표에 속지 않고, 스트리밍 청크를 feed()로 이어서 넣을 수 있다.
+"""
+
+from __future__ import annotations
+
 import json
 import re
+from typing import Optional
 
+# 문자열 밖에서 의미 있는 문자 / 문자열 안에서 의미 있는 문자
+_STRUCTURAL = re.compile(r'[{}\[\]",]')
+_IN_STRING = re.compile(r'["\\]')
+_OPENERS = re.compile(r"[{\[]")
+_CLOSERS = {"{": "}", "[": "]"}
 
-def try_repair_json(raw: str):
-    fixed = raw.strip()
-
-    # 마크다운 제거
-    fixed = re.sub(r"```json\s*", "", fixed, flags=re.IGNORECASE)
-    fixed = fixed.replace("```", "")
-
-    # 따옴표 짝 맞추기
-    quote_count = len(re.findall(r'"', fixed))
-    if quote_count % 2 != 0:
-        fixed += '"'
-
-    # 괄호 스택 기반 보정
-    stack = []
-    for char in fixed:
-        if char in ["{", "["]:
-            stack.append(char)
-        elif char == "}" and stack and stack[-1] == "{":
-            stack.pop()
-        elif char == "]" and stack and stack[-1] == "[":
-            stack.pop()
-
-    # 스택에 남은 것들 역순으로 닫기
-    while stack:
-        open_bracket = stack.pop()
-        if open_bracket == "{":
-            fixed += "}"
-        elif open_bracket == "[":
-            fixed += "]"
-
-    # 쉼표 제거
-    fixed = re.sub(r",\s*$", "", fixed)
-
-    # JSON 검증
-    try:
-        json.loads(fixed)
-        return fixed
-    except json.JSONDecodeError:
+
+class JsonExtractor:
+    """텍스트(또는 청크 스트림)에서 첫 번째 JSON 객체/배열을 찾는다.
+
+    result()는 완결된 JSON이 있으면 그대로, 끊긴 경우에는 열린 문자열/괄호를 닫아
+    json.loads가 받아들이는 문자열을 돌려준다. 찾지 못하면 None.
+    """
+
+    def __init__(self) -> None:
+        # 현재 후보(여는 괄호부터)의 텍스트 조각. 매 청크마다 전체를 복사하지 않도록 나눠 둔다
+        self._parts: list[str] = []
+        self._length = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        # 끊긴 출력 복구용: 마지막으로 값이 온전히 끝난 지점 (후보 기준 길이, 그 시점의 스택)
+        self._safe: tuple[int, str] = (0, "")
+        self._done: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        return self._done is not None
+
+    def feed(self, chunk: str) -> bool:
+        """청크를 이어서 스캔한다. 완결된 JSON을 찾았으면 True."""
+        pending: Optional[str] = chunk
+        while pending and self._done is None:
+            pending = self._scan(pending)
+        return self._done is not None
+
+    def _scan(self, text: str) -> Optional[str]:
+        """text(새 청크)만 스캔한다. 후보가 무효로 판명되면 다시 스캔할 텍스트를 반환."""
+        stack = self._stack
+        pos, end = 0, len(text)
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _IN_STRING.search(text, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+            if not stack:
+                # 후보 시작 전: 첫 여는 괄호까지의 설명/펜스는 버린다
+                match = _OPENERS.search(text, pos)
+                if match is None:
+                    return None
+                text = text[match.start():]
+                pos, end = 1, len(text)
+                stack.append(text[0])
+                self._safe = (1, text[0])
+                continue
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                break
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in _CLOSERS:
+                stack.append(char)
+                self._safe = (self._length + pos, "".join(stack))
+            elif char in "}]":
+                if _CLOSERS[stack[-1]] != char:
+                    # 짝이 안 맞으면 이 후보는 버리고 첫 글자 다음부터 다시 찾는다
+                    return self._restart(text)
+                stack.pop()
+                if not stack:
+                    candidate = "".join(self._parts) + text[:pos]
+                    if _is_valid(candidate):
+                        self._done = candidate
+                        return None
+                    return self._restart(text)
+                self._safe = (self._length + pos, "".join(stack))
+            elif char == ",":
+                self._safe = (self._length + pos - 1, "".join(stack))
+        self._parts.append(text)
+        self._length += len(text)
         return None
+
+    def _restart(self, text: str) -> str:
+        candidate = "".join(self._parts) + text
+        self._parts.clear()
+        self._length = 0
+        self._stack.clear()
+        self._in_string = False
+        self._escape = False
+        return candidate[1:]
+
+    def result(self) -> Optional[str]:
+        """완결된 JSON, 또는 끊긴 출력을 닫아 만든 JSON. 없으면 None."""
+        if self._done is not None:
+            return self._done
+        if not self._stack:
+            return None
+        repaired = self._close_naive()
+        if _is_valid(repaired):
+            return repaired
+        # 끊긴 위치가 키/리터럴 중간이면 마지막으로 값이 끝난 지점까지 되돌린다
+        length, stack = self._safe
+        repaired = "".join(self._parts)[:length].rstrip().rstrip(",") + _closing(stack)
+        return repaired if _is_valid(repaired) else None
+
+    def _close_naive(self) -> str:
+        text = "".join(self._parts)
+        if self._in_string:
+            if self._escape:
+                text = text[:-1]
+            text += '"'
+        text = text.rstrip()
+        if text.endswith(","):
+            text = text[:-1]
+        elif text.endswith(":"):
+            text += " null"
+        return text + _closing("".join(self._stack))
+
+
+def _closing(stack: str) -> str:
+    return "".join(_CLOSERS[c] for c in reversed(stack))
+
+
+def _is_valid(candidate: str) -> bool:
+    try:
+        json.loads(candidate)
+    except ValueError:
+        return False
+    return True
+
+
+def extract_json(text: str) -> Optional[str]:
+    """텍스트에서 첫 번째 JSON 객체/배열을 찾아(끊겼으면 닫아서) 반환한다."""
+    extractor = JsonExtractor()
+    extractor.feed(text)
+    return extractor.result()
+
+
+def try_repair_json(raw: str) -> Optional[str]:
+    """LLM 응답을 json.loads 가능한 문자열로 고친다. 실패하면 None.
+
+    객체/배열이 없으면 응답 전체가 JSON 스칼라인지 확인한다.
+    """
+    extracted = extract_json(raw)
+    if extracted is not None:
+        return extracted
+    stripped = raw.strip()
+    return stripped if stripped and _is_valid(stripped) else None
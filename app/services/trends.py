@@ -9,7 +9,7 @@ from typing import Optional, Set
 from playwright.async_api import Page, async_playwright
 from pydantic import ValidationError
 
-from app.logs import async_send_log, send_log
+from app.logs import async_send_log, log_nowait
 from app.schemas.trends import GoogleCrawlerResponse, GoogleTrendItem
 
 TREND_URL = "https://trends.google.co.kr/trending?geo=KR"
@@ -233,8 +233,9 @@ async def _log_async(level: str, message: str, sub: str = "", job_id: str | None
 
 
 def _log_sync(level: str, message: str, sub: str = "", job_id: str | None = None) -> None:
+    """동기 메서드용. 이벤트 루프 위에서 불려도 네트워크 대기 없이 반환한다."""
     try:
-        send_log(
+        log_nowait(
             message=message,
             level=level,
             submessage=sub,
@@ -0,0 +1,178 @@
+"""LLM 토큰 사용량 집계.
+
+LLMService가 호출마다 프롬프트/완성/캐시 토큰을 기록하고, 현재 작업 컨텍스트
+(track_usage)가 있으면 jobId 단위 장부에 단계(stage)별로 누적한다. 프로세스 전체의
+사용자/작업별 합계는 USAGE_STATS에서 조회한다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator, Optional
+
+MAX_TRACKED_JOBS = 500
+
+
+@dataclass
+class TokenUsage:
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    calls: int = 0
+    cache_hits: int = 0
+    # 진행 중인 동일 호출에 합류해 비용 없이 응답을 받은 횟수
+    coalesced: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "TokenUsage") -> None:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cached_tokens += other.cached_tokens
+        self.calls += other.calls
+        self.cache_hits += other.cache_hits
+        self.coalesced += other.coalesced
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "total_tokens": self.total_tokens}
+
+
+def usage_from_message(message: Any) -> TokenUsage:
+    """langchain AIMessage(또는 청크)의 usage_metadata에서 사용량을 읽는다."""
+    meta = getattr(message, "usage_metadata", None) or {}
+    if meta:
+        details = meta.get("input_token_details") or {}
+        return TokenUsage(
+            prompt_tokens=int(meta.get("input_tokens") or 0),
+            completion_tokens=int(meta.get("output_tokens") or 0),
+            cached_tokens=int(details.get("cache_read") or 0),
+            calls=1,
+        )
+    # 구버전 langchain: response_metadata.token_usage (OpenAI 원형)
+    raw = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+    details = raw.get("prompt_tokens_details") or {}
+    return TokenUsage(
+        prompt_tokens=int(raw.get("prompt_tokens") or 0),
+        completion_tokens=int(raw.get("completion_tokens") or 0),
+        cached_tokens=int(details.get("cached_tokens") or 0),
+        calls=1,
+    )
+
+
+class UsageLedger:
+    """한 작업(jobId)의 단계별 토큰 사용량."""
+
+    def __init__(self, job_id: str = "", user_id: int = 1):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.stages: dict[str, TokenUsage] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, usage: TokenUsage) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, TokenUsage()).add(usage)
+
+    def merge(self, other: "UsageLedger", *, stage: Optional[str] = None) -> None:
+        """다른 장부를 합친다. stage를 주면 모든 사용량을 그 단계 이름으로 모은다."""
+        for name, usage in list(other.stages.items()):
+            self.record(stage or name, usage)
+
+    def total(self) -> TokenUsage:
+        total = TokenUsage()
+        with self._lock:
+            for usage in self.stages.values():
+                total.add(usage)
+        return total
+
+    def summary(self) -> dict[str, Any]:
+        """로그 meta로 보낼 요약. 단계는 총 토큰 내림차순."""
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda kv: -kv[1].total_tokens)
+            by_stage = {name: usage.as_dict() for name, usage in stages}
+        return {
+            "jobId": self.job_id,
+            "userId": self.user_id,
+            "total": self.total().as_dict(),
+            "stages": by_stage,
+        }
+
+
+class UsageStats:
+    """프로세스 전체의 사용자별/작업별 누적 사용량 (작업은 최근 N개만 유지)."""
+
+    def __init__(self, max_jobs: int = MAX_TRACKED_JOBS):
+        self.max_jobs = max_jobs
+        self.total = TokenUsage()
+        self.by_user: dict[int, TokenUsage] = {}
+        self.by_job: OrderedDict[str, TokenUsage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, usage: TokenUsage, *, job_id: str = "", user_id: Optional[int] = None) -> None:
+        with self._lock:
+            self.total.add(usage)
+            if user_id is not None:
+                self.by_user.setdefault(user_id, TokenUsage()).add(usage)
+            if job_id:
+                self.by_job.setdefault(job_id, TokenUsage()).add(usage)
+                self.by_job.move_to_end(job_id)
+                while len(self.by_job) > self.max_jobs:
+                    self.by_job.popitem(last=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "total": self.total.as_dict(),
+                "users": {uid: u.as_dict() for uid, u in self.by_user.items()},
+                "jobs": len(self.by_job),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total = TokenUsage()
+            self.by_user.clear()
+            self.by_job.clear()
+
+
+USAGE_STATS = UsageStats()
+
+_LEDGER_CTX: contextvars.ContextVar[Optional[UsageLedger]] = contextvars.ContextVar(
+    "llm_usage_ledger", default=None
+)
+
+
+@contextmanager
+def track_usage(
+    job_id: str = "", user_id: int = 1, *, ledger: Optional[UsageLedger] = None
+) -> Iterator[UsageLedger]:
+    """블록 안(및 여기서 만든 task)의 LLM 호출을 하나의 작업 장부에 모은다."""
+    ledger = ledger if ledger is not None else UsageLedger(job_id, user_id)
+    token = _LEDGER_CTX.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _LEDGER_CTX.reset(token)
+
+
+def current_ledger() -> Optional[UsageLedger]:
+    return _LEDGER_CTX.get()
+
+
+def record_usage(stage: str, usage: TokenUsage) -> None:
+    ledger = _LEDGER_CTX.get()
+    if ledger is not None:
+        ledger.record(stage, usage)
+        USAGE_STATS.record(usage, job_id=ledger.job_id, user_id=ledger.user_id)
+    else:
+        USAGE_STATS.record(usage)
+
+
+def usage_meta() -> dict[str, Any]:
+    """현재 작업 장부 요약 (장부가 없으면 빈 dict)."""
+    ledger = _LEDGER_CTX.get()
+    return {"usage": ledger.summary()} if ledger is not None else {}
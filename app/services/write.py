@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import random
-from pathlib import Path
+import time
+from dataclasses import dataclass
 from typing import Any, Optional
-from urllib.parse import urlparse
 
-import httpx
 try:
     from langsmith import traceable
 except ImportError:  # pragma: no cover - optional
@@ -23,17 +22,37 @@ from app.schemas.llm import LlmSetting
 from app.schemas.products import SsadaguProduct
 from app.schemas.upload import UploadChannelSettings, UploadRequest
 from app.schemas.write import WriteRequest, WriteResponse
+from app.services.category import CategoryClassifier, CategoryPrediction
+from app.services.deferred import DEFERRED_QUEUE, DeferredQueue
 from app.services.keywords import KeywordService
 from app.services.llm import LLMService
 from app.services.promo import PromoService
+from app.services.ranking import rank_products
 from app.services.relevance import RelevanceService
 from app.services.ssadagu import SsadaguService
-from app.services.text_cleaner import try_repair_json
 from app.services.trends import GoogleTrendsService
 from app.services.upload import UploadService
+from app.services.usage import UsageLedger, current_ledger, track_usage, usage_meta
+from app.spool import deliver
 
 RELEVANCE_THRESHOLD = 0.8
 MAX_RETRIES = 5
+RELEVANCE_BATCH_SIZE = 10
+RELEVANCE_CONCURRENT_CANDIDATES = 5
+RELEVANCE_CONCURRENCY_LIMIT = 3
+SELECTION_MODES = {"single", "batch", "concurrent"}
+# 탈락해 버려진 투기적 초안의 토큰이 모이는 사용량 단계 이름
+SPECULATIVE_DISCARDED_STAGE = "speculative_discarded"
+
+
+@dataclass
+class SpeculativeDraft:
+    """연관도 평가와 동시에 시작한 홍보글 초안 작업."""
+
+    task: asyncio.Task
+    ledger: UsageLedger
+    started: float
+    settled: float = 0.0
 
 
 class WriteService:
@@ -49,6 +68,13 @@ class WriteService:
         promo: Optional[PromoService] = None,
         upload: Optional[UploadService] = None,
         category_llm: Optional[LLMService] = None,
+        selection_mode: Optional[str] = None,
+        prerank: Optional[bool] = None,
+        fused_generation: Optional[bool] = None,
+        speculative: Optional[bool] = None,
+        defer_manual: Optional[bool] = None,
+        deferred_queue: Optional[DeferredQueue] = None,
+        settings: Optional[config.Settings] = None,
     ):
         self.trends = trends or GoogleTrendsService()
         self.keywords = keywords or KeywordService()
@@ -57,42 +83,66 @@ class WriteService:
         self.promo = promo or PromoService()
         self.upload = upload or UploadService()
         self.category_llm = category_llm or LLMService()
+        self.category_classifier = CategoryClassifier(self.category_llm)
+        mode = config.get_write_selection_mode(selection_mode)
+        if mode not in SELECTION_MODES:
+            raise ValueError(f"지원하지 않는 상품 선택 모드: {mode}")
+        self.selection_mode = mode
+        self.prerank = config.get_write_prerank_enabled(prerank)
+        self.fused_generation = config.get_write_fused_generation(fused_generation)
+        self.speculative = config.get_write_speculative_generation(speculative)
+        self.defer_manual = config.get_write_defer_manual(defer_manual)
+        self.deferred_queue = deferred_queue or DEFERRED_QUEUE
+        self._settings = settings
+
+    @property
+    def settings(self) -> config.Settings:
+        """주입된 설정이 없으면 현재 스냅샷 (핫 리로드 반영)."""
+        return self._settings or config.get_settings()
 
     @traceable(run_type="chain")
     async def process(self, req: WriteRequest) -> WriteResponse:
-        """전체 프로세스를 실행한다. LangGraph가 있으면 그래프, 없으면 순차."""
+        """전체 프로세스를 실행한다. LangGraph가 있으면 그래프, 없으면 순차.
+
+        실행 중 LLM 토큰 사용량은 jobId 장부에 모여 완료 로그 meta로 전송된다.
+        """
+        with track_usage(req.jobId, _resolve_user_id(req)):
+            return await self._process(req)
+
+    async def _process(self, req: WriteRequest) -> WriteResponse:
         upload_channel = _first_channel(req.uploadChannels)
         user_id = _resolve_user_id(req)
-        try:
-            from app.flows.write_graph import build_write_graph
+        # 순환 임포트를 피해 지연 임포트 (두 번째 요청부터는 sys.modules 조회뿐)
+        from app.flows.write_graph import GRAPH_AVAILABLE, get_write_graph, run_config
 
-            graph = build_write_graph(
-                self,
-                max_retries=MAX_RETRIES,
-                relevance_threshold=RELEVANCE_THRESHOLD,
-            )
-            initial = {
-                "keyword": req.keyword,
-                "retries": 0,
-                "generation_type": req.llmChannel.generationType,
-                "upload_channel": upload_channel,
-                "llm_setting": req.llmChannel,
-                "user_id": user_id,
-                "job_id": req.jobId,
-                "platform": None,
-                "upload_request_builder": _to_upload_request_from_state,
-            }
-            state = await graph.ainvoke(initial)
-            chosen_product: SsadaguProduct = state["product"]
-            return WriteResponse(
-                jobId=req.jobId,
-                keyword=state["keyword"],
-                product_title=chosen_product.title,
-                link=state.get("link", ""),
-            )
-        except ImportError:
+        if not GRAPH_AVAILABLE:
             return await self._process_sequential(req)
 
+        # 그래프는 한 번 컴파일해 재사용하고, 이 서비스와 실행별 작업 상태는 config로 넘긴다
+        graph = get_write_graph(
+            max_retries=MAX_RETRIES,
+            relevance_threshold=RELEVANCE_THRESHOLD,
+        )
+        initial = {
+            "keyword": req.keyword,
+            "retries": 0,
+            "generation_type": req.llmChannel.generationType,
+            "upload_channel": upload_channel,
+            "llm_setting": req.llmChannel,
+            "user_id": user_id,
+            "job_id": req.jobId,
+            "platform": None,
+            "upload_request_builder": _to_upload_request_from_state,
+        }
+        state = await graph.ainvoke(initial, config=run_config(self))
+        chosen_product: SsadaguProduct = state["product"]
+        return WriteResponse(
+            jobId=req.jobId,
+            keyword=state["keyword"],
+            product_title=chosen_product.title,
+            link=state.get("link", ""),
+        )
+
     @traceable(run_type="chain")
     async def _process_sequential(self, req: WriteRequest) -> WriteResponse:
         """LangGraph 미사용 시 순차 실행."""
@@ -145,6 +195,9 @@ class WriteService:
         # 2~4. 상품 검색 및 연관도 확인 (최대 5회)
         attempts = 0
         chosen_product: Optional[SsadaguProduct] = None
+        tried: set[str] = set()
+        drafts: dict[str, SpeculativeDraft] = {}
+        platform = _resolve_platform(upload_channel)
         while attempts < MAX_RETRIES:
             attempts += 1
             products = await self.ssadagu.search(
@@ -152,11 +205,16 @@ class WriteService:
             )
             if not products:
                 raise RuntimeError("싸다구 상품을 찾지 못했습니다.")
-            product = random.choice(list(products))
-            rel = await self.relevance.evaluate(
-                keyword, product, llm_setting=req.llmChannel, job_id=job_id
+            product, score = await self.select_product(
+                keyword,
+                list(products),
+                llm_setting=req.llmChannel,
+                job_id=job_id,
+                tried=tried,
+                drafts=drafts,
+                platform=platform,
+                user_id=user_id,
             )
-            score = float(rel.get("score", 0.0))
             await _log(
                 "INFO",
                 "연관도 평가",
@@ -178,21 +236,41 @@ class WriteService:
             )
             raise RuntimeError("연관된 상품을 찾지 못했습니다.")
 
-        # 5. 홍보글 작성
-        platform = _resolve_platform(upload_channel)
-        promo = await self.promo.generate(
-            chosen_product, platform=platform, llm_setting=req.llmChannel, job_id=job_id
+        generation_type = req.llmChannel.generationType
+        # MANUAL: 글 생성과 컨텐츠 전송은 지연 큐에서 낮은 우선순위로 처리 (큐가 차면 바로 생성)
+        if self.should_defer(generation_type) and self.defer_generation(
+            chosen_product,
+            keyword=keyword,
+            platform=platform,
+            llm_setting=req.llmChannel,
+            job_id=job_id,
+            user_id=user_id,
+            upload_channel_id=upload_channel.id,
+            generation_type=generation_type,
+            drafts=drafts,
+        ):
+            return WriteResponse(
+                jobId=job_id,
+                keyword=keyword,
+                product_title=chosen_product.title,
+                link="",
+            )
+
+        # 5. 홍보글 작성 + 카테고리 분류 (투기적 초안이 있으면 재사용)
+        title, body, category = await self.generate_post(
+            chosen_product,
+            platform=platform,
+            llm_setting=req.llmChannel,
+            job_id=job_id,
+            user_id=user_id,
+            drafts=drafts,
         )
-        title = promo.get("title", "").strip()
-        body = promo.get("body", "").strip()
-        category = await self.classify_category(chosen_product, req.llmChannel)
 
         # 6. 본문 내 링크를 리디렉트 링크로 치환
-        redirect_url = _build_redirect_url(job_id)
+        redirect_url = _build_redirect_url(job_id, self.settings)
         body_replaced = body.replace(str(chosen_product.product_link), redirect_url)
 
         link_out = ""
-        generation_type = req.llmChannel.generationType
         content_generation_type = generation_type or ""
         generation_type_upper = content_generation_type.upper()
 
@@ -229,6 +307,7 @@ class WriteService:
             keyword=keyword,
             product=chosen_product,
             category=category,
+            settings=self.settings,
         )
 
         await _log(
@@ -238,6 +317,7 @@ class WriteService:
             user_id=user_id,
             keyword=keyword,
             is_notifiable=True,
+            meta=usage_meta(),
         )
         return WriteResponse(
             jobId=job_id,
@@ -246,12 +326,430 @@ class WriteService:
             link=link_out,
         )
 
+    async def select_product(
+        self,
+        keyword: str,
+        products: list[SsadaguProduct],
+        *,
+        llm_setting: LlmSetting | None = None,
+        job_id: str | None = None,
+        threshold: float = RELEVANCE_THRESHOLD,
+        tried: set[str] | None = None,
+        drafts: dict[str, SpeculativeDraft] | None = None,
+        platform: str | None = None,
+        user_id: int = 1,
+    ) -> tuple[SsadaguProduct, float]:
+        """선택 모드에 따라 후보를 평가해 (상품, 연관도 점수)를 반환한다.
+
+        tried가 주어지면 이미 평가한 상품 링크는 후보에서 제외하고,
+        이번에 평가한 후보의 링크를 추가한다(재시도 간 중복 평가 방지).
+        speculative 모드에서 drafts와 platform이 주어지면 1순위 후보의 홍보글을
+        평가와 동시에 생성하고, 통과한 초안만 drafts에 남긴다(single/batch 모드).
+        """
+        if not products:
+            raise RuntimeError("평가할 상품이 없습니다.")
+        if self.selection_mode == "concurrent":
+            candidates = self._candidates(
+                keyword, products, RELEVANCE_CONCURRENT_CANDIDATES, tried, shuffle=True
+            )
+            _mark_tried(tried, candidates)
+            return await self._select_concurrent(
+                keyword,
+                candidates,
+                llm_setting=llm_setting,
+                job_id=job_id,
+                threshold=threshold,
+            )
+        if self.selection_mode == "batch":
+            candidates = self._candidates(keyword, products, RELEVANCE_BATCH_SIZE, tried)
+            _mark_tried(tried, candidates)
+            # 무작위 순서일 때 첫 후보는 1순위가 아니므로 순위화한 경우에만 투기
+            draft = self._start_draft(
+                candidates[0] if self.prerank else None,
+                drafts,
+                platform=platform,
+                llm_setting=llm_setting,
+                job_id=job_id,
+                user_id=user_id,
+            )
+            keep = False
+            try:
+                results = await self.relevance.evaluate_many(
+                    keyword, candidates, llm_setting=llm_setting, job_id=job_id
+                )
+                best_idx = max(
+                    range(len(candidates)),
+                    key=lambda i: float(results[i].get("score", 0.0)),
+                )
+                score = float(results[best_idx].get("score", 0.0))
+                keep = best_idx == 0 and score >= threshold
+            finally:
+                await self._settle_draft(
+                    draft, drafts, candidates[0], keep=keep, job_id=job_id, user_id=user_id
+                )
+            return candidates[best_idx], score
+
+        product = self._candidates(keyword, products, 1, tried, shuffle=True)[0]
+        _mark_tried(tried, [product])
+        draft = self._start_draft(
+            product,
+            drafts,
+            platform=platform,
+            llm_setting=llm_setting,
+            job_id=job_id,
+            user_id=user_id,
+        )
+        keep = False
+        try:
+            rel = await self.relevance.evaluate(
+                keyword, product, llm_setting=llm_setting, job_id=job_id
+            )
+            score = float(rel.get("score", 0.0))
+            keep = score >= threshold
+        finally:
+            await self._settle_draft(
+                draft, drafts, product, keep=keep, job_id=job_id, user_id=user_id
+            )
+        return product, score
+
+    def _start_draft(
+        self,
+        product: SsadaguProduct | None,
+        drafts: dict[str, SpeculativeDraft] | None,
+        *,
+        platform: str | None,
+        llm_setting: LlmSetting | None,
+        job_id: str | None,
+        user_id: int,
+    ) -> SpeculativeDraft | None:
+        """speculative 모드면 연관도 평가와 겹쳐 홍보글 초안 생성을 시작한다."""
+        if not self.speculative or product is None or drafts is None or platform is None:
+            return None
+        ledger = UsageLedger(job_id or "", user_id)
+
+        async def _compose() -> tuple[str, str, CategoryPrediction]:
+            # 초안 사용량은 별도 장부에 모았다가 채택/폐기 시 작업 장부에 합친다
+            with track_usage(ledger=ledger):
+                return await self._compose_post(
+                    product, platform=platform, llm_setting=llm_setting, job_id=job_id or ""
+                )
+
+        return SpeculativeDraft(asyncio.create_task(_compose()), ledger, time.perf_counter())
+
+    async def _settle_draft(
+        self,
+        draft: SpeculativeDraft | None,
+        drafts: dict[str, SpeculativeDraft] | None,
+        product: SsadaguProduct,
+        *,
+        keep: bool,
+        job_id: str | None,
+        user_id: int,
+    ) -> None:
+        """통과한 초안은 drafts에 보관하고, 탈락한 초안은 취소 후 사용량을 폐기 단계로 기록한다."""
+        if draft is None or drafts is None:
+            return
+        draft.settled = time.perf_counter()
+        if keep:
+            drafts[str(product.product_link)] = draft
+            return
+        draft.task.cancel()
+        await asyncio.gather(draft.task, return_exceptions=True)
+        ledger = current_ledger()
+        if ledger is not None:
+            ledger.merge(draft.ledger, stage=SPECULATIVE_DISCARDED_STAGE)
+        await _log(
+            "INFO",
+            "투기적 홍보글 폐기",
+            sub=f"tokens={draft.ledger.total().total_tokens}",
+            job_id=job_id or "",
+            user_id=user_id,
+        )
+
+    def _candidates(
+        self,
+        keyword: str,
+        products: list[SsadaguProduct],
+        limit: int,
+        tried: set[str] | None,
+        *,
+        shuffle: bool = False,
+    ) -> list[SsadaguProduct]:
+        """평가 후보를 고른다. prerank면 어휘 유사도 상위, 아니면 무작위/크롤링 순서."""
+        pool = [p for p in products if str(p.product_link) not in (tried or set())]
+        if not pool:
+            pool = list(products)
+        if self.prerank:
+            return [p for p, _ in rank_products(keyword, pool)[:limit]]
+        if shuffle:
+            return random.sample(pool, min(len(pool), limit))
+        return pool[:limit]
+
+    async def _select_concurrent(
+        self,
+        keyword: str,
+        products: list[SsadaguProduct],
+        *,
+        llm_setting: LlmSetting | None,
+        job_id: str | None,
+        threshold: float,
+    ) -> tuple[SsadaguProduct, float]:
+        """후보를 동시에 평가하고 임계값을 처음 넘는 후보에서 나머지를 취소한다."""
+        semaphore = asyncio.Semaphore(RELEVANCE_CONCURRENCY_LIMIT)
+
+        async def _score(product: SsadaguProduct) -> tuple[SsadaguProduct, float]:
+            async with semaphore:
+                rel = await self.relevance.evaluate(
+                    keyword, product, llm_setting=llm_setting, job_id=job_id
+                )
+            return product, float(rel.get("score", 0.0))
+
+        tasks = [asyncio.create_task(_score(p)) for p in products]
+        best: tuple[SsadaguProduct, float] | None = None
+        last_error: Exception | None = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    product, score = await next_done
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                if best is None or score > best[1]:
+                    best = (product, score)
+                if score >= threshold:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if best is None:
+            raise last_error or RuntimeError("연관도 평가에 모두 실패했습니다.")
+        return best
+
+    async def generate_post(
+        self,
+        product: SsadaguProduct,
+        *,
+        platform: str,
+        llm_setting: LlmSetting | None = None,
+        job_id: str = "",
+        user_id: int = 1,
+        drafts: dict[str, SpeculativeDraft] | None = None,
+    ) -> tuple[str, str, str]:
+        """홍보글과 카테고리를 생성해 (title, body, category)를 반환한다.
+
+        drafts에 이 상품의 투기적 초안이 있으면 그 결과를 쓰고, 초안이 실패했으면 새로 생성한다.
+        """
+        draft = (drafts or {}).pop(str(product.product_link), None)
+        if draft is not None:
+            (result,) = await asyncio.gather(draft.task, return_exceptions=True)
+            ledger = current_ledger()
+            if ledger is not None:
+                ledger.merge(draft.ledger)
+            if not isinstance(result, BaseException):
+                title, body, prediction = result
+                # 초안이 평가보다 늦게 끝났어도 평가 시간만큼은 임계 경로에서 빠진다
+                overlap_ms = (draft.settled - draft.started) * 1000
+                await _log(
+                    "INFO",
+                    "투기적 홍보글 사용",
+                    sub=f"overlap_ms={overlap_ms:.0f}",
+                    job_id=job_id,
+                    user_id=user_id,
+                )
+                await self._log_category(prediction, job_id=job_id, user_id=user_id)
+                return title, body, prediction.category
+
+        title, body, prediction = await self._compose_post(
+            product, platform=platform, llm_setting=llm_setting, job_id=job_id
+        )
+        await self._log_category(prediction, job_id=job_id, user_id=user_id)
+        return title, body, prediction.category
+
+    async def _compose_post(
+        self,
+        product: SsadaguProduct,
+        *,
+        platform: str,
+        llm_setting: LlmSetting | None,
+        job_id: str,
+    ) -> tuple[str, str, CategoryPrediction]:
+        """홍보글과 카테고리 예측을 만든다 (로그 없음).
+
+        로컬 카테고리 분류가 확실하면 홍보글만 생성하고, 아니면 fused 모드에서
+        한 번의 호출로 함께 생성한다. 파싱 실패 시에만 개별 호출로 폴백한다.
+        """
+        classifier = self.category_classifier
+        local, accept = classifier.predict_local(product)
+        if accept:
+            promo = await self.promo.generate(
+                product, platform=platform, llm_setting=llm_setting, job_id=job_id
+            )
+            classifier.stats.record(local=local, llm_label=None)
+            return promo.get("title", "").strip(), promo.get("body", "").strip(), local
+
+        if self.fused_generation:
+            fused = await self.promo.generate_with_category(
+                product,
+                categories=classifier.categories,
+                platform=platform,
+                llm_setting=llm_setting,
+                job_id=job_id,
+            )
+            if fused is not None:
+                if fused["category"]:
+                    prediction = classifier.record_llm_label(local, fused["category"])
+                else:
+                    prediction = await classifier.classify_with_llm(
+                        product, llm_setting, local=local
+                    )
+                return fused["title"], fused["body"], prediction
+
+        # 개별 호출: 서로 독립이므로 동시에 실행
+        promo, prediction = await asyncio.gather(
+            self.promo.generate(
+                product, platform=platform, llm_setting=llm_setting, job_id=job_id
+            ),
+            classifier.classify_with_llm(product, llm_setting, local=local),
+        )
+        return promo.get("title", "").strip(), promo.get("body", "").strip(), prediction
+
+    def should_defer(self, generation_type: str | None) -> bool:
+        """AUTO가 아닌 작업이고 지연 생성이 켜져 있고 지연 큐에 자리가 있으면 True."""
+        return (
+            self.defer_manual
+            and (generation_type or "").upper() != "AUTO"
+            and self.deferred_queue.has_room()
+        )
+
+    def defer_generation(
+        self,
+        product: SsadaguProduct,
+        *,
+        keyword: str,
+        platform: str,
+        llm_setting: LlmSetting | None,
+        job_id: str,
+        user_id: int,
+        upload_channel_id: int,
+        generation_type: str | None,
+        drafts: dict[str, SpeculativeDraft] | None = None,
+    ) -> bool:
+        """선택된 상품의 글 생성/전송을 지연 큐에 넣는다. 사용량은 현재 작업 장부에 이어서 쌓인다.
+
+        큐가 가득 차 넣지 못했으면 False (호출자가 바로 생성한다).
+        """
+        ledger = current_ledger() or UsageLedger(job_id, user_id)
+
+        async def _job() -> None:
+            with track_usage(ledger=ledger):
+                await self.complete_manual(
+                    product,
+                    keyword=keyword,
+                    platform=platform,
+                    llm_setting=llm_setting,
+                    job_id=job_id,
+                    user_id=user_id,
+                    upload_channel_id=upload_channel_id,
+                    generation_type=generation_type or "MANUAL",
+                    drafts=drafts,
+                )
+
+        return self.deferred_queue.submit(f"write:{job_id}", _job, job_id=job_id)
+
+    async def complete_manual(
+        self,
+        product: SsadaguProduct,
+        *,
+        keyword: str,
+        platform: str,
+        llm_setting: LlmSetting | None,
+        job_id: str,
+        user_id: int,
+        upload_channel_id: int,
+        generation_type: str,
+        drafts: dict[str, SpeculativeDraft] | None = None,
+    ) -> None:
+        """MANUAL 작업의 나머지 단계: 홍보글/카테고리 생성 후 /api/content 전송."""
+        try:
+            title, body, category = await self.generate_post(
+                product,
+                platform=platform,
+                llm_setting=llm_setting,
+                job_id=job_id,
+                user_id=user_id,
+                drafts=drafts,
+            )
+        except Exception as exc:
+            await _log(
+                "ERROR",
+                "지연 글 생성 실패",
+                sub=str(exc),
+                job_id=job_id,
+                user_id=user_id,
+                keyword=keyword,
+            )
+            raise
+        body = body.replace(str(product.product_link), _build_redirect_url(job_id, self.settings))
+        await _post_content(
+            job_id=job_id,
+            upload_channel_id=upload_channel_id,
+            user_id=user_id,
+            title=title,
+            body=body,
+            generation_type=generation_type,
+            link="",
+            keyword=keyword,
+            product=product,
+            category=category,
+            settings=self.settings,
+        )
+        await _log(
+            "INFO",
+            "write 프로세스 완료",
+            job_id=job_id,
+            user_id=user_id,
+            keyword=keyword,
+            is_notifiable=True,
+            meta=usage_meta(),
+        )
+
     async def classify_category(
-        self, product: SsadaguProduct, llm_setting: LlmSetting | None = None
+        self,
+        product: SsadaguProduct,
+        llm_setting: LlmSetting | None = None,
+        *,
+        job_id: str = "",
+        user_id: int = 1,
     ) -> str:
-        """카테고리 목록 파일을 읽어 상품 카테고리를 LLM으로 분류."""
-        categories = _load_categories()
-        return await _classify_category(product, self.category_llm, llm_setting, categories)
+        """로컬 분류기로 카테고리를 고르고, 신뢰도가 낮으면 LLM으로 분류."""
+        prediction = await self.category_classifier.classify(product, llm_setting)
+        await self._log_category(prediction, job_id=job_id, user_id=user_id)
+        return prediction.category
+
+    async def _log_category(
+        self, prediction: CategoryPrediction, *, job_id: str, user_id: int
+    ) -> None:
+        stats = self.category_classifier.stats.snapshot()
+        await _log(
+            "INFO",
+            "카테고리 분류",
+            sub=(
+                f"category={prediction.category} | source={prediction.source} | "
+                f"confidence={prediction.confidence} | "
+                f"llm_avoided_rate={stats['llm_avoided_rate']:.2f} | "
+                f"local_accuracy={stats['local_accuracy']:.2f}"
+            ),
+            job_id=job_id,
+            user_id=user_id,
+        )
+
+
+def _mark_tried(tried: set[str] | None, products: list[SsadaguProduct]) -> None:
+    if tried is not None:
+        tried.update(str(p.product_link) for p in products)
 
 
 def _first_channel(
@@ -271,11 +769,8 @@ def _resolve_platform(ch: UploadChannelSettings) -> str:
     return name or "naver_blog"
 
 
-def _build_redirect_url(job_id: str) -> str:
-    base = config.get_log_endpoint()
-    parsed = urlparse(base)
-    host = f"{parsed.scheme}://{parsed.netloc}"
-    return f"{host}/api/link?jobId={job_id}"
+def _build_redirect_url(job_id: str, settings: Optional[config.Settings] = None) -> str:
+    return (settings or config.get_settings()).redirect_url(job_id)
 
 
 def _to_upload_request(
@@ -328,6 +823,7 @@ async def _post_content(
     keyword: str,
     product: SsadaguProduct,
     category: str,
+    settings: Optional[config.Settings] = None,
 ) -> None:
     gen_type_upper = (generation_type or "").upper()
     status = "APPROVED" if gen_type_upper == "AUTO" else "PENDING"
@@ -349,19 +845,10 @@ async def _post_content(
             "category": category,
         },
     }
-    base = config.get_log_endpoint()
-    parsed = urlparse(base)
-    host = f"{parsed.scheme}://{parsed.netloc}"
-    url = f"{host}/api/content"
+    url = (settings or config.get_settings()).content_url()
     try:
-        headers = config.build_internal_headers()
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                url,
-                json=payload,
-                timeout=config.get_log_timeout(),
-                headers=headers,
-        )
+        # 스풀이 켜져 있으면 기록만 하고 전달은 재전송기가 맡는다
+        await deliver("POST", url, payload, key=job_id)
     except Exception:
         await _log(
             "WARN",
@@ -376,10 +863,10 @@ async def _post_content(
 async def classify_category(
     product: SsadaguProduct, llm_setting: LlmSetting | None = None, llm: LLMService | None = None
 ) -> str:
-    """카테고리 목록 파일을 읽어 상품 카테고리를 LLM으로 분류."""
-    categories = _load_categories()
-    service = llm or LLMService()
-    return await _classify_category(product, service, llm_setting, categories)
+    """로컬 분류기 우선, 신뢰도가 낮으면 LLM으로 상품 카테고리를 분류."""
+    classifier = CategoryClassifier(llm or LLMService())
+    prediction = await classifier.classify(product, llm_setting)
+    return prediction.category
 
 
 def _with_keyword(keyword: str | None, sub: str) -> str:
@@ -401,6 +888,7 @@ async def _log(
     user_id: int = 1,
     keyword: str | None = None,
     is_notifiable: bool | None = None,
+    meta: dict | None = None,
 ) -> None:
     submessage = _with_keyword(keyword, sub)
     try:
@@ -412,6 +900,7 @@ async def _log(
             job_id=job_id,
             user_id=user_id,
             is_notifiable=is_notifiable,
+            meta=meta,
         )
     except Exception:
         return
@@ -457,77 +946,3 @@ def _upload_channel_kwargs(upload_channel: UploadChannelSettings) -> dict[str, A
         "x_access_token": getattr(upload_channel, "x_access_token", None),
         "x_access_token_secret": getattr(upload_channel, "x_access_token_secret", None),
     }
-
-
-CATEGORY_FILE = Path(__file__).resolve().parent.parent / "prompts" / "categories.txt"
-
-
-def _load_categories(path: Path = CATEGORY_FILE) -> list[tuple[str, str]]:
-    """카테고리 목록을 [id, 설명] 리스트로 읽는다."""
-    categories: list[tuple[str, str]] = []
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                raw = line.strip()
-                if not raw or raw.startswith("#"):
-                    continue
-                parts = raw.split(maxsplit=1)
-                if not parts:
-                    continue
-                cat_id = parts[0]
-                desc = parts[1] if len(parts) > 1 else ""
-                categories.append((cat_id, desc))
-    except FileNotFoundError:
-        return []
-    return categories
-
-
-def _category_prompt(product: SsadaguProduct, categories: list[tuple[str, str]]) -> str:
-    lines = "\n".join([f"- {cid}: {desc}" for cid, desc in categories])
-    specs = (
-        "\n".join([f"- {k}: {v}" for k, v in (product.detail_specs or {}).items()])
-        if product.detail_specs
-        else "- 없음"
-    )
-    price_text = f"{product.price}" if product.price is not None else "알 수 없음"
-    return f"""상품 정보를 보고 아래 카테고리 중 하나를 골라 JSON(category)로만 알려줘.
-카테고리 목록:
-{lines}
-
-상품:
-- 이름: {product.title}
-- 가격: {price_text}
-- 링크: {product.product_link}
-- 썸네일: {product.thumbnail_link or '없음'}
-- 스펙:
-{specs}
-"""
-
-
-async def _classify_category(
-    product: SsadaguProduct,
-    llm: LLMService,
-    llm_setting: LlmSetting | None,
-    categories: list[tuple[str, str]],
-) -> str:
-    if not categories:
-        return "0"
-    system_prompt = "주어진 상품에 가장 적합한 카테고리를 선택하고 JSON으로 반환한다. 출력은 {\"category\": \"카테고리ID\"} 한 개만 포함한다."
-    user_input = _category_prompt(product, categories)
-    answer = await llm.chat(
-        system_prompt=system_prompt,
-        user_input=user_input,
-        model=llm_setting.modelName if llm_setting else None,
-        temperature=llm_setting.temperature if llm_setting else None,
-        api_key=llm_setting.apiKey if llm_setting else None,
-    )
-    cleaned = try_repair_json(answer) or answer
-    try:
-        parsed = json.loads(cleaned)
-        cat = parsed.get("category") or parsed.get("id") or parsed.get("label")
-        if isinstance(cat, str) and cat.strip():
-            return cat.strip()
-    except Exception:
-        pass
-    # fallback: 첫 번째 카테고리 id
-    return categories[0][0]
@@ -12,7 +12,7 @@ except ImportError:  # pragma: no cover - optional for tests
     tweepy = None  # type: ignore
 
 from app import config
-from app.logs import async_send_log
+from app.logs import log_nowait
 
 
 def _build_status(title: str, content: str, limit: int = 280) -> str:
@@ -70,20 +70,13 @@ class XPostService:
             wait_on_rate_limit=True,
         )
 
-        # INFO 로그
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(
-                    async_send_log(
-                        message="X 업로드 시작",
-                        submessage=f"title_preview={status[:40]}",
-                        logged_process="x_post",
-                        job_id=job_id or "",
-                    )
-                )
-        except Exception:
-            pass
+        # INFO 로그 (post_async의 워커 스레드에서도 전송기 큐로 바로 넘긴다)
+        log_nowait(
+            message="X 업로드 시작",
+            submessage=f"title_preview={status[:40]}",
+            logged_process="x_post",
+            job_id=job_id or "",
+        )
 
         resp = client.create_tweet(text=status)
         # resp can be Tweepy Response or dict
@@ -98,19 +91,12 @@ class XPostService:
         if not tweet_id:
             raise RuntimeError(f"트윗 ID를 찾지 못했습니다: {resp}")
         url = f"https://twitter.com/i/web/status/{tweet_id}"
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(
-                    async_send_log(
-                        message="X 업로드 완료",
-                        submessage=f"url={url}",
-                        logged_process="x_post",
-                        job_id=job_id or "",
-                    )
-                )
-        except Exception:
-            pass
+        log_nowait(
+            message="X 업로드 완료",
+            submessage=f"url={url}",
+            logged_process="x_post",
+            job_id=job_id or "",
+        )
         return url
 
     async def post_async(
@@ -0,0 +1,575 @@
+"""실패해도 잃지 않는 외부 전송(콜백/로그) 스풀과 재전송기.
+
+/api/content, /api/content/link 콜백과 전송에 실패한 원격 로그를 append-only JSONL
+파일(OUTBOUND_SPOOL_PATH)에 먼저 기록하고, 이벤트 루프의 재전송 task가 보낸다.
+파이프라인은 기록만 하고 바로 다음 단계로 넘어가며, 수신 서버가 내려가 있으면
+지수 백오프로 재시도한다. 같은 키(jobId)의 항목은 넣은 순서대로만 전달되므로
+콘텐츠 저장 콜백보다 링크 갱신 콜백이 먼저 도착하지 않는다.
+
+파일에는 put/ack/drop 레코드가 이어 붙고, 시작 시 이를 재생해 미전송 항목을 복원한다.
+파일 쓰기는 전용 스레드(_SpoolFile) 하나가 모아서 하며 이벤트 루프는 막지 않는다.
+put이 들어간 묶음은 fsync하고, asubmit()은 그 fsync가 끝난 뒤 반환한다. 확인된 레코드가
+쌓이면 같은 스레드가 미전송 항목만 남기도록 파일을 다시 쓴다.
+미전송 용량이 OUTBOUND_SPOOL_MAX_BYTES를 넘으면 가장 오래된 로그 키를 통째로 버리고,
+로그를 다 버려도 모자라면 새 항목을 SpoolFull로 거절한다(콜백은 키 중간에서 빠지지 않는다).
+경로/용량은 config.get_settings() 스냅샷에서 읽는다. 경로가 없으면 같은 재시도를
+메모리에서만 한다(재시작 시 유실). 인증 헤더는 디스크에 쓰지 않고 전송 시점에 붙인다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional
+
+import httpx
+
+from app import config
+from app.http_clients import get_http_client
+
+logger = logging.getLogger(__name__)
+
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 300.0
+# 동시에 재전송하는 키 수
+MAX_PARALLEL_KEYS = 8
+# 이만큼 확인(ack/drop)된 레코드가 쌓이면 파일을 다시 쓴다
+COMPACT_AFTER = 1000
+# 4xx 중 재시도할 응답. 나머지 4xx는 요청 자체가 잘못된 것이므로 폐기한다
+_RETRYABLE_4XX = {408, 409, 425, 429}
+
+
+class SpoolFull(RuntimeError):
+    """용량 한도 때문에 새 전송 항목을 받을 수 없을 때."""
+
+
+Done = Callable[[Optional[BaseException]], None]
+
+
+class _SpoolFile:
+    """스풀 파일에 쓰는 전용 스레드.
+
+    호출자는 큐에 넣기만 하고, 스레드가 쌓인 항목을 한 번에 이어 붙인 뒤 flush한다.
+    put이 들어간 묶음은 fsync까지 마친 뒤 완료 콜백을 부른다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="outbound-spool-file", daemon=True)
+                self._thread.start()
+
+    def append(self, entry: dict[str, Any], done: Optional[Done] = None) -> None:
+        self._ensure_thread()
+        self._queue.put(("append", entry, done))
+
+    def compact(self, records: list[dict[str, Any]]) -> None:
+        self._ensure_thread()
+        self._queue.put(("compact", records, None))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 넣은 항목이 파일에 쓰일 때까지 기다린다 (블로킹, 종료/테스트용)."""
+        if self._thread is None:
+            return True
+        written = threading.Event()
+        self._queue.put(("append", None, lambda exc: written.set()))
+        return written.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            error: Optional[BaseException] = None
+            try:
+                self._write(batch)
+            except OSError as exc:
+                logger.exception("전송 스풀 파일 기록 실패: %s", self.path)
+                error = exc
+            for _, _, done in batch:
+                if done is not None:
+                    done(error)
+
+    def _write(self, batch: list[tuple[str, Any, Optional[Done]]]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fh = None
+        needs_sync = False
+        try:
+            for op, item, _ in batch:
+                if op == "compact":
+                    if fh is not None:
+                        fh.close()
+                        fh = None
+                    write_snapshot(self.path, item)
+                    continue
+                if item is None:
+                    continue
+                if fh is None:
+                    fh = open(self.path, "a", encoding="utf-8")
+                fh.write(json.dumps(item, ensure_ascii=False) + "\n")
+                needs_sync = needs_sync or item.get("op") == "put"
+            if fh is not None:
+                fh.flush()
+                if needs_sync:
+                    os.fsync(fh.fileno())
+        finally:
+            if fh is not None:
+                fh.close()
+
+
+def write_snapshot(path: str, records: list[dict[str, Any]]) -> None:
+    """미전송 항목만 남긴 파일로 원자적으로 교체한다."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps({"op": "put", "record": record}, ensure_ascii=False) + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+class OutboundSpool:
+    """키별 순서를 지키는 영속 전송 큐."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_bytes: Optional[int] = None,
+        base_backoff: float = BASE_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        from_settings: bool = False,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        # True면 경로/용량을 처음 불러올 때 설정 스냅샷에서 정한다 (전역 스풀)
+        self._from_settings = from_settings
+        self._file: Optional[_SpoolFile] = None
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._records: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._by_key: dict[str, deque[str]] = {}
+        self._retry_at: dict[str, float] = {}
+        self._attempts: dict[str, int] = {}
+        self._bytes = 0
+        self._dead = 0
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.delivered = 0
+        self.retried = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls) -> "OutboundSpool":
+        """경로(OUTBOUND_SPOOL_PATH)와 용량을 설정 스냅샷에서 읽는 스풀."""
+        return cls(from_settings=True)
+
+    # ---- 영속화 ----
+    def load(self) -> None:
+        """파일에서 미전송 항목을 복원한다. 파일 I/O가 있으므로 루프 밖(to_thread)에서 부른다."""
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._from_settings:
+            settings = config.get_settings()
+            self.path = settings.outbound_spool_path
+            if self.max_bytes is None:
+                self.max_bytes = settings.outbound_spool_max_bytes
+        if self.path:
+            self._file = _SpoolFile(self.path)
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 중 종료되어 잘린 마지막 줄
+                    continue
+                op = entry.get("op")
+                if op == "put":
+                    self._index(entry["record"])
+                elif op in {"ack", "drop"}:
+                    self._forget(entry.get("id", ""))
+        # 시작 시 한 번은 호출 스레드에서 바로 정리한다
+        write_snapshot(self.path, list(self._records.values()))
+
+    def _append(self, entry: dict[str, Any], done: Optional[Done] = None) -> None:
+        if self._file is None:
+            if done is not None:
+                done(None)
+            return
+        self._file.append(entry, done)
+
+    def _compact(self) -> None:
+        """미전송 항목만 남기도록 기록 스레드에 파일 재작성을 맡긴다."""
+        self._dead = 0
+        if self._file is not None:
+            self._file.compact(list(self._records.values()))
+
+    # ---- 메모리 인덱스 ----
+    def _index(self, record: dict[str, Any]) -> None:
+        self._records[record["id"]] = record
+        self._by_key.setdefault(record["key"], deque()).append(record["id"])
+        self._bytes += record.get("size", 0)
+
+    def _forget(self, record_id: str) -> Optional[dict[str, Any]]:
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return None
+        queue = self._by_key.get(record["key"])
+        if queue is not None:
+            try:
+                queue.remove(record_id)
+            except ValueError:
+                pass
+            if not queue:
+                del self._by_key[record["key"]]
+                self._retry_at.pop(record["key"], None)
+        self._attempts.pop(record_id, None)
+        self._bytes -= record.get("size", 0)
+        return record
+
+    def _settle(self, record_id: str, op: str) -> None:
+        with self._lock:
+            if self._forget(record_id) is None:
+                return
+            self._append({"op": op, "id": record_id})
+            self._dead += 1
+            if self._dead >= COMPACT_AFTER:
+                self._compact()
+
+    def _make_room(self, size: int) -> bool:
+        """size만큼 자리가 나도록 가장 오래된 로그 키를 통째로 버린다. 자리가 나면 True."""
+        limit = self.max_bytes if self.max_bytes is not None else config.get_settings().outbound_spool_max_bytes
+        while self._bytes + size > limit:
+            victim = next((rec for rec in self._records.values() if rec["kind"] == "log"), None)
+            if victim is None:
+                return False
+            # 같은 키 안의 순서가 깨지지 않도록 키 단위로 버린다
+            ids = list(self._by_key.get(victim["key"], ()))
+            logger.warning("전송 스풀 용량 초과로 로그 %d건 폐기: %s", len(ids), victim["key"])
+            for record_id in ids:
+                self._forget(record_id)
+                self._append({"op": "drop", "id": record_id})
+            self.dropped += len(ids)
+            self._dead += len(ids)
+        return True
+
+    # ---- 공개 API ----
+    def submit(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        *,
+        key: str = "",
+        kind: str = "callback",
+        timeout: Optional[float] = None,
+    ) -> str:
+        """전송 항목을 기록하고 재전송기를 깨운다. 기록 id를 반환한다.
+
+        파일 기록은 기록 스레드가 뒤이어 한다. 용량 한도 때문에 받을 수 없으면 SpoolFull.
+        """
+        return self._submit(method, url, payload, key=key, kind=kind, timeout=timeout)
+
+    async def asubmit(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        *,
+        key: str = "",
+        kind: str = "callback",
+        timeout: Optional[float] = None,
+    ) -> str:
+        """submit과 같지만 항목이 디스크에 fsync된 뒤 반환한다."""
+        loop = asyncio.get_running_loop()
+        written: asyncio.Future = loop.create_future()
+
+        def done(exc: Optional[BaseException]) -> None:
+            def settle() -> None:
+                if written.done():
+                    return
+                if exc is None:
+                    written.set_result(None)
+                else:
+                    written.set_exception(exc)
+
+            try:
+                loop.call_soon_threadsafe(settle)
+            except RuntimeError:
+                # 루프가 이미 닫힘
+                pass
+
+        record_id = self._submit(method, url, payload, key=key, kind=kind, timeout=timeout, done=done)
+        await written
+        return record_id
+
+    def _submit(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        *,
+        key: str,
+        kind: str,
+        timeout: Optional[float],
+        done: Optional[Done] = None,
+    ) -> str:
+        record = {
+            "id": uuid.uuid4().hex,
+            "key": key or kind,
+            "kind": kind,
+            "method": method.upper(),
+            "url": url,
+            "json": payload,
+            "timeout": timeout,
+            "created": time.time(),
+        }
+        record["size"] = len(json.dumps(payload, ensure_ascii=False, default=str))
+        with self._lock:
+            self._load()
+            if not self._make_room(record["size"]):
+                self.rejected += 1
+                raise SpoolFull(f"전송 스풀 용량 초과로 거절: {record['kind']} {record['url']}")
+            self._index(record)
+            self._append({"op": "put", "record": record}, done)
+        self._ensure_started()
+        self._wake()
+        return record["id"]
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._records)
+
+    def _ensure_started(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._client = None
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="outbound-spool")
+
+    def start(self) -> None:
+        """이전 실행에서 남은 항목을 불러오고 재전송을 시작한다 (lifespan에서 호출).
+
+        아직 불러오지 않았으면 여기서 파일을 읽으므로, 루프에서는 load()를 to_thread로 먼저 부른다.
+        """
+        with self._lock:
+            self._load()
+        self._ensure_started()
+        self._wake()
+
+    def _wake(self) -> None:
+        wakeup, loop = self._wakeup, self._loop
+        if wakeup is None or loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    # ---- 재전송 ----
+    def _due_heads(self) -> tuple[list[dict[str, Any]], Optional[float]]:
+        """지금 보낼 수 있는 키별 첫 항목과, 다음 재시도까지 남은 시간."""
+        now = time.monotonic()
+        heads: list[dict[str, Any]] = []
+        next_wait: Optional[float] = None
+        with self._lock:
+            for key, queue in self._by_key.items():
+                retry_at = self._retry_at.get(key, 0.0)
+                if retry_at > now:
+                    wait = retry_at - now
+                    next_wait = wait if next_wait is None else min(next_wait, wait)
+                    continue
+                heads.append(self._records[queue[0]])
+                if len(heads) >= MAX_PARALLEL_KEYS:
+                    break
+        return heads, next_wait
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup
+        assert wakeup is not None
+        try:
+            while True:
+                heads, next_wait = self._due_heads()
+                if heads:
+                    await asyncio.gather(*(self._deliver(record) for record in heads))
+                    continue
+                wakeup.clear()
+                # wait_for는 깨우기와 취소가 겹치면 취소를 삼킬 수 있어(3.11) wait로 기다린다
+                waiter = asyncio.ensure_future(wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=next_wait)
+                finally:
+                    waiter.cancel()
+        finally:
+            await self._close_client()
+
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        if self._transport is None:
+            return get_http_client(url)
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=self._transport)
+        return self._client
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _deliver(self, record: dict[str, Any]) -> None:
+        try:
+            response = await self._get_client(record["url"]).request(
+                record["method"],
+                record["url"],
+                json=record["json"],
+                timeout=_timeout(record.get("timeout")),
+                headers=config.get_settings().internal_headers,
+            )
+        except httpx.HTTPError as exc:
+            self._schedule_retry(record, str(exc))
+            return
+        except Exception as exc:
+            # 잘못된 URL 등 재시도해도 같은 결과인 오류
+            logger.warning("전송 불가로 폐기: %s %s (%s)", record["method"], record["url"], exc)
+            self.dropped += 1
+            self._settle(record["id"], "drop")
+            return
+        status = response.status_code
+        if status < 400:
+            self.delivered += 1
+            self._settle(record["id"], "ack")
+        elif status < 500 and status not in _RETRYABLE_4XX:
+            logger.warning("전송 거부되어 폐기(%s): %s %s", status, record["method"], record["url"])
+            self.dropped += 1
+            self._settle(record["id"], "drop")
+        else:
+            self._schedule_retry(record, f"status={status}")
+
+    def _schedule_retry(self, record: dict[str, Any], reason: str) -> None:
+        with self._lock:
+            attempts = self._attempts.get(record["id"], 0) + 1
+            self._attempts[record["id"]] = attempts
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+            # 여러 키가 같은 순간에 다시 몰리지 않도록 지터
+            self._retry_at[record["key"]] = time.monotonic() + backoff * random.uniform(0.5, 1.0)
+        self.retried += 1
+        if attempts == 1:
+            logger.warning("전송 실패, 재시도 예약: %s %s (%s)", record["method"], record["url"], reason)
+
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """대기 없이 보낼 수 있는 항목이 없어질 때까지 기다린다 (종료 시). 모두 보냈으면 True."""
+        deadline = time.monotonic() + timeout
+        self._ensure_started()
+        self._wake()
+        while time.monotonic() < deadline:
+            heads, _ = self._due_heads()
+            if not heads:
+                break
+            await asyncio.sleep(0.01)
+        return self.pending == 0
+
+    async def aclose(self, timeout: float = 5.0) -> None:
+        """남은 항목 전송을 잠시 기다린 뒤 재전송기를 멈춘다. 못 보낸 항목은 파일에 남는다."""
+        await self.drain(timeout)
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush(timeout)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """기록 스레드에 넘긴 항목이 파일에 쓰일 때까지 기다린다."""
+        if self._file is None:
+            return True
+        return await asyncio.to_thread(self._file.flush, timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._records),
+                "pending_bytes": self._bytes,
+                "keys": len(self._by_key),
+                "delivered": self.delivered,
+                "retried": self.retried,
+                "dropped": self.dropped,
+                "rejected": self.rejected,
+                "durable": bool(self.path),
+            }
+
+
+OUTBOUND_SPOOL = OutboundSpool.from_settings()
+
+
+def _timeout(value: Optional[float]) -> float:
+    return value if value is not None else config.get_settings().log_timeout
+
+
+async def deliver(
+    method: str,
+    url: str,
+    payload: Any,
+    *,
+    key: str = "",
+    kind: str = "callback",
+    timeout: Optional[float] = None,
+) -> None:
+    """외부 콜백을 보낸다. 스풀이 켜져 있으면 디스크에 기록될 때까지만 기다리고 반환(재전송기가
+    전달)하고, 꺼져 있으면 공유 클라이언트로 직접 보내며 실패 시 예외를 올린다."""
+    settings = config.get_settings()
+    if settings.outbound_spool_enabled:
+        await OUTBOUND_SPOOL.asubmit(method, url, payload, key=key, kind=kind, timeout=timeout)
+        return
+    response = await get_http_client(url).request(
+        method,
+        url,
+        json=payload,
+        timeout=timeout if timeout is not None else settings.log_timeout,
+        headers=settings.internal_headers,
+    )
+    response.raise_for_status()
@@ -0,0 +1,210 @@
+"""요청 후 백그라운드로 실행하는 작업(fire-and-forget) 감독자.
+
+/api/write, /api/upload, /api/crawler는 즉시 200을 반환하고 실제 처리를 백그라운드
+task로 돌린다. asyncio.create_task의 반환값을 버리면 이벤트 루프는 task를 약한
+참조로만 들고 있어 실행 중에 GC될 수 있고, 부하가 몰려도 동시 실행 수에 제한이 없다.
+
+TaskSupervisor는
+- 실행 중/대기 중 task를 강한 참조로 보관하고,
+- 분류(category)별 세마포어로 동시 실행 수를 제한하며
+  (BACKGROUND_TASK_LIMIT, 분류별 BACKGROUND_TASK_LIMITS),
+- 실행+대기 수가 BACKGROUND_TASK_MAX_PENDING을 넘으면 TaskRejected로 거절하고,
+- 실패를 분류별로 집계하고 최근 실패를 보관한다.
+종료 시(lifespan) BACKGROUND_TASK_SHUTDOWN_TIMEOUT초까지 완료를 기다린 뒤 남은 task를
+취소한다. 통계는 /stats의 background_tasks로 노출된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Coroutine, Optional
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+# 보관할 최근 실패 기록 수
+MAX_RECENT_FAILURES = 20
+
+
+class TaskRejected(RuntimeError):
+    """분류별 대기 한도를 넘어 작업을 받을 수 없을 때."""
+
+
+class TaskSupervisor:
+    """분류별 동시 실행 제한과 종료 시 정리를 맡는 백그라운드 task 관리자."""
+
+    def __init__(
+        self,
+        *,
+        limit: Optional[int] = None,
+        limits: Optional[dict[str, int]] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self._limit_override = limit
+        self._limits_override = limits
+        self._max_pending_override = max_pending
+        # 이벤트 루프가 task를 약한 참조로만 들고 있으므로 여기서 강한 참조를 유지한다
+        self._tasks: set[asyncio.Task] = set()
+        # (루프 id, 분류) -> (루프, 세마포어)
+        self._semaphores: dict[tuple[int, str], tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+        # 분류 -> 집계값
+        self._counters: dict[str, dict[str, int]] = {}
+        self._failures: deque[dict[str, Any]] = deque(maxlen=MAX_RECENT_FAILURES)
+
+    def limit_for(self, category: str) -> int:
+        limits = (
+            self._limits_override
+            if self._limits_override is not None
+            else config.get_background_task_limits()
+        )
+        limit = limits.get(category)
+        if limit is None:
+            limit = config.get_background_task_limit(self._limit_override)
+        return max(1, limit)
+
+    def _counter(self, category: str) -> dict[str, int]:
+        counter = self._counters.get(category)
+        if counter is None:
+            # pending은 실행 중 + 차례 대기 중
+            counter = self._counters[category] = {
+                "pending": 0,
+                "running": 0,
+                "started": 0,
+                "completed": 0,
+                "failed": 0,
+                "cancelled": 0,
+                "rejected": 0,
+            }
+        return counter
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop, category: str) -> asyncio.Semaphore:
+        key = (id(loop), category)
+        with self._lock:
+            # 닫힌 루프(테스트의 asyncio.run 등)의 세마포어는 버린다
+            for stale in [k for k, (lp, _) in self._semaphores.items() if lp.is_closed()]:
+                del self._semaphores[stale]
+            entry = self._semaphores.get(key)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Semaphore(self.limit_for(category)))
+                self._semaphores[key] = entry
+        return entry[1]
+
+    def spawn(
+        self, category: str, coro: Coroutine[Any, Any, Any], *, name: Optional[str] = None
+    ) -> asyncio.Task:
+        """coro를 분류 한도 안에서 실행할 task로 등록한다.
+
+        한도만큼 실행 중이면 세마포어에서 차례를 기다린다. 실행+대기 수가
+        BACKGROUND_TASK_MAX_PENDING 이상이면 coro를 닫고 TaskRejected를 올린다.
+        """
+        loop = asyncio.get_running_loop()
+        max_pending = config.get_background_task_max_pending(self._max_pending_override)
+        with self._lock:
+            counter = self._counter(category)
+            if max_pending > 0 and counter["pending"] >= max_pending:
+                counter["rejected"] += 1
+                coro.close()
+                raise TaskRejected(f"{category} 백그라운드 작업이 가득 찼습니다 ({max_pending}).")
+            counter["pending"] += 1
+        semaphore = self._semaphore(loop, category)
+        task = loop.create_task(
+            self._supervise(category, coro, semaphore), name=name or f"{category}-task"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: self._on_done(category, coro, t))
+        return task
+
+    async def _supervise(
+        self, category: str, coro: Coroutine[Any, Any, Any], semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
+            with self._lock:
+                counter = self._counter(category)
+                counter["running"] += 1
+                counter["started"] += 1
+            try:
+                await coro
+            except Exception as exc:
+                # 호출자가 결과를 기다리지 않으므로 여기서 기록하고 삼킨다
+                logger.exception("백그라운드 작업 실패: %s", category)
+                with self._lock:
+                    self._counter(category)["failed"] += 1
+                    self._failures.append(
+                        {
+                            "category": category,
+                            "error": f"{type(exc).__name__}: {exc}",
+                            "at": time.time(),
+                        }
+                    )
+            else:
+                with self._lock:
+                    self._counter(category)["completed"] += 1
+            finally:
+                with self._lock:
+                    self._counter(category)["running"] -= 1
+
+    def _on_done(
+        self, category: str, coro: Coroutine[Any, Any, Any], task: asyncio.Task
+    ) -> None:
+        self._tasks.discard(task)
+        # 차례를 기다리다 취소되어 시작하지 못한 코루틴을 닫는다 (끝난 코루틴이면 아무 일 없음)
+        coro.close()
+        with self._lock:
+            counter = self._counter(category)
+            counter["pending"] -= 1
+            if task.cancelled():
+                counter["cancelled"] += 1
+
+    def _current_tasks(self) -> list[asyncio.Task]:
+        loop = asyncio.get_running_loop()
+        return [task for task in self._tasks if task.get_loop() is loop and not task.done()]
+
+    async def join(self) -> None:
+        """현재 루프의 task가 모두 끝날 때까지 기다린다 (테스트용)."""
+        while True:
+            tasks = self._current_tasks()
+            if not tasks:
+                return
+            await asyncio.wait(tasks)
+
+    async def aclose(self, timeout: Optional[float] = None) -> int:
+        """timeout초까지 현재 루프의 task 완료를 기다리고, 남은 task는 취소한다.
+
+        취소한 task 수를 반환한다 (앱 종료 시).
+        """
+        timeout = config.get_background_task_shutdown_timeout(timeout)
+        tasks = self._current_tasks()
+        if not tasks:
+            return 0
+        _, still_running = await asyncio.wait(tasks, timeout=max(0.0, timeout))
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            logger.warning("종료 대기 시간 초과로 백그라운드 작업 %d개 취소", len(still_running))
+            await asyncio.gather(*still_running, return_exceptions=True)
+        return len(still_running)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            categories = {
+                category: {
+                    **counter,
+                    "waiting": counter["pending"] - counter["running"],
+                    "limit": self.limit_for(category),
+                }
+                for category, counter in self._counters.items()
+            }
+            return {
+                "active": len(self._tasks),
+                "categories": categories,
+                "recent_failures": list(self._failures),
+            }
+
+
+TASK_SUPERVISOR = TaskSupervisor()
@@ -0,0 +1,103 @@
+"""LLM 응답 JSON 추출기 오프라인 평가.
+
+benchmarks/data/llm_json_corpus.json의 실제 형태 응답(펜스, 앞뒤 설명, 끊긴 출력 등)으로
+이전 정규식 기반 보정과 단일 패스 추출기의 정답률과 호출당 시간을 비교한다.
+incremental은 16자 청크로 나눠 feed()한 경우(스트리밍)다.
+
+    python -m benchmarks.json_extract --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.services.text_cleaner import JsonExtractor, try_repair_json
+
+CORPUS_FILE = Path(__file__).resolve().parent / "data" / "llm_json_corpus.json"
+CHUNK = 16
+
+
+def load_corpus(path: Path = CORPUS_FILE) -> list[dict]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def legacy_repair(raw: str) -> Optional[str]:
+    """교체 전 try_repair_json (비교 기준)."""
+    fixed = raw.strip()
+    fixed = re.sub(r"```json\s*", "", fixed, flags=re.IGNORECASE)
+    fixed = fixed.replace("```", "")
+    if len(re.findall(r'"', fixed)) % 2 != 0:
+        fixed += '"'
+    stack = []
+    for char in fixed:
+        if char in ["{", "["]:
+            stack.append(char)
+        elif char == "}" and stack and stack[-1] == "{":
+            stack.pop()
+        elif char == "]" and stack and stack[-1] == "[":
+            stack.pop()
+    while stack:
+        fixed += "}" if stack.pop() == "{" else "]"
+    fixed = re.sub(r",\s*$", "", fixed)
+    try:
+        json.loads(fixed)
+        return fixed
+    except json.JSONDecodeError:
+        return None
+
+
+def incremental(raw: str) -> Optional[str]:
+    extractor = JsonExtractor()
+    for start in range(0, len(raw), CHUNK):
+        if extractor.feed(raw[start : start + CHUNK]):
+            break
+    return extractor.result() or try_repair_json(raw)
+
+
+def _parsed(text: Optional[str]) -> object:
+    return json.loads(text) if text is not None else None
+
+
+def evaluate(corpus: list[dict], fn: Callable[[str], Optional[str]], repeat: int = 1) -> dict:
+    """정답률(파싱 결과가 기대값과 같은 비율)과 호출당 평균 마이크로초."""
+    correct = sum(1 for case in corpus if _parsed(fn(case["raw"])) == case["expected"])
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for case in corpus:
+            fn(case["raw"])
+    elapsed = time.perf_counter() - started
+    return {
+        "accuracy": correct / len(corpus),
+        "us_per_call": elapsed / (repeat * len(corpus)) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    # 긴 홍보글(약 8KB)을 펜스로 감싼 응답: 실제 promo 출력 크기에서의 비용
+    long_body = "시원한 바람과 조용한 소음이 장점인 {특가} 선풍기입니다. " * 150
+    long_case = {
+        "raw": "```json\n" + json.dumps({"title": "선풍기", "body": long_body}, ensure_ascii=False) + "\n```",
+        "expected": {"title": "선풍기", "body": long_body},
+    }
+    print(f"{'method':<14}{'accuracy':>10}{'us/call':>10}{'long us':>10}")
+    for name, fn in (("legacy", legacy_repair), ("single_pass", try_repair_json), ("incremental", incremental)):
+        result = evaluate(corpus, fn, args.repeat)
+        long_result = evaluate([long_case], fn, args.repeat)
+        print(
+            f"{name:<14}{result['accuracy']:>10.2f}{result['us_per_call']:>10.1f}"
+            f"{long_result['us_per_call']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
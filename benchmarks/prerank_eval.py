@@ -0,0 +1,77 @@
+"""로컬 어휘 순위화 오프라인 평가.
+
+benchmarks/data/prerank_eval.json의 (키워드, 크롤링 상품, 정답 상품) 묶음으로
+무작위 선택 대비 순위화의 첫 시도 적중률과 정답까지의 평균 LLM 평가 횟수를 비교한다.
+
+    python -m benchmarks.prerank_eval
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from app.schemas.products import SsadaguProduct
+from app.services.ranking import rank_products
+
+EVAL_FILE = Path(__file__).resolve().parent / "data" / "prerank_eval.json"
+
+
+def load_cases(path: Path = EVAL_FILE) -> list[dict]:
+    cases = json.loads(path.read_text(encoding="utf-8"))
+    for case in cases:
+        case["products"] = [
+            SsadaguProduct(
+                title=p["title"],
+                product_link=f"https://ssadagu.kr/item/{idx}",
+                detail_specs=p.get("detail_specs") or {},
+            )
+            for idx, p in enumerate(case["products"])
+        ]
+    return cases
+
+
+def evaluate(cases: list[dict]) -> dict[str, float]:
+    """random/ranked 각각의 hit@1과 정답까지 기대 평가 횟수를 계산한다."""
+    random_hits = ranked_hits = 0.0
+    random_calls = ranked_calls = 0.0
+    elapsed = 0.0
+    for case in cases:
+        relevant = set(case["relevant"])
+        products = case["products"]
+        n, r = len(products), sum(1 for p in products if p.title in relevant)
+        # 비복원 무작위 추출 시 첫 정답까지의 기대 시도 횟수 = (n + 1) / (r + 1)
+        random_hits += r / n
+        random_calls += (n + 1) / (r + 1)
+
+        started = time.perf_counter()
+        ranked = rank_products(case["keyword"], products)
+        elapsed += time.perf_counter() - started
+        position = next(i for i, (p, _) in enumerate(ranked, start=1) if p.title in relevant)
+        ranked_hits += 1.0 if position == 1 else 0.0
+        ranked_calls += position
+
+    total = len(cases)
+    return {
+        "cases": total,
+        "random_hit_at_1": random_hits / total,
+        "ranked_hit_at_1": ranked_hits / total,
+        "random_llm_calls": random_calls / total,
+        "ranked_llm_calls": ranked_calls / total,
+        "rank_ms_per_case": elapsed * 1000 / total,
+    }
+
+
+def main() -> None:
+    result = evaluate(load_cases())
+    print(f"cases              : {result['cases']}")
+    print(f"hit@1   random     : {result['random_hit_at_1']:.2f}")
+    print(f"hit@1   ranked     : {result['ranked_hit_at_1']:.2f}")
+    print(f"calls   random     : {result['random_llm_calls']:.2f}")
+    print(f"calls   ranked     : {result['ranked_llm_calls']:.2f}")
+    print(f"rank time (ms/case): {result['rank_ms_per_case']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
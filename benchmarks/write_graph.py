@@ -0,0 +1,150 @@
+"""LangGraph write 그래프 컴파일 비용과 요청당 오버헤드를 오프라인으로 측정한다.
+
+서비스는 즉시 반환하는 스텁이고 콘텐츠 전송(_post_content)과 원격 로그는 끈 상태라,
+측정값은 그래프 구성/실행 자체의 비용이다. 비교 대상:
+
+- direct: 같은 스텁 단계를 그래프 없이 순서대로 호출 (기준선)
+- rebuild: 요청마다 build_write_graph()로 다시 컴파일한 뒤 실행 (이전 방식)
+- cached: get_write_graph()의 캐시된 그래프를 실행하고 서비스는 config로 전달
+
+    python -m benchmarks.write_graph --requests 300 --compiles 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+from types import SimpleNamespace
+
+from app import config
+from app.flows import write_graph
+from app.schemas.products import SsadaguProduct
+from app.services.write import MAX_RETRIES, RELEVANCE_THRESHOLD
+
+
+class StubServices:
+    """그래프가 쓰는 WriteService 속성만 흉내 내는 즉시 반환 스텁."""
+
+    def __init__(self) -> None:
+        self.product = SsadaguProduct(
+            title="멀티탭 개별스위치", price=1000.0, product_link="https://ssadagu.kr/item/1"
+        )
+        self.settings = config.Settings(callback_origin="https://cb.example.com")
+        self.keywords = SimpleNamespace(refine=self._refine)
+        self.ssadagu = SimpleNamespace(search=self._search)
+        self.upload = SimpleNamespace(upload=self._upload)
+
+    async def _refine(self, trends, **kwargs):
+        return {"keyword": trends[0]}
+
+    async def _search(self, keyword, **kwargs):
+        return [self.product]
+
+    async def _upload(self, request):
+        return SimpleNamespace(link="https://blog.example.com/1")
+
+    async def select_product(self, keyword, products, **kwargs):
+        return products[0], 0.9
+
+    async def generate_post(self, product, **kwargs):
+        return "제목", f"본문 {product.product_link}", "28"
+
+    def should_defer(self, generation_type) -> bool:
+        return False
+
+
+def _initial(job_id: str) -> dict:
+    channel = SimpleNamespace(id=1, name="NAVER")
+    return {
+        "keyword": "멀티탭",
+        "retries": 0,
+        "generation_type": "MANUAL",
+        "upload_channel": channel,
+        "llm_setting": None,
+        "user_id": 1,
+        "job_id": job_id,
+        "platform": None,
+        "upload_request_builder": None,
+    }
+
+
+async def _direct(services: StubServices, job_id: str) -> None:
+    refined = await services.keywords.refine(["멀티탭"])
+    products = await services.ssadagu.search(refined["keyword"])
+    product, _ = await services.select_product(refined["keyword"], products)
+    await services.generate_post(product)
+    services.settings.redirect_url(job_id)
+
+
+async def _noop_post_content(**kwargs) -> None:
+    return None
+
+
+def _timings_us(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+    }
+
+
+async def run(requests: int, compiles: int) -> dict[str, dict[str, float]]:
+    services = StubServices()
+    graph_kwargs = {"max_retries": MAX_RETRIES, "relevance_threshold": RELEVANCE_THRESHOLD}
+
+    compile_samples = []
+    for _ in range(compiles):
+        started = time.perf_counter()
+        write_graph.build_write_graph(**graph_kwargs)
+        compile_samples.append(time.perf_counter() - started)
+
+    results = {"compile": _timings_us(compile_samples)}
+    modes = {
+        "direct": lambda job_id: _direct(services, job_id),
+        "rebuild": lambda job_id: write_graph.build_write_graph(**graph_kwargs).ainvoke(
+            _initial(job_id), config=write_graph.run_config(services)
+        ),
+        "cached": lambda job_id: write_graph.get_write_graph(**graph_kwargs).ainvoke(
+            _initial(job_id), config=write_graph.run_config(services)
+        ),
+    }
+    for name, call in modes.items():
+        await call("warmup")
+        samples = []
+        for i in range(requests):
+            started = time.perf_counter()
+            await call(f"job-{i}")
+            samples.append(time.perf_counter() - started)
+        results[name] = _timings_us(samples)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--compiles", type=int, default=50)
+    args = parser.parse_args()
+
+    if not write_graph.GRAPH_AVAILABLE:
+        raise SystemExit("langgraph가 설치되어 있지 않습니다.")
+    # 원격 로그/콘텐츠 전송 없이 그래프 비용만 잰다
+    config.use_settings(config.Settings())
+    write_graph._post_content = _noop_post_content
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = asyncio.run(run(args.requests, args.compiles))
+
+    print(f"{'':<8} {'mean(us)':>10} {'p50(us)':>10} {'p99(us)':>10}")
+    for name, row in results.items():
+        print(f"{name:<8} {row['mean_us']:>10.0f} {row['p50_us']:>10.0f} {row['p99_us']:>10.0f}")
+    saved = results["rebuild"]["mean_us"] - results["cached"]["mean_us"]
+    print(f"\n요청당 절감: {saved:.0f}us (그래프 실행 오버헤드 cached-direct: "
+          f"{results['cached']['mean_us'] - results['direct']['mean_us']:.0f}us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""가짜 LLM 백엔드로 WriteService 상품 선택 + 글 생성 구간을 오프라인 부하 측정한다.
+
+benchmarks/data/prerank_eval.json의 키워드/상품 묶음을 작업으로 삼아 동시에 실행하고,
+선택 모드/투기적 생성 조합별 작업 지연(p50/p90/p99), 작업당 LLM 호출 수와 토큰,
+주입된 429 수를 비교한다. 크롤링과 업로드는 포함하지 않는다.
+
+    python -m benchmarks.write_pipeline --jobs 48 --latency-ms 800 --rate-limit-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import time
+
+from benchmarks.prerank_eval import load_cases
+from app.services.fake_llm import FakeChatModel, FakeLLMProfile
+from app.services.keywords import KeywordService
+from app.services.llm import LLMService
+from app.services.llm_limiter import reset_controllers
+from app.services.promo import PromoService
+from app.services.relevance import RelevanceService
+from app.services.usage import track_usage
+from app.services.write import MAX_RETRIES, RELEVANCE_THRESHOLD, WriteService
+
+CONFIGS = (
+    ("single", False),
+    ("single", True),
+    ("batch", False),
+    ("concurrent", False),
+)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _run_job(service: WriteService, case: dict, job_id: str) -> tuple[float, dict, bool]:
+    started = time.perf_counter()
+    with track_usage(job_id) as ledger:
+        tried: set[str] = set()
+        drafts: dict = {}
+        ok = False
+        for _ in range(MAX_RETRIES):
+            product, score = await service.select_product(
+                case["keyword"],
+                case["products"],
+                job_id=job_id,
+                tried=tried,
+                drafts=drafts,
+                platform="naver_blog",
+            )
+            if score >= RELEVANCE_THRESHOLD:
+                await service.generate_post(
+                    product, platform="naver_blog", job_id=job_id, drafts=drafts
+                )
+                ok = True
+                break
+    return time.perf_counter() - started, ledger.total().as_dict(), ok
+
+
+async def run_config(
+    mode: str, speculative: bool, cases: list[dict], jobs: int, profile: FakeLLMProfile
+) -> dict[str, float]:
+    reset_controllers()
+    llm = LLMService(backend="fake", cache=None)
+    llm.cache = None
+    llm.client = FakeChatModel(profile)
+    service = WriteService(
+        keywords=KeywordService(llm_service=llm),
+        relevance=RelevanceService(llm_service=llm),
+        promo=PromoService(llm_service=llm),
+        category_llm=llm,
+        selection_mode=mode,
+        speculative=speculative,
+    )
+    job_cases = [cases[i % len(cases)] for i in range(jobs)]
+    results = await asyncio.gather(
+        *(_run_job(service, case, f"bench-{i}") for i, case in enumerate(job_cases)),
+        return_exceptions=True,
+    )
+    done = [r for r in results if not isinstance(r, BaseException)]
+    latencies = [r[0] for r in done]
+    return {
+        "jobs": jobs,
+        "failed": len(results) - len(done) + sum(1 for r in done if not r[2]),
+        "p50": _percentile(latencies, 0.50),
+        "p90": _percentile(latencies, 0.90),
+        "p99": _percentile(latencies, 0.99),
+        "mean": statistics.fmean(latencies) if latencies else 0.0,
+        "calls": statistics.fmean(r[1]["calls"] for r in done) if done else 0.0,
+        "tokens": statistics.fmean(r[1]["total_tokens"] for r in done) if done else 0.0,
+        "rate_limited": llm.client.stats.get("rate_limited", 0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=24)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profile = FakeLLMProfile(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    cases = load_cases()
+    print(f"{'mode':<22}{'p50':>7}{'p90':>7}{'p99':>7}{'calls':>7}{'tokens':>8}{'429':>5}{'fail':>5}")
+    for mode, speculative in CONFIGS:
+        # 작업별 진행 로그는 콘솔 출력만 하므로 측정 중에는 숨긴다
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = asyncio.run(run_config(mode, speculative, cases, args.jobs, profile))
+        label = f"{mode}{'+speculative' if speculative else ''}"
+        print(
+            f"{label:<22}{result['p50']:>7.2f}{result['p90']:>7.2f}{result['p99']:>7.2f}"
+            f"{result['calls']:>7.2f}{result['tokens']:>8.0f}{result['rate_limited']:>5}"
+            f"{result['failed']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import pytest
+
+from app import config
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings():
+    """테스트가 바꾼 환경 변수로 만든 설정 스냅샷이 다음 테스트로 새지 않게 비운다."""
+    yield
+    config.use_settings(None)
@@ -0,0 +1,81 @@
+import asyncio
+
+from app.schemas.products import SsadaguProduct
+from app.services.category import (
+    CategoryClassifier,
+    CategoryStats,
+    LocalCategoryClassifier,
+    _load_categories,
+)
+from app.services.llm import LLMService
+
+
+class DummyLLMService(LLMService):
+    def __init__(self, answer: str = '{"category": "29"}'):
+        super().__init__(api_key="test")
+        self.answer = answer
+        self.calls = 0
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        self.calls += 1
+        return self.answer
+
+
+def _product(title: str, specs: dict[str, str] | None = None) -> SsadaguProduct:
+    return SsadaguProduct(
+        title=title,
+        product_link="https://ssadagu.kr/item/1",
+        detail_specs=specs or {},
+    )
+
+
+def test_load_categories_parses_markdown_table():
+    categories = _load_categories()
+
+    assert categories[0] == ("1", "DIGITAL 전자제품")
+    assert categories[-1] == ("29", "ETC 기타")
+    assert all(cid.isdigit() for cid, _ in categories)
+
+
+def test_local_classifier_is_confident_on_dictionary_match():
+    classifier = LocalCategoryClassifier(_load_categories())
+
+    prediction = classifier.classify(_product("블루투스 무선 이어폰", {"연결": "블루투스 5.3"}))
+
+    assert prediction.category == "1"
+    assert prediction.confidence >= 0.9
+
+
+def test_classifier_skips_llm_when_confident_and_falls_back_otherwise():
+    llm = DummyLLMService()
+    stats = CategoryStats()
+    classifier = CategoryClassifier(llm, threshold=0.5, shadow_rate=0.0, stats=stats)
+
+    confident = asyncio.run(classifier.classify(_product("고양이 스크래쳐 골판지")))
+    unknown = asyncio.run(classifier.classify(_product("멀티탭 개별스위치")))
+
+    assert confident.source == "local" and confident.category == "14"
+    assert unknown.source == "llm" and unknown.category == "29"
+    assert llm.calls == 1
+    snapshot = stats.snapshot()
+    assert snapshot["total"] == 2
+    assert snapshot["llm_avoided_rate"] == 0.5
+
+
+def test_invalid_or_failed_llm_label_falls_back_to_local_prediction():
+    stats = CategoryStats()
+    product = _product("멀티탭 개별스위치")
+
+    for answer in ('{"category": "999"}', "카테고리를 모르겠습니다"):
+        classifier = CategoryClassifier(DummyLLMService(answer), threshold=1.1, shadow_rate=0.0, stats=stats)
+        local = classifier.local.classify(product)
+
+        prediction = asyncio.run(classifier.classify(product))
+
+        assert prediction == local and prediction.source == "local"
+
+    snapshot = stats.snapshot()
+    assert snapshot["llm_calls"] == 2
+    assert snapshot["llm_fallbacks"] == 2
+    # 유효한 LLM 라벨이 없었으므로 정확도 비교에 들어가지 않는다
+    assert stats.compared == 0
@@ -0,0 +1,50 @@
+import asyncio
+import contextvars
+
+from app.services.deferred import DeferredQueue
+
+_JOB = contextvars.ContextVar("job", default="")
+
+
+def test_each_job_runs_with_the_context_it_was_submitted_from():
+    queue = DeferredQueue(workers=1)
+    seen: list[str] = []
+
+    async def job():
+        seen.append(_JOB.get())
+
+    async def main():
+        for job_id in ("a", "b", "c"):
+            token = _JOB.set(job_id)
+            queue.submit(f"write:{job_id}", job, job_id=job_id)
+            _JOB.reset(token)
+        await queue.join()
+
+    asyncio.run(main())
+
+    assert seen == ["a", "b", "c"]
+
+
+def test_full_queue_rejects_and_shutdown_reports_unfinished_jobs(monkeypatch):
+    from app.services import deferred
+
+    queue = DeferredQueue(workers=1, max_size=1)
+    lost: list[str] = []
+    monkeypatch.setattr(deferred, "log_nowait", lambda **kwargs: lost.append(kwargs["job_id"]))
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def main():
+        assert queue.submit("write:1", slow, job_id="1")
+        await asyncio.sleep(0)  # 워커가 1번을 꺼내 실행
+        assert queue.submit("write:2", slow, job_id="2")
+        assert not queue.has_room()
+        assert not queue.submit("write:3", slow, job_id="3")
+        return await queue.aclose(timeout=0.05)
+
+    assert asyncio.run(main()) == 2
+    assert sorted(lost) == ["1", "2"]
+    stats = queue.stats()
+    assert stats["rejected"] == 1
+    assert stats["dropped"] == 2
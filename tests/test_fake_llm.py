@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from app.schemas.products import SsadaguProduct
+from app.schemas.relevance import RelevanceBatchOutput
+from app.services.fake_llm import FakeChatModel, FakeLLMError, FakeLLMProfile
+from app.services.llm import LLMService
+from app.services.llm_limiter import reset_controllers
+from app.services.promo import PromoService
+from app.services.relevance import RelevanceService
+
+
+def _fake_llm(**profile) -> LLMService:
+    llm = LLMService(backend="fake")
+    llm.cache = None
+    llm.client = FakeChatModel(FakeLLMProfile(latency_ms=1, latency_sigma=0.0, **profile))
+    return llm
+
+
+def _product(idx: int, title: str) -> SsadaguProduct:
+    return SsadaguProduct(title=title, product_link=f"https://ssadagu.kr/item/{idx}")
+
+
+def test_fake_backend_returns_schema_valid_answers():
+    llm = _fake_llm()
+    products = [_product(0, "무선 청소기 흡입력"), _product(1, "고양이 스크래쳐")]
+
+    results = asyncio.run(RelevanceService(llm_service=llm).evaluate_many("무선 청소기", products))
+    promo = asyncio.run(PromoService(llm_service=llm).generate(products[0], platform="naver_blog"))
+
+    assert results[0]["score"] > results[1]["score"]
+    assert promo["title"] and promo["body"]
+    assert llm.client.stats["calls"] == 2
+
+
+def test_fake_backend_is_deterministic_per_seed():
+    async def answers(seed: int) -> list[str]:
+        llm = _fake_llm(seed=seed)
+        outputs = []
+        for _ in range(2):
+            parsed = await llm.chat_structured(
+                "sys", "키워드: 청소기\n[0]\n- 이름: 무선 청소기", RelevanceBatchOutput, use_cache=False
+            )
+            outputs.append(parsed.model_dump_json())
+        return outputs
+
+    assert asyncio.run(answers(1)) == asyncio.run(answers(1))
+    assert asyncio.run(answers(1)) != asyncio.run(answers(2))
+
+
+def test_fake_backend_injects_rate_limits(monkeypatch):
+    reset_controllers()
+    monkeypatch.setenv("LLM_RATE_LIMIT_RETRIES", "0")
+    llm = _fake_llm(rate_limit_rate=1.0, retry_after=0.0)
+
+    with pytest.raises(FakeLLMError) as excinfo:
+        asyncio.run(llm.chat("sys", "hi"))
+
+    assert excinfo.value.status_code == 429
+    assert llm.client.stats["rate_limited"] == 1
+    reset_controllers()
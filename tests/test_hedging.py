@@ -0,0 +1,84 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.hedging import HedgeTracker
+from app.services.llm import _hedged
+
+
+def _slow_then_fast():
+    calls = {"n": 0}
+
+    async def invoke(on_admitted=None):
+        calls["n"] += 1
+        on_admitted()
+        if calls["n"] == 1:
+            await asyncio.sleep(1.0)
+            return "slow"
+        await asyncio.sleep(0.01)
+        return "fast"
+
+    return invoke, calls
+
+
+def test_hedge_fires_after_p90_and_takes_first_answer():
+    tracker = HedgeTracker(max_rate=1.0, min_samples=1)
+    tracker.observe(0.02)
+    invoke, calls = _slow_then_fast()
+
+    result = asyncio.run(asyncio.wait_for(_hedged(invoke, tracker), timeout=0.5))
+
+    assert result == "fast"
+    assert calls["n"] == 2
+    assert tracker.stats()["hedged"] == 1
+    assert tracker.stats()["hedge_wins"] == 1
+
+
+def test_hedge_rate_cap_and_cold_start_skip_duplicates():
+    capped = HedgeTracker(max_rate=0.0, min_samples=1)
+    capped.observe(0.001)
+    cold = HedgeTracker(max_rate=1.0, min_samples=5)
+
+    for tracker in (capped, cold):
+        calls = {"n": 0}
+
+        async def invoke(on_admitted=None):
+            calls["n"] += 1
+            on_admitted()
+            await asyncio.sleep(0.05)
+            return "only"
+
+        assert asyncio.run(_hedged(invoke, tracker)) == "only"
+        assert calls["n"] == 1
+        assert tracker.stats()["hedged"] == 0
+
+
+def test_try_hedge_marks_its_own_call_not_the_latest():
+    tracker = HedgeTracker(max_rate=0.5, min_samples=1)
+    _, first = tracker.start_call()
+    _, second = tracker.start_call()
+
+    assert tracker.try_hedge(first)
+    assert first.hedged and not second.hedged
+    # 최근 2건 중 1건이 헤지되어 상한(0.5)에 닿았다
+    assert not tracker.try_hedge(second)
+
+
+def test_latency_excludes_admission_wait_and_busy_controller_skips_hedge():
+    tracker = HedgeTracker(max_rate=1.0, min_samples=1)
+    tracker.observe(0.01)
+    calls = {"n": 0}
+
+    async def invoke(on_admitted=None):
+        calls["n"] += 1
+        # 승인 제어에서 오래 기다린 뒤 승인된 호출
+        await asyncio.sleep(0.2)
+        on_admitted()
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    busy = SimpleNamespace(waiting=3)
+    assert asyncio.run(_hedged(invoke, tracker, busy)) == "ok"
+
+    assert calls["n"] == 1
+    assert tracker.stats()["hedged"] == 0
+    assert max(tracker._samples) < 0.15
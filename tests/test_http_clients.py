@@ -0,0 +1,26 @@
+import asyncio
+
+from app.http_clients import HttpClientRegistry
+
+
+def test_registry_reuses_one_client_per_origin_and_loop():
+    registry = HttpClientRegistry()
+
+    async def run():
+        a = registry.for_url("https://log.example.com/api/content")
+        b = registry.for_url("https://LOG.example.com/api/content/link")
+        c = registry.for_url("https://other.example.com/api/trend")
+        assert a is b
+        assert a is not c
+        assert a.timeout.connect is not None and a.timeout.read is not None
+        await registry.aclose()
+        assert a.is_closed and c.is_closed
+        return a
+
+    first = asyncio.run(run())
+
+    async def again():
+        return registry.for_url("https://log.example.com/api/content")
+
+    assert asyncio.run(again()) is not first
+    assert registry.stats()["created"] == 3
@@ -1,8 +1,15 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints.llm import get_llm_service
 from app.main import app
-from app.services.llm import LLMService
+from app.schemas.relevance import RelevanceBatchOutput, RelevanceOutput
+from app.services.llm import LLMOutputError, LLMService, _response_format
+from app.services.singleflight import LLM_SINGLE_FLIGHT
 
 
 class DummyLLMService(LLMService):
@@ -55,3 +62,104 @@ def test_llm_chat_uses_setting_fallbacks():
     data = resp.json()
     assert data["answer"] == "[dummy]sys-from-setting|hello"
     app.dependency_overrides.clear()
+
+
+class SequenceLLMService(LLMService):
+    def __init__(self, answers):
+        super().__init__(api_key="test")
+        self.answers = list(answers)
+        self.kwargs = []
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        self.kwargs.append(kwargs)
+        return self.answers.pop(0)
+
+
+def test_chat_structured_retries_once_on_invalid_output():
+    llm = SequenceLLMService(['{"reason": "점수 누락"}', '{"score": 0.4, "reason": "ok"}'])
+
+    parsed = asyncio.run(llm.chat_structured("sys", "hi", RelevanceOutput))
+
+    assert parsed.score == 0.4
+    assert [kw["use_cache"] for kw in llm.kwargs] == [True, False]
+    assert all(kw["response_schema"] is RelevanceOutput for kw in llm.kwargs)
+
+
+def test_chat_structured_raises_with_raw_after_attempts():
+    llm = SequenceLLMService(["그냥 텍스트", "또 텍스트"])
+
+    with pytest.raises(LLMOutputError) as excinfo:
+        asyncio.run(llm.chat_structured("sys", "hi", RelevanceOutput))
+
+    assert excinfo.value.raw == "또 텍스트"
+
+
+def test_response_format_is_strict_json_schema():
+    fmt = _response_format(RelevanceBatchOutput)
+    schema = fmt["json_schema"]["schema"]
+    item = schema["$defs"]["RelevanceItemOutput"]
+
+    assert fmt["type"] == "json_schema" and fmt["json_schema"]["strict"] is True
+    assert schema["additionalProperties"] is False
+    assert sorted(item["required"]) == ["index", "reason", "score"]
+    assert "default" not in item["properties"]["reason"]
+
+
+class StreamingLLMService(LLMService):
+    async def astream(self, system_prompt: str, user_input: str, **kwargs):  # type: ignore[override]
+        for token in ['```json\n{"title": ', '"제목"}', "\n```"]:
+            yield token
+
+
+def test_llm_chat_stream_emits_tokens_then_done():
+    app.dependency_overrides[get_llm_service] = lambda: StreamingLLMService(api_key="test")
+    client = TestClient(app)
+
+    resp = client.post(
+        "/api/llm/chat/stream",
+        json={"system_prompt": "sys", "user_input": "hi", "repair_json": True},
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [block for block in resp.text.split("\n\n") if block]
+    assert [e.splitlines()[0] for e in events] == ["event: token"] * 3 + ["event: done"]
+    done = json.loads(events[-1].splitlines()[1].removeprefix("data: "))
+    assert json.loads(done["answer"]) == {"title": "제목"}
+    assert done["ttft_ms"] is not None
+    app.dependency_overrides.clear()
+
+
+class SlowClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return SimpleNamespace(content=f"answer-{self.calls}")
+
+
+def test_identical_inflight_requests_share_one_call():
+    service = LLMService(api_key="test")
+    service.cache = None
+    service.client = SlowClient()
+    before = LLM_SINGLE_FLIGHT.stats()["coalesced"]
+
+    async def run():
+        return await asyncio.gather(
+            service.chat("sys", "같은 키워드"),
+            service.chat("sys", "같은 키워드"),
+            service.chat("sys", "같은 키워드"),
+            service.chat("sys", "다른 키워드"),
+        )
+
+    answers = asyncio.run(run())
+
+    assert answers[0] == answers[1] == answers[2]
+    assert service.client.calls == 2
+    assert LLM_SINGLE_FLIGHT.stats()["coalesced"] - before == 2
+
+    resp = TestClient(app).get("/api/llm/metrics")
+    assert resp.status_code == 200
+    assert resp.json()["single_flight"]["coalesced"] >= 2
@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.llm import LLMService
+from app.services.llm_cache import LLMResponseCache, make_cache_key
+
+
+class CountingClient:
+    def __init__(self, answer: str = '{"ok": true}'):
+        self.answer = answer
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=self.answer)
+
+
+def test_cache_key_depends_on_messages_and_params():
+    base = make_cache_key(system_prompt="sys", user_input="hi", model="m", temperature=0.5)
+
+    assert base == make_cache_key(system_prompt="sys", user_input="hi", model="m", temperature=0.5)
+    assert base != make_cache_key(system_prompt="sys", user_input="hi!", model="m", temperature=0.5)
+    assert base != make_cache_key(system_prompt="sys", user_input="hi", model="m", temperature=0.1)
+
+
+def test_memory_cache_ttl_and_size_bound(monkeypatch):
+    cache = LLMResponseCache(ttl=10, max_entries=2)
+    now = [1000.0]
+    monkeypatch.setattr("app.services.llm_cache.time.time", lambda: now[0])
+
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.set("c", "C")
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+
+    now[0] += 11
+    assert cache.get("c") is None
+
+
+def test_sqlite_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    LLMResponseCache(path=path, ttl=0).set("k", "v")
+
+    assert LLMResponseCache(path=path, ttl=0).get("k") == "v"
+
+
+def test_llm_service_returns_cached_answer_without_calling_model():
+    service = LLMService(api_key="test", cache=LLMResponseCache(ttl=0))
+    service.client = CountingClient()
+
+    first = asyncio.run(service.chat("sys", "hi"))
+    second = asyncio.run(service.chat("sys", "hi"))
+    asyncio.run(service.chat("sys", "hi", use_cache=False))
+
+    assert first == second == '{"ok": true}'
+    assert service.client.calls == 2
+    assert service.cache.stats()["hits"] == 1
+
+
+def test_llm_service_does_not_share_cached_answers_between_api_keys():
+    cache = LLMResponseCache(ttl=0)
+    first = LLMService(api_key="tenant-a", cache=cache)
+    second = LLMService(api_key="tenant-b", cache=cache)
+    first.client = CountingClient("A")
+    second.client = CountingClient("B")
+
+    assert asyncio.run(first.chat("sys", "hi")) == "A"
+    assert asyncio.run(second.chat("sys", "hi")) == "B"
+    assert asyncio.run(first.chat("sys", "hi")) == "A"
+    assert cache.stats()["hits"] == 1
+
+
+def test_sqlite_cache_counts_rows_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm_cache.sqlite3")
+    now = [1000.0]
+    monkeypatch.setattr("app.services.llm_cache.time.time", lambda: now[0])
+    cache = LLMResponseCache(path=path, ttl=0, max_entries=2)
+
+    cache.set("a", "A")
+    now[0] += 1
+    cache.set("b", "B")
+    now[0] += 1
+    # 모아 둔 접근 시각이 제거 전에 반영되어 a 대신 b가 빠진다
+    assert asyncio.run(cache.aget("a")) == "A"
+    now[0] += 1
+    asyncio.run(cache.aset("c", "C"))
+
+    assert cache.stats()["size"] == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert LLMResponseCache(path=path, ttl=0).stats()["size"] == 2
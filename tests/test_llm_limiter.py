@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.llm import LLMService
+from app.services.llm_limiter import AdmissionController, rate_limit_retry_after, reset_controllers
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, retry_after: str):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after": retry_after})
+
+
+def test_controller_caps_concurrency():
+    controller = AdmissionController(max_concurrency=2)
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with controller.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+
+    assert peak == 2
+    assert controller.stats()["admitted"] == 6
+
+
+def test_rate_limit_halves_limit_and_recovers_additively():
+    controller = AdmissionController(max_concurrency=8)
+
+    controller.on_rate_limited(0)
+    controller.on_rate_limited(0)  # 같은 폭주 구간의 429는 한 번만 반감
+    assert controller.limit == 4
+
+    for _ in range(4):
+        controller.on_success()
+    assert 4.9 < controller.limit < 5.0
+
+
+def test_retry_after_header_parsing():
+    assert rate_limit_retry_after(RateLimitError("2")) == 2.0
+    assert rate_limit_retry_after(ValueError("boom")) is None
+
+
+def test_llm_service_retries_after_429(monkeypatch):
+    reset_controllers()
+    monkeypatch.setenv("LLM_RATE_LIMIT_RETRIES", "2")
+
+    class FlakyClient:
+        calls = 0
+
+        async def ainvoke(self, messages):
+            self.calls += 1
+            if self.calls == 1:
+                raise RateLimitError("0.01")
+            return SimpleNamespace(content="ok")
+
+    service = LLMService(api_key="test")
+    service.client = FlakyClient()
+
+    assert asyncio.run(service.chat("sys", "hi")) == "ok"
+    assert service.client.calls == 2
+    reset_controllers()
+
+
+def test_low_priority_calls_use_only_their_share():
+    from app.services.llm_limiter import low_priority
+
+    controller = AdmissionController(max_concurrency=4, low_priority_share=0.5)
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        with low_priority():
+            async with controller.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+
+    assert peak == 2
+    assert controller.stats()["low_priority_in_flight"] == 0
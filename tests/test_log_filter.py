@@ -0,0 +1,58 @@
+import time
+
+from app import config
+from app.log_filter import LogFilter
+
+
+def test_debug_and_below_threshold_stay_local(monkeypatch):
+    monkeypatch.setenv(config.LOG_REMOTE_LEVELS_KEY, "naver_blog=WARN")
+    config.reload_settings()
+    log_filter = LogFilter()
+
+    assert log_filter.allow("relevance", "DEBUG", "시작") == (False, 0)
+    assert log_filter.allow("naver_blog", "INFO", "글쓰기 페이지 이동") == (False, 0)
+    assert log_filter.allow("naver_blog", "WARN", "제목 입력 실패")[0] is True
+    assert log_filter.allow("relevance", "INFO", "완료")[0] is True
+    assert log_filter.stats()["local_only"] == 2
+
+
+def test_repeated_messages_are_sampled_but_errors_always_pass(monkeypatch):
+    monkeypatch.setenv(config.LOG_SAMPLE_BURST_KEY, "2")
+    monkeypatch.setenv(config.LOG_SAMPLE_WINDOW_KEY, "60")
+    config.reload_settings()
+    log_filter = LogFilter()
+
+    sent = [log_filter.allow("relevance", "INFO", "평가 완료")[0] for _ in range(5)]
+
+    assert sent == [True, True, False, False, False]
+    assert log_filter.allow("relevance", "ERROR", "평가 완료") == (True, 0)
+    assert log_filter.allow("relevance", "INFO", "평가 완료", notifiable=True) == (True, 0)
+    assert log_filter.stats()["sampled_out"] == 3
+
+
+def test_suppressed_count_is_reported_when_window_rolls(monkeypatch):
+    monkeypatch.setenv(config.LOG_SAMPLE_BURST_KEY, "1")
+    monkeypatch.setenv(config.LOG_SAMPLE_WINDOW_KEY, "0.2")
+    config.reload_settings()
+    log_filter = LogFilter()
+
+    log_filter.allow("write", "INFO", "연관도 평가")
+    log_filter.allow("write", "INFO", "연관도 평가")
+    time.sleep(0.25)
+
+    assert log_filter.allow("write", "INFO", "연관도 평가") == (True, 1)
+
+
+def test_same_message_from_different_jobs_is_not_sampled_away(monkeypatch):
+    monkeypatch.setenv(config.LOG_SAMPLE_BURST_KEY, "1")
+    monkeypatch.setenv(config.LOG_SAMPLE_WINDOW_KEY, "60")
+    config.reload_settings()
+    log_filter = LogFilter()
+
+    kept = [
+        log_filter.allow("write", "INFO", "연관도 평가", job_id=f"job-{i}")[0] for i in range(5)
+    ]
+
+    assert kept == [True] * 5
+    # 같은 작업 안에서 반복되는 메시지만 줄인다
+    assert log_filter.allow("write", "INFO", "연관도 평가", job_id="job-0") == (False, 0)
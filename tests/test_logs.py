@@ -19,6 +19,7 @@ def test_send_log_posts_payload_and_prints(capsys, monkeypatch):
     client = httpx.Client(transport=transport, base_url="https://log.example.com")
 
     monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://log.example.com/ingest")
+    config.reload_settings()
 
     response = logs.send_log(
         message="hello log",
@@ -40,3 +41,106 @@ def test_send_log_posts_payload_and_prints(capsys, monkeypatch):
     captured = capsys.readouterr().out
     assert "[LOG][WARN] hello log" in captured
     assert "meta={'foo': 'bar'}" in captured
+
+
+def test_async_send_log_is_queued_and_shipped_in_batches(monkeypatch):
+    import asyncio
+
+    from app.log_shipper import LogShipper
+
+    requests: list[dict] = []
+
+    def mock_send(request: httpx.Request) -> httpx.Response:
+        requests.append({"url": str(request.url), "body": json.loads(request.content.decode())})
+        return httpx.Response(200, json={"ok": True})
+
+    shipper = LogShipper(
+        batch_size=3,
+        flush_interval=0.05,
+        batch_endpoint="https://log.example.com/ingest/batch",
+        transport=httpx.MockTransport(mock_send),
+    )
+    monkeypatch.setattr(logs, "LOG_SHIPPER", shipper)
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://log.example.com/ingest")
+    config.reload_settings()
+
+    async def run():
+        for i in range(4):
+            assert await logs.async_send_log(message=f"line-{i}") is None
+        await asyncio.sleep(0.2)
+        await shipper.aclose()
+
+    asyncio.run(run())
+
+    assert [len(r["body"]) for r in requests] == [3, 1]
+    assert requests[0]["url"] == "https://log.example.com/ingest/batch"
+    assert [p["message"] for r in requests for p in r["body"]] == [f"line-{i}" for i in range(4)]
+    assert shipper.stats()["sent"] == 4
+
+
+def test_log_shipper_drains_queue_when_loop_shuts_down():
+    import asyncio
+
+    from app.log_shipper import LogShipper
+
+    bodies: list[dict] = []
+
+    def mock_send(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content.decode()))
+        return httpx.Response(200)
+
+    shipper = LogShipper(
+        batch_size=100, flush_interval=60, batch_endpoint="", transport=httpx.MockTransport(mock_send)
+    )
+
+    async def run():
+        shipper.enqueue("https://log.example.com/ingest", {"message": "bye"}, timeout=1)
+
+    asyncio.run(run())
+
+    assert bodies == [{"message": "bye"}]
+    assert shipper.stats()["queued"] == 0
+
+
+def test_log_nowait_on_event_loop_enqueues_without_network(monkeypatch):
+    import asyncio
+
+    from app.log_shipper import LogShipper
+
+    shipper = LogShipper(batch_size=100, flush_interval=60, transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    monkeypatch.setattr(logs, "LOG_SHIPPER", shipper)
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://log.example.com/ingest")
+    config.reload_settings()
+
+    def blocking_send(**kwargs):
+        raise AssertionError("이벤트 루프에서 동기 전송이 호출됨")
+
+    monkeypatch.setattr(logs, "send_log", blocking_send)
+
+    async def run():
+        # 코루틴 안에서 부르는 동기 함수 (trends._log_sync와 같은 경우)
+        logs.log_nowait(message="sync caller", logged_process="trends")
+        return shipper.stats()["queued"]
+
+    assert asyncio.run(run()) == 1
+    assert shipper.stats()["sent"] == 1
+
+
+def test_blocking_guard_reports_send_log_on_loop(monkeypatch, caplog):
+    import asyncio
+
+    from app import blocking_guard
+
+    monkeypatch.setenv(config.DEBUG_BLOCKING_GUARD_KEY, "true")
+    monkeypatch.delenv(config.LOG_ENDPOINT_KEY, raising=False)
+    config.reload_settings()
+
+    async def run():
+        logs.send_log(message="blocking")
+
+    with caplog.at_level("WARNING", logger="app.blocking_guard"):
+        asyncio.run(run())
+        logs.send_log(message="outside loop")
+
+    assert blocking_guard.blocking_call_stats()["send_log"] == 1
+    assert "블로킹 호출: send_log" in caplog.text
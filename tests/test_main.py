@@ -17,3 +17,11 @@ def test_health_check():
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_process_stats_are_separate_from_llm_metrics():
+    stats = client.get("/stats").json()
+    llm_metrics = client.get("/api/llm/metrics").json()
+
+    assert {"log_shipper", "spool", "http_clients", "deferred", "background_tasks"} <= set(stats)
+    assert "spool" not in llm_metrics and "single_flight" in llm_metrics
@@ -0,0 +1,64 @@
+from app.schemas.products import SsadaguProduct
+from app.services import product_context
+from app.services.product_context import ProductContextCache, build_product_context
+
+
+def _product(specs: dict[str, str]) -> SsadaguProduct:
+    return SsadaguProduct(
+        title="무선 청소기",
+        product_link="https://ssadagu.kr/item/1",
+        detail_specs=specs,
+    )
+
+
+def test_budget_keeps_informative_specs_in_original_order():
+    product = _product(
+        {
+            "배송 안내": "도서산간 지역은 추가 배송비가 발생합니다. " * 20,
+            "브랜드": "다이슨",
+            "반품/교환": "수령 후 7일 이내 가능합니다. " * 20,
+            "색상": "블랙",
+            "흡입력": "150AW",
+        }
+    )
+
+    context = build_product_context(product, budget=30)
+
+    assert [k for k, _ in context.specs] == ["브랜드", "색상", "흡입력"]
+    assert context.omitted == 2
+    assert context.tokens <= 30
+    assert context.spec_lines().endswith("- (그 외 2개 항목 생략)")
+
+
+def test_long_values_are_truncated_and_budget_zero_keeps_all():
+    product = _product({"설명": "아주 긴 설명 " * 200, "브랜드": "다이슨"})
+
+    trimmed = build_product_context(product, budget=500)
+    full = build_product_context(product, budget=0)
+
+    assert dict(trimmed.specs)["설명"].endswith("…")
+    assert len(full.specs) == 2 and dict(full.specs)["설명"] == product.detail_specs["설명"]
+
+
+def test_context_cache_formats_product_once():
+    cache = ProductContextCache()
+    product = _product({"브랜드": "다이슨"})
+
+    first = cache.get(product, budget=100)
+    second = cache.get(product, budget=100)
+
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get(_product({}), budget=100).spec_lines("  ") == "  - 없음"
+
+
+def test_missing_tokenizer_warns_once_and_uses_byte_estimate(monkeypatch, caplog):
+    monkeypatch.setattr(product_context, "tiktoken", None)
+    monkeypatch.setattr(product_context, "_encoder", None)
+    monkeypatch.setattr(product_context, "_encoder_failed", False)
+
+    with caplog.at_level("WARNING", logger="app.services.product_context"):
+        assert product_context.count_tokens("가나다") == 3
+        assert product_context.count_tokens("abc") == 1
+
+    assert len(caplog.records) == 1
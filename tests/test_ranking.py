@@ -0,0 +1,39 @@
+from app.schemas.products import SsadaguProduct
+from app.services.ranking import rank_products, tokenize
+from benchmarks.prerank_eval import evaluate, load_cases
+
+
+def _product(title: str, specs: dict[str, str] | None = None) -> SsadaguProduct:
+    return SsadaguProduct(
+        title=title,
+        product_link=f"https://ssadagu.kr/item/{abs(hash(title))}",
+        detail_specs=specs or {},
+    )
+
+
+def test_tokenize_includes_words_and_char_ngrams():
+    terms = tokenize("무선 이어폰!")
+
+    assert "무선" in terms
+    assert "이어폰" in terms
+    assert "이어" in terms and "어폰" in terms
+
+
+def test_rank_products_puts_lexical_match_first():
+    products = [
+        _product("USB 충전 케이블"),
+        _product("블루투스 무선 이어폰", {"연결방식": "블루투스"}),
+        _product("스마트폰 거치대"),
+    ]
+
+    ranked = rank_products("무선 이어폰", products)
+
+    assert ranked[0][0].title == "블루투스 무선 이어폰"
+    assert ranked[0][1] > ranked[-1][1]
+
+
+def test_offline_eval_set_ranking_beats_random():
+    result = evaluate(load_cases())
+
+    assert result["ranked_hit_at_1"] > result["random_hit_at_1"]
+    assert result["ranked_llm_calls"] < result["random_llm_calls"]
@@ -0,0 +1,69 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints.relevance import get_relevance_service
+from app.main import app
+from app.schemas.products import SsadaguProduct
+from app.services.llm import LLMService
+from app.services.relevance import RelevanceService
+
+
+class DummyBatchLLMService(LLMService):
+    def __init__(self):
+        super().__init__(api_key="test")
+        self.calls = 0
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        self.calls += 1
+        return (
+            '{"results": [{"index": 1, "score": 0.9, "reason": "딱 맞음"},'
+            ' {"index": 0, "score": 1.7, "reason": "과대평가"}]}'
+        )
+
+
+def _product(idx: int) -> SsadaguProduct:
+    return SsadaguProduct(
+        title=f"상품-{idx}",
+        price=1000.0 * (idx + 1),
+        product_link=f"https://ssadagu.kr/item/{idx}",
+        detail_specs={"색상": "블랙"},
+    )
+
+
+def test_evaluate_many_scores_all_products_in_one_call():
+    llm = DummyBatchLLMService()
+    service = RelevanceService(llm_service=llm)
+
+    results = asyncio.run(service.evaluate_many("키워드", [_product(0), _product(1), _product(2)]))
+
+    assert llm.calls == 1
+    assert [r["product_title"] for r in results] == ["상품-0", "상품-1", "상품-2"]
+    assert results[0]["score"] == 1.0
+    assert results[1]["score"] == 0.9
+    assert results[2]["score"] == 0.0
+
+
+def test_relevance_batch_endpoint_returns_results_in_order():
+    app.dependency_overrides[get_relevance_service] = lambda: RelevanceService(
+        llm_service=DummyBatchLLMService()
+    )
+    client = TestClient(app)
+
+    resp = client.post(
+        "/api/relevance/ssadagu/batch",
+        json={
+            "keyword": "키워드",
+            "products": [
+                {"title": "a", "product_link": "https://ssadagu.kr/item/a"},
+                {"title": "b", "product_link": "https://ssadagu.kr/item/b"},
+            ],
+        },
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [r["product_title"] for r in data["results"]] == ["a", "b"]
+    assert data["results"][1]["reason"] == "딱 맞음"
+    app.dependency_overrides.clear()
+
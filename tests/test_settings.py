@@ -0,0 +1,55 @@
+import pytest
+
+from app import config
+
+
+def test_settings_precompute_derived_urls_and_headers(monkeypatch):
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://log.example.com/api/log/")
+    monkeypatch.setenv(config.X_INTERNAL_TOKEN_KEY, "secret")
+    monkeypatch.delenv(config.LOG_TREND_ENDPOINT_KEY, raising=False)
+    monkeypatch.delenv(config.LOG_CONTENT_LINK_ENDPOINT_KEY, raising=False)
+
+    settings = config.reload_settings()
+
+    assert config.get_settings() is settings
+    assert settings.require_log_endpoint() == "https://log.example.com/api/log"
+    assert settings.trend_url() == "https://log.example.com/api/trend"
+    assert settings.content_link_url() == "https://log.example.com/api/content/link"
+    assert settings.content_url() == "https://log.example.com/api/content"
+    assert settings.redirect_url("j1") == "https://log.example.com/api/link?jobId=j1"
+    assert dict(settings.internal_headers) == {config.INTERNAL_TOKEN_HEADER: "secret"}
+    with pytest.raises(TypeError):
+        settings.internal_headers["X-Other"] = "1"  # type: ignore[index]
+
+
+def test_snapshot_only_changes_on_explicit_reload(monkeypatch):
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://a.example.com/ingest")
+    first = config.reload_settings()
+
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "https://b.example.com/ingest")
+    assert config.get_settings() is first
+
+    monkeypatch.setenv(config.LOG_TIMEOUT_KEY, "slow")
+    with pytest.raises(ValueError):
+        config.reload_settings()
+    # 검증에 실패하면 기존 스냅샷을 유지한다
+    assert config.get_settings() is first
+
+    monkeypatch.setenv(config.LOG_TIMEOUT_KEY, "2.5")
+    second = config.reload_settings()
+    assert second.callback_origin == "https://b.example.com"
+    assert second.log_timeout == 2.5
+
+
+def test_missing_log_endpoint_fails_only_where_needed(monkeypatch):
+    monkeypatch.delenv(config.LOG_ENDPOINT_KEY, raising=False)
+    monkeypatch.delenv(config.LOG_TREND_ENDPOINT_KEY, raising=False)
+
+    settings = config.reload_settings()
+
+    assert settings.log_endpoint is None
+    with pytest.raises(ValueError):
+        settings.redirect_url("j1")
+    monkeypatch.setenv(config.LOG_ENDPOINT_KEY, "log.example.com/ingest")
+    with pytest.raises(ValueError):
+        config.reload_settings()
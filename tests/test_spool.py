@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.spool import OutboundSpool, SpoolFull
+
+
+def test_spool_survives_restart_and_replays(tmp_path):
+    path = str(tmp_path / "spool.jsonl")
+    down = OutboundSpool(path, base_backoff=60, transport=httpx.MockTransport(lambda r: httpx.Response(503)))
+
+    async def submit():
+        # asubmit은 기록 스레드가 fsync한 뒤에 반환한다
+        await down.asubmit("POST", "https://cb.example.com/api/content", {"jobId": "j1"}, key="j1")
+        with open(path, encoding="utf-8") as fh:
+            assert '"op": "put"' in fh.read()
+        await asyncio.sleep(0.05)
+        await down.aclose(timeout=0)
+
+    asyncio.run(submit())
+    assert down.stats()["pending"] == 1
+    assert down.stats()["retried"] == 1
+
+    received: list[bytes] = []
+
+    def ok(request: httpx.Request) -> httpx.Response:
+        received.append(request.content)
+        return httpx.Response(200)
+
+    restarted = OutboundSpool(path, transport=httpx.MockTransport(ok))
+
+    async def replay():
+        await asyncio.to_thread(restarted.load)
+        restarted.start()
+        drained = await restarted.drain(timeout=1)
+        await restarted.aclose()
+        return drained
+
+    assert asyncio.run(replay()) is True
+    assert received == [b'{"jobId":"j1"}']
+    assert OutboundSpool(path).pending == 0
+
+
+def test_spool_keeps_order_within_a_key_and_drops_rejected():
+    calls: list[str] = []
+    failures = {"content": 1}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        calls.append(name)
+        if name == "bad":
+            return httpx.Response(400)
+        if failures.get(name):
+            failures[name] -= 1
+            return httpx.Response(502)
+        return httpx.Response(200)
+
+    spool = OutboundSpool(base_backoff=0.02, transport=httpx.MockTransport(handler))
+
+    async def run():
+        spool.submit("POST", "https://cb.example.com/api/content", {}, key="job")
+        spool.submit("PATCH", "https://cb.example.com/api/link", {}, key="job")
+        spool.submit("POST", "https://cb.example.com/api/bad", {}, key="other")
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+
+    job_calls = [c for c in calls if c != "bad"]
+    assert job_calls == ["content", "content", "link"]
+    assert spool.stats()["pending"] == 0
+    assert spool.stats()["dropped"] == 1
+
+
+def test_spool_evicts_whole_log_keys_then_rejects_new_work():
+    # 항목 하나는 17바이트라 두 개까지 들어간다. 재전송기가 돌지 않도록 루프 밖에서 넣는다
+    spool = OutboundSpool(max_bytes=40)
+    spool.submit("POST", "https://log.example.com", {"m": "aaaaaaaa"}, key="log:j1", kind="log")
+    spool.submit("POST", "https://log.example.com", {"m": "bbbbbbbb"}, key="log:j1", kind="log")
+
+    # 로그 키 j1을 통째로 버려 자리를 만든다 (키 중간의 항목만 빠지지 않는다)
+    spool.submit("POST", "https://cb.example.com/api/content", {"m": "cccccccc"}, key="j2")
+    spool.submit("PATCH", "https://cb.example.com/api/link", {"m": "dddddddd"}, key="j2")
+    assert list(spool._by_key) == ["j2"]
+    assert spool.stats()["dropped"] == 2
+
+    # 버릴 로그가 없으면 콜백을 빼지 않고 새 항목을 거절한다
+    with pytest.raises(SpoolFull):
+        spool.submit("POST", "https://cb.example.com/api/content", {"m": "eeeeeeee"}, key="j3")
+    assert len(spool._by_key["j2"]) == 2
+    assert spool.stats()["rejected"] == 1
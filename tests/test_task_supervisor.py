@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.task_supervisor import TaskRejected, TaskSupervisor
+
+
+def test_supervisor_limits_concurrency_per_category_and_records_failures():
+    supervisor = TaskSupervisor(limit=2, limits={"crawler": 1}, max_pending=0)
+    peak = {"write": 0, "crawler": 0}
+    running = {"write": 0, "crawler": 0}
+
+    async def job(category: str, fail: bool = False) -> None:
+        running[category] += 1
+        peak[category] = max(peak[category], running[category])
+        await asyncio.sleep(0.01)
+        running[category] -= 1
+        if fail:
+            raise RuntimeError("boom")
+
+    async def main():
+        for i in range(5):
+            supervisor.spawn("write", job("write", fail=i == 0))
+        for _ in range(3):
+            supervisor.spawn("crawler", job("crawler"))
+        await supervisor.join()
+
+    asyncio.run(main())
+
+    assert peak == {"write": 2, "crawler": 1}
+    stats = supervisor.stats()
+    assert stats["active"] == 0
+    assert stats["categories"]["write"]["completed"] == 4
+    assert stats["categories"]["write"]["failed"] == 1
+    assert stats["categories"]["crawler"]["limit"] == 1
+    assert stats["recent_failures"][0]["error"] == "RuntimeError: boom"
+
+
+def test_supervisor_rejects_over_pending_limit_and_cancels_on_shutdown():
+    supervisor = TaskSupervisor(limit=1, max_pending=2)
+    finished: list[str] = []
+
+    async def job(name: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        finished.append(name)
+
+    async def main():
+        supervisor.spawn("upload", job("slow", 10))
+        supervisor.spawn("upload", job("waiting", 0))
+        with pytest.raises(TaskRejected):
+            supervisor.spawn("upload", job("rejected", 0))
+        return await supervisor.aclose(timeout=0.05)
+
+    assert asyncio.run(main()) == 2
+    assert finished == []
+    counters = supervisor.stats()["categories"]["upload"]
+    assert counters["rejected"] == 1
+    assert counters["cancelled"] == 2
+    assert counters["pending"] == 0
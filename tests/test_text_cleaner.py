@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from benchmarks.json_extract import load_corpus
+from app.services.text_cleaner import JsonExtractor, extract_json, try_repair_json
+
+CORPUS = load_corpus()
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[c["name"] for c in CORPUS])
+def test_corpus_answers_are_extracted(case):
+    repaired = try_repair_json(case["raw"])
+
+    assert (json.loads(repaired) if repaired is not None else None) == case["expected"]
+
+
+@pytest.mark.parametrize("size", [1, 3, 16])
+def test_incremental_feed_matches_single_pass(size):
+    for case in CORPUS:
+        extractor = JsonExtractor()
+        for start in range(0, len(case["raw"]), size):
+            extractor.feed(case["raw"][start : start + size])
+
+        assert extractor.result() == extract_json(case["raw"]), case["name"]
+
+
+def test_feed_reports_completion_before_stream_ends():
+    extractor = JsonExtractor()
+
+    assert extractor.feed('답변: {"title": "a') is False
+    assert extractor.feed('\\"b"}') is True
+    assert extractor.feed(" 이후 설명은 무시") is True
+    assert json.loads(extractor.result()) == {"title": 'a"b'}
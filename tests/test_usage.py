@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.services.llm import LLMService
+from app.services.llm_cache import LLMResponseCache
+from app.services.usage import USAGE_STATS, track_usage, usage_meta
+
+
+class UsageClient:
+    async def ainvoke(self, messages):
+        return SimpleNamespace(
+            content='{"ok": true}',
+            usage_metadata={
+                "input_tokens": 100,
+                "output_tokens": 20,
+                "input_token_details": {"cache_read": 64},
+            },
+        )
+
+
+def test_usage_is_totaled_per_job_and_stage():
+    USAGE_STATS.reset()
+    service = LLMService(api_key="test", cache=LLMResponseCache(ttl=0))
+    service.client = UsageClient()
+
+    async def run():
+        await service.chat("sys", "a", stage="relevance")
+        await service.chat("sys", "b", stage="relevance")
+        await service.chat("sys", "a", stage="relevance")  # 응답 캐시 적중
+        await service.chat("sys", "c", stage="promo")
+
+    with track_usage("job-1", user_id=7) as ledger:
+        asyncio.run(run())
+        meta = usage_meta()
+
+    assert ledger.stages["relevance"].as_dict() == {
+        "prompt_tokens": 200,
+        "completion_tokens": 40,
+        "cached_tokens": 128,
+        "calls": 2,
+        "cache_hits": 1,
+        "coalesced": 0,
+        "total_tokens": 240,
+    }
+    assert meta["usage"]["jobId"] == "job-1"
+    assert list(meta["usage"]["stages"]) == ["relevance", "promo"]
+    assert meta["usage"]["total"]["total_tokens"] == 360
+    assert USAGE_STATS.by_user[7].prompt_tokens == 300
+    assert USAGE_STATS.by_job["job-1"].calls == 3
+    assert usage_meta() == {}
+
+
+def test_max_tokens_is_passed_to_client():
+    service = LLMService(api_key="test", max_tokens=256)
+
+    assert service.client.max_tokens == 256
+    assert service._client(model=None, temperature=None, api_key=None, max_tokens=64).max_tokens == 64
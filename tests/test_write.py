@@ -0,0 +1,331 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app import config
+from app.flows import write_graph
+from app.schemas.llm import LlmSetting
+from app.schemas.products import SsadaguProduct
+from app.schemas.upload import UploadChannelSettings
+from app.schemas.write import WriteRequest
+from app.services import write as write_module
+from app.services.deferred import DeferredQueue
+from app.services.keywords import KeywordService
+from app.services.llm import LLMService
+from app.services.promo import PromoService
+from app.services.relevance import RelevanceService
+from app.services.usage import track_usage
+from app.services.write import WriteService
+
+
+class DummyLLMService(LLMService):
+    def __init__(self, answer: str = '{"score": 0.0, "reason": ""}'):
+        super().__init__(api_key="test")
+        self.answer = answer
+        self.calls = 0
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        self.calls += 1
+        return self.answer
+
+
+class SlowRelevanceService(RelevanceService):
+    """상품 이름에 지정된 지연 후 점수를 돌려주는 평가기."""
+
+    def __init__(self, delays: dict[str, float], scores: dict[str, float]):
+        self.delays = delays
+        self.scores = scores
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+
+    async def evaluate(self, keyword, product, **kwargs):  # type: ignore[override]
+        self.started.append(product.title)
+        try:
+            await asyncio.sleep(self.delays[product.title])
+        except asyncio.CancelledError:
+            self.cancelled.append(product.title)
+            raise
+        return {"keyword": keyword, "product_title": product.title, "score": self.scores[product.title], "reason": ""}
+
+
+def _product(name: str) -> SsadaguProduct:
+    return SsadaguProduct(title=name, price=1000.0, product_link=f"https://ssadagu.kr/item/{name}")
+
+
+def _write_service(llm: LLMService, **kwargs) -> WriteService:
+    kwargs.setdefault("relevance", RelevanceService(llm_service=llm))
+    return WriteService(
+        keywords=KeywordService(llm_service=llm),
+        promo=PromoService(llm_service=llm),
+        category_llm=llm,
+        **kwargs,
+    )
+
+
+def test_select_product_batch_mode_picks_best_candidate():
+    llm = DummyLLMService(
+        '{"results": [{"index": 0, "score": 0.4, "reason": ""}, {"index": 1, "score": 0.9, "reason": ""}]}'
+    )
+    service = _write_service(llm, selection_mode="batch")
+
+    product, score = asyncio.run(service.select_product("키워드", [_product("a"), _product("b")]))
+
+    assert product.title == "b"
+    assert score == 0.9
+    assert llm.calls == 1
+
+
+def test_select_product_concurrent_mode_exits_early_and_cancels_rest():
+    relevance = SlowRelevanceService(
+        delays={"fast": 0.01, "slow-1": 5.0, "slow-2": 5.0},
+        scores={"fast": 0.95, "slow-1": 1.0, "slow-2": 1.0},
+    )
+    service = _write_service(DummyLLMService(), relevance=relevance, selection_mode="concurrent")
+
+    product, score = asyncio.run(
+        asyncio.wait_for(
+            service.select_product("키워드", [_product("fast"), _product("slow-1"), _product("slow-2")]),
+            timeout=2,
+        )
+    )
+
+    assert product.title == "fast"
+    assert score == 0.95
+    assert sorted(relevance.cancelled) == ["slow-1", "slow-2"]
+
+
+def test_select_product_concurrent_mode_returns_best_when_none_pass():
+    relevance = SlowRelevanceService(
+        delays={"a": 0.01, "b": 0.02},
+        scores={"a": 0.3, "b": 0.5},
+    )
+    service = _write_service(DummyLLMService(), relevance=relevance, selection_mode="concurrent")
+
+    product, score = asyncio.run(service.select_product("키워드", [_product("a"), _product("b")]))
+
+    assert product.title == "b"
+    assert score == 0.5
+
+
+class RoutingLLMService(LLMService):
+    """시스템 프롬프트 내용으로 응답을 고르는 더미 LLM."""
+
+    def __init__(self, fused_answer: str):
+        super().__init__(api_key="test")
+        self.fused_answer = fused_answer
+        self.prompts: list[str] = []
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        if "category(카테고리 ID)" in system_prompt:
+            self.prompts.append("fused")
+            return self.fused_answer
+        if "카테고리를 선택" in system_prompt:
+            self.prompts.append("category")
+            return '{"category": "29"}'
+        self.prompts.append("promo")
+        return '{"title": "개별 제목", "body": "개별 본문"}'
+
+
+class SlowPromoLLM(RoutingLLMService):
+    """응답 전에 오래 멈춰 투기적 초안이 끝나지 않게 하는 더미 LLM."""
+
+    async def chat(self, system_prompt: str, user_input: str, **kwargs) -> str:  # type: ignore[override]
+        await asyncio.sleep(5)
+        return await super().chat(system_prompt, user_input, **kwargs)
+
+
+def test_generate_post_uses_single_fused_call():
+    llm = RoutingLLMService('{"title": "제목", "body": "본문", "category": "28"}')
+    service = _write_service(llm, fused_generation=True)
+
+    title, body, category = asyncio.run(
+        service.generate_post(_product("멀티탭 개별스위치"), platform="naver_blog")
+    )
+
+    assert (title, body, category) == ("제목", "본문", "28")
+    assert llm.prompts == ["fused"]
+
+
+def test_generate_post_falls_back_to_separate_calls_when_unparsable():
+    llm = RoutingLLMService("죄송합니다")
+    service = _write_service(llm, fused_generation=True)
+
+    title, body, category = asyncio.run(
+        service.generate_post(_product("멀티탭 개별스위치"), platform="naver_blog")
+    )
+
+    assert (title, body, category) == ("개별 제목", "개별 본문", "29")
+    assert llm.prompts[0] == "fused"
+    assert sorted(llm.prompts[1:]) == ["category", "promo"]
+
+
+def test_generate_post_skips_category_llm_when_local_is_confident():
+    llm = RoutingLLMService('{"title": "제목", "body": "본문", "category": "28"}')
+    service = _write_service(llm, fused_generation=True)
+    service.category_classifier.shadow_rate = 0.0
+
+    _, _, category = asyncio.run(
+        service.generate_post(_product("고양이 스크래쳐 골판지"), platform="naver_blog")
+    )
+
+    assert category == "14"
+    assert llm.prompts == ["promo"]
+
+
+def test_speculative_draft_is_reused_when_candidate_passes():
+    llm = RoutingLLMService('{"title": "제목", "body": "본문", "category": "28"}')
+    relevance = SlowRelevanceService(delays={"멀티탭 개별스위치": 0.02}, scores={"멀티탭 개별스위치": 0.9})
+    service = _write_service(llm, relevance=relevance, speculative=True)
+    drafts: dict = {}
+
+    async def run():
+        product, score = await service.select_product(
+            "멀티탭", [_product("멀티탭 개별스위치")], drafts=drafts, platform="naver_blog"
+        )
+        assert llm.prompts == ["fused"]  # 평가가 끝나기 전에 이미 생성 시작
+        return await service.generate_post(product, platform="naver_blog", drafts=drafts)
+
+    assert asyncio.run(run()) == ("제목", "본문", "28")
+    assert llm.prompts == ["fused"]
+    assert drafts == {}
+
+
+def test_speculative_draft_is_cancelled_when_candidate_fails():
+    relevance = SlowRelevanceService(delays={"멀티탭 개별스위치": 0.01}, scores={"멀티탭 개별스위치": 0.1})
+    service = _write_service(SlowPromoLLM("{}"), relevance=relevance, speculative=True)
+    drafts: dict = {}
+
+    _, score = asyncio.run(
+        asyncio.wait_for(
+            service.select_product(
+                "멀티탭", [_product("멀티탭 개별스위치")], drafts=drafts, platform="naver_blog"
+            ),
+            timeout=2,
+        )
+    )
+
+    assert score == 0.1
+    assert drafts == {}
+
+
+def test_deferred_manual_generation_posts_content(monkeypatch):
+    posted: list[dict] = []
+
+    async def fake_post_content(**kwargs):
+        posted.append(kwargs)
+
+    async def fake_log(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(write_module, "_post_content", fake_post_content)
+    monkeypatch.setattr(write_module, "_log", fake_log)
+    settings = config.Settings(
+        log_endpoint="https://example.com/api/logs", callback_origin="https://example.com"
+    )
+    llm = RoutingLLMService('{"title": "제목", "body": "본문", "category": "28"}')
+    queue = DeferredQueue(workers=1)
+    service = _write_service(
+        llm, fused_generation=True, defer_manual=True, deferred_queue=queue, settings=settings
+    )
+    product = _product("멀티탭 개별스위치")
+
+    async def run():
+        with track_usage("job-1") as ledger:
+            assert service.should_defer("MANUAL")
+            assert not service.should_defer("AUTO")
+            service.defer_generation(
+                product,
+                keyword="멀티탭",
+                platform="naver_blog",
+                llm_setting=None,
+                job_id="job-1",
+                user_id=1,
+                upload_channel_id=7,
+                generation_type="MANUAL",
+            )
+            assert posted == []
+        await queue.join()
+        return ledger
+
+    asyncio.run(run())
+
+    assert llm.prompts == ["fused"]
+    assert posted[0]["title"] == "제목"
+    assert posted[0]["generation_type"] == "MANUAL"
+    assert posted[0]["upload_channel_id"] == 7
+    assert posted[0]["settings"] is settings
+    assert queue.stats()["completed"] == 1
+
+
+@pytest.mark.skipif(not write_graph.GRAPH_AVAILABLE, reason="langgraph 미설치")
+def test_write_graph_is_compiled_once_and_runs_with_each_requests_services(monkeypatch):
+    posted: list[dict] = []
+
+    async def fake_post_content(**kwargs):
+        posted.append(kwargs)
+
+    builds: list[dict] = []
+    real_build = write_graph.build_write_graph
+    run_scratch: list[tuple[set, dict]] = []
+
+    def counting_build(**kwargs):
+        builds.append(kwargs)
+        return real_build(**kwargs)
+
+    monkeypatch.setattr(write_graph, "_post_content", fake_post_content)
+    monkeypatch.setattr(write_graph, "build_write_graph", counting_build)
+    monkeypatch.setattr(write_graph, "_compiled", {})
+
+    def service_for(name: str) -> WriteService:
+        product = _product(name)
+
+        async def refine(trends, **kwargs):
+            return {"keyword": trends[0]}
+
+        async def search(keyword, **kwargs):
+            return [product]
+
+        async def select_product(keyword, products, **kwargs):
+            run_scratch.append((kwargs["tried"], kwargs["drafts"]))
+            return products[0], 0.9
+
+        async def generate_post(product, **kwargs):
+            assert kwargs["drafts"] is run_scratch[-1][1]
+            return f"{product.title} 제목", "본문", "28"
+
+        service = _write_service(
+            DummyLLMService(),
+            defer_manual=False,
+            settings=config.Settings(callback_origin="https://cb.example.com"),
+        )
+        service.keywords = SimpleNamespace(refine=refine)
+        service.ssadagu = SimpleNamespace(search=search)
+        service.select_product = select_product  # type: ignore[method-assign]
+        service.generate_post = generate_post  # type: ignore[method-assign]
+        return service
+
+    now = datetime(2025, 1, 1)
+    llm_channel = LlmSetting(
+        id=1, userId=1, name="openai", modelName="gpt-4o-mini", status=True, maxTokens=512,
+        temperature=0.7, prompt=None, apiKey=None, generationType="MANUAL", createdAt=now, updatedAt=now,
+    )
+    channel = UploadChannelSettings(id=7, userId=1, name="NAVER", createdAt=now, updatedAt=now)
+
+    async def run():
+        results = []
+        for name in ("멀티탭", "충전기"):
+            req = WriteRequest(llmChannel=llm_channel, uploadChannels=[channel], keyword=name, jobId=f"job-{name}")
+            results.append(await service_for(name).process(req))
+        return results
+
+    results = asyncio.run(run())
+
+    assert [r.product_title for r in results] == ["멀티탭", "충전기"]
+    assert [p["title"] for p in posted] == ["멀티탭 제목", "충전기 제목"]
+    assert all(p["settings"].callback_origin == "https://cb.example.com" for p in posted)
+    assert len(builds) == 1
+    # 시도 기록/초안은 그래프 상태가 아닌 실행별 WriteRun에 있다
+    assert run_scratch[0][0] is not run_scratch[1][0]
+    assert run_scratch[0][1] is not run_scratch[1][1]